@@ -10,6 +10,14 @@ ILLEGAL_CASTLING_BLACK_IN_CHECK = "r3k2r/8/5N2/8/8/8/8/R3K2R b KQkq - 0 1"
 ILLEGAL_CASTLING_FUNKY = "r3k2r/pppppppp/1N4N1/8/8/1n4n1/PPPPPPPP/R3K2R w KQkq - 0 1"
 PROMOTION_FEN = "8/PP2k1PP/8/8/8/8/pp2K1pp/8 w - - 0 1"
 
+# Standard perft reference positions (castling rights written in KQkq position order)
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+PERFT_ENPASSANT_FEN = "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"
+PERFT_PROMOTION_FEN = "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w --kq - 0 1"
+PERFT_PROMOTION_2_FEN = "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ-- - 1 8"
+PERFT_MIDDLEGAME_FEN = \
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10"
+
 # Illegal positions for testcase use only
 SURROUND_KING_OPPONENT = "8/8/3ppp2/3pKp2/3ppp2/8/8/8 w - - 0 1"
 SURROUND_QUEEN_OPPONENT = "8/8/3ppp2/3pQp2/3ppp2/8/8/8 w - - 0 1"
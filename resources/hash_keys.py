@@ -1,4 +1,798 @@
-import json
+"""
+Generated by src/minimax/zobrist_hashing.py, do not edit by hand
 
-with open("/Users/hongzhiee/Desktop/Projects/chess_engine/resources/hash_keys.json") as f:
-    HASH_KEYS = json.load(f)
+PIECE_SQUARE_KEYS is indexed by piece_index * 64 + square, see
+resources/pieces.py for piece indices and bitboard.coord_to_square for squares.
+CASTLING_KEYS are ordered K, Q, k, q and EN_PASSANT_KEYS by file.
+"""
+
+PIECE_SQUARE_KEYS = (
+    0x630fb766aff6d35f,
+    0x41892689077d804e,
+    0x38099b310fcf4bd8,
+    0x610815ce9d195661,
+    0x113873210bad0f2e,
+    0x3e40fac6b6e4aec5,
+    0x3a7b72ac2423d690,
+    0xd73c4d5a894ce359,
+    0x9730046d99993f39,
+    0x8da821b74b1666d5,
+    0xdd305eadf7e61850,
+    0xaaa9006d193d2874,
+    0x148e0f255a66ec4c,
+    0x8e7d00fb67a9ced7,
+    0x60c17bb5df0f576d,
+    0x9dcd1378bc33da95,
+    0x53dd9a06eb3f3803,
+    0x997b012f543a7193,
+    0x1f6bcc782a88bb0,
+    0x1e8a03700287b5ed,
+    0x42e0ab64f13ccef5,
+    0x3a8c278839bc673d,
+    0x3ab32b83a3b4a66f,
+    0x2e4a4da1ce617abe,
+    0x6a82b38d3988934f,
+    0xeb222d91a6059f1e,
+    0x9fd826496cbb6d32,
+    0x51fef58d2fc2ebdc,
+    0xc1220961f51adbb8,
+    0xf249549166c44142,
+    0x52c7a79a40af86f,
+    0x14536935ef78bcd1,
+    0xad13553096a85bb1,
+    0xdc2211330a68ca41,
+    0x330a45fb116cfec0,
+    0xc97c081fc00038e4,
+    0x9c4c9703b86cae8f,
+    0x46f5c2519e16a4a2,
+    0x3a59f51ce94af190,
+    0xc2c725cc80e0267e,
+    0x8716b7981b8914a8,
+    0x1a4c89c59e68ba51,
+    0xe8f6d2e043c293c7,
+    0xd6b1942e63fa2cda,
+    0xd1219171bd7f9c60,
+    0x260d9f2e80de67fb,
+    0xe729df2e1fccd007,
+    0xf4265618ff332aa2,
+    0x4efebaa9bea82426,
+    0xf10ddd3dc0516a45,
+    0x4cc3a8ad19a12850,
+    0x447f39e05dc34668,
+    0xa7dd569a7065e7dd,
+    0x9757acee12b9924,
+    0x8be12eecc673c9ce,
+    0xd81d806048f87292,
+    0xfd8ed92fa2eb7ca9,
+    0xb647f5840d27a6fc,
+    0xef6349a0cfbe5307,
+    0x33c025998adb626e,
+    0x461b045f6273adce,
+    0x933692c9698ca803,
+    0x75a1894763c26468,
+    0xa6355c138005c25f,
+    0x570b2d7457580fd9,
+    0x541bceaee7acafc6,
+    0x5333d700d78e57d9,
+    0x99751536148566c2,
+    0x41f947b23b31ca5f,
+    0xa25f25a86e6cd041,
+    0x9b1e4a18d47e72f0,
+    0xb4952afabf68b36a,
+    0x18ebba27a234b9a3,
+    0x67be6be2f5455d57,
+    0x38214346f676bc0f,
+    0xcc37badc71942ee5,
+    0x95895807aff1c6a3,
+    0x29273e9b047e0636,
+    0x75718cbe1662e8a,
+    0xaefb2c2a16acda41,
+    0x214b97365780d928,
+    0x231a4b00a65eb841,
+    0x9eb5765e3edbb978,
+    0x85624f4f5a4775e3,
+    0x582734ee24756a79,
+    0x9140d0cde06ca92d,
+    0x79e36698b9462f92,
+    0x5419d4ec0606f893,
+    0xfa3247497ec6f844,
+    0xd068cc09a1eb105a,
+    0xd9d6e0c84c2fe538,
+    0x454ad6eb0c74948d,
+    0x775a763492bc7e3,
+    0x8c85f9423f78000b,
+    0x2ac8f281e83fb19c,
+    0x6ab0bac5ce6d418a,
+    0x11d0f876693ebb7c,
+    0xbf413329def7668d,
+    0xf4572ed23e5854d3,
+    0x736d43fac075ed88,
+    0x21c8648c186d4c04,
+    0x12d1edb85dff63bf,
+    0x7f2699307aa20873,
+    0xc1406d083e3cd898,
+    0xc50c8989f7df6da8,
+    0x25581d0f0d0c4408,
+    0x2dd14879f4793913,
+    0x30eecd843a68affc,
+    0x755ff1225927c66f,
+    0x4d70dae5609da928,
+    0x4e3e510cf8de0a27,
+    0x6eb48c0ab533e65e,
+    0x360af1f14c7312a3,
+    0xb69c9c45e7a3ff76,
+    0x56e503e84d378493,
+    0x8fde0a8974cb1053,
+    0x96ede7b2b0e1df2,
+    0x52a3086a0d0f8396,
+    0x8420fd1bf4d89ef9,
+    0xcb2f35e21597e00b,
+    0xb38c9d526b32d708,
+    0x38ba985c2d232e1e,
+    0x7d98160288d14c2b,
+    0x7096813b7ee01175,
+    0x22bbf9ae792adc,
+    0x7ee23c383a9f1b53,
+    0x3dce0b70d6754c0d,
+    0xbecc82b1ef4890b7,
+    0x5b7ee53ed0d3aa9b,
+    0x31ae27479728f423,
+    0x18147aa1a5cd4e6,
+    0xf16f702bb92d79a,
+    0x36af3f9b02d60030,
+    0x9f370d2c9c4c81dd,
+    0x5d70964097a6fdb6,
+    0x3c7b10ab07d343f4,
+    0xdd43e1a524c01fb9,
+    0x53be44d01647f5a8,
+    0x86052458b58bdf0d,
+    0xc5bdc76c2be7879c,
+    0x92f09e9888508837,
+    0xeff3dc106799f6f5,
+    0xdb86b8c1cebdd398,
+    0x1f71fc8bdf2ff814,
+    0xa6fc6e308e2c3d16,
+    0x59049ec60b12ea61,
+    0x5c00aaac4b1a6bb9,
+    0x142a1f8a51ce3314,
+    0x9af148c90abecb24,
+    0x3db99f5abf137b7a,
+    0x4ae2221f6a6c4a4f,
+    0xc9b2a53cd2955943,
+    0x2f115855187008cb,
+    0x73e7a17aa37ac7a0,
+    0xfb01c6bab571f7,
+    0x82eb8eb74c327a14,
+    0xad83bc6acf088a71,
+    0xde46158b5efde5fa,
+    0xf98c7903c8e85a65,
+    0x4ae897ad9f74138e,
+    0x1a421f55695a3f0a,
+    0x8fb83e1ae2a5d9e8,
+    0xfbdc7a612a56b1e2,
+    0x67f14bcfd9a4eaa2,
+    0x3e2da3d244a8fec0,
+    0xca68d954622fc32d,
+    0x51f22b1c87304d61,
+    0xc11915ef75f276c1,
+    0x2aa917924fc75d3b,
+    0x416c35e8ca3b7f,
+    0xb36d25249ed1ad61,
+    0x9ce4d52c698480e4,
+    0x63fa75e76169101e,
+    0xb4878b87a5b8676d,
+    0xac13436f5f7f8c0f,
+    0x1cc78887a7ecb22d,
+    0xbe68c5f5a7035faf,
+    0xb1103db1343e3355,
+    0x87d572615e65bc3d,
+    0x4a7eb12764dc06bb,
+    0x9e5eb9be52b8237e,
+    0x35e20fc37b175ec1,
+    0xe908e6483db1a882,
+    0xfb2426b821188615,
+    0xa039c7f0aef4e9d5,
+    0xc061c8505ce0ef0a,
+    0xafb0b518b61e1bfe,
+    0x8d450826f56ac45,
+    0x875b8c18dfdb69c5,
+    0xde91990086b03b08,
+    0xa7a091ea807a1c5,
+    0xf078537f655169fa,
+    0xb149e2b16ddf098,
+    0xd0c7f86e76dff33b,
+    0xacf66e900701665d,
+    0x5b0006b476da26a5,
+    0x9195b393aeba8e9b,
+    0x1f1d61a0986d5362,
+    0xd2f177841e1627cf,
+    0xcee7d6091b6fdcb1,
+    0x29cfcb163a9a4098,
+    0x9b437ba28dcf2430,
+    0x59261a816c71da8d,
+    0x5b2a87d15144584c,
+    0x84ffc192b7bb34d0,
+    0xf20ec52e876863da,
+    0x7249fe68a5aaa012,
+    0x3e2e8be222c81c2d,
+    0x8beaaaf0765e6cfc,
+    0x4293822d800ce542,
+    0x8863e3a98f16f42e,
+    0x1af52c9f0a92e058,
+    0xaa1082121428d40f,
+    0x46a38630c5f6eeb3,
+    0x6ac60d8ad98ed9fd,
+    0xc952ea0b2c500113,
+    0x97b4e3a03ebdd673,
+    0x9e8a27635b5513e4,
+    0x8cc38a3ea8e7d0cd,
+    0xc74bbb1251351bd8,
+    0x8a0b10c3b5cddfbc,
+    0x6451e3adb7a3933b,
+    0x48f1c2e2c626fe5c,
+    0x14094e73451a529d,
+    0x7c76d0fc42e6485d,
+    0xb9fc6ab1f92e69eb,
+    0xf36922b7f3bf7b64,
+    0xeef16f51700d1791,
+    0x6628f6741d595a58,
+    0xa4057124f3ba82e6,
+    0xa6f5079795f2ccfc,
+    0xa3e458bdd58537b1,
+    0x76c78d6d066294e9,
+    0xf887f2ade7c098ab,
+    0x7fd23503d3e4a009,
+    0x2a5f914d27569fd2,
+    0xfe2bc285e2f9cf10,
+    0x8c89781efbd55100,
+    0xc31afb7c215114e3,
+    0x80a121c983377596,
+    0x81557f4b99d4c81c,
+    0xa6a689b9e83c131f,
+    0x5f6e1f80765fed31,
+    0x3aeb0edec70552dc,
+    0x4a2a02737d16261c,
+    0x2d8a7a657a7727aa,
+    0x36986e3ceb2ab7f9,
+    0xb15984d9e14aa9a8,
+    0x2d61068444c8bcd2,
+    0xf7106adaad6a01cb,
+    0x1ebf7e867f036b02,
+    0x1c3083d052a15c20,
+    0x382a128870d12e32,
+    0xc1145ca52153b3b2,
+    0xbb8dcbf34da58174,
+    0xcee36a3426496f21,
+    0x973b5f5974160fdb,
+    0x9d0468d58d4cdecd,
+    0xf9c6d8fc6f3c9953,
+    0xfbab3d775248d380,
+    0x75331900d278ed16,
+    0x99d803db348f597a,
+    0xf091a18afc80e5a5,
+    0x584b86cbaf34643c,
+    0xaba98edb2df388e4,
+    0x540cf34cfd2ba295,
+    0xbfb1c8fba77d95eb,
+    0x11ce5715ae62a49e,
+    0x8a890e8a7c776724,
+    0x41dd6d6f5808d64f,
+    0x45a8eaec117d9fa,
+    0x13b4886904b8a6db,
+    0x44df2ccca5352aa6,
+    0x4b888783401c41de,
+    0x4399c00f06450031,
+    0x5c5ca722df5283de,
+    0x2e171c05ee5c2421,
+    0xfba3851b025ee0f8,
+    0x7d0c9f529b748f70,
+    0xac6188166aecdee7,
+    0x1e39200f35f3e2bb,
+    0x268fa342cf12d404,
+    0xa468d1d8c99facd0,
+    0x828436888228908f,
+    0x5efdb729f1bc50c3,
+    0x277744cdc2c0f616,
+    0x817ee7763d8ff12c,
+    0x49c1e3f8b4202800,
+    0x4f86d87590bcf34d,
+    0x2c204cb4a7029dba,
+    0xeefd8de2d12c33ad,
+    0xdfd83c6a308dfaf9,
+    0x71d6d21a0607cd52,
+    0x98835273c1738c0b,
+    0x28761eabf17c7021,
+    0x8b1a88caa0bb9db8,
+    0xde03c38da74e825d,
+    0x81e12cd73e173a5a,
+    0xe2c3aec911b2c414,
+    0xe0c96ec6d79048db,
+    0x49a5cf9009a72bfc,
+    0x6a0e10dae7d633cc,
+    0xd968de73eef9ddf2,
+    0x6cb6034c542694c,
+    0x45eb8b7c3189d10a,
+    0x4c81d70aa2a0ca6a,
+    0x4416b730a474226,
+    0xfa6e7cf304df5b26,
+    0x1278a6b508958723,
+    0x8d2478d753a391bc,
+    0x6dddb92aa6fa662b,
+    0xabb08b3ebea82ccb,
+    0x434a9b79216a00b9,
+    0xc62826283d436955,
+    0xc79532bc6f28a9bf,
+    0x691bd93c99f41cc9,
+    0xc884b7cbd864adef,
+    0x852cb3b95ae07dc1,
+    0x5f29a08610145631,
+    0x73971d929301fa2,
+    0x9edf0d20c7f98b94,
+    0x199af8d0a1dfb830,
+    0x47c46f6d38d73fc6,
+    0x36b2b26dbe33ecef,
+    0x76fcacd43e701fe7,
+    0xdd99eed9655124c,
+    0xf2735ddedcdeba6a,
+    0x8c3fa9bed01d195a,
+    0xcbf80ff70926ce4a,
+    0x2d1816deb77b1a79,
+    0x3cb781ba66067858,
+    0x22a272c8b7acce8a,
+    0x872a9b3f37335965,
+    0xb04db91d335ffa42,
+    0xb7c07e30461c0dd8,
+    0xfcd1d737b1b8d90e,
+    0x8e55bec1d30bd9ca,
+    0xaf26cd23769bfc72,
+    0xdfe1cc07ae607c2f,
+    0xb460f12562c75006,
+    0x99111d6f3f626561,
+    0xca62ab29e2082de7,
+    0x77778192e27f7331,
+    0x84e8d3771f3114f0,
+    0x48e7604499747f04,
+    0x5182f89c7ab6847d,
+    0x58f38a1559c4ce71,
+    0xacff309c83bf3a2,
+    0x35336651904787a7,
+    0xd7010246712c1767,
+    0x197bae41e5da8c75,
+    0xe1ddbd659777891f,
+    0xe441726e76b37d31,
+    0xcc0c10271e80fb0,
+    0x79dff13ca2b9169e,
+    0x141d41fecf39f6d6,
+    0x39c33f8b605d7bd9,
+    0x8ff50c5efbe4fc8b,
+    0x682ff00b03200f0a,
+    0x864dc866ed171b8a,
+    0x72fbc165ed0049d1,
+    0x7e89fc173baa0b5a,
+    0x9880357427879cb3,
+    0xbad2f82d2c0ea11,
+    0x47ddd04854cd7fa5,
+    0x161edf2804fc3d6a,
+    0x9c0e85b3aad5b53d,
+    0x9a1c3a5310fc5f65,
+    0x995fdf7e57f392ca,
+    0xadfee49cebf07f73,
+    0x91854d9359811c82,
+    0x1476dce18c69d533,
+    0x61a69e4b216f307a,
+    0xc1a826e7fd9166fb,
+    0xa2f89848f00d0ed1,
+    0x79e83d71983009a7,
+    0xe444c1ff42e33ccd,
+    0x5ce0a93d90cc313e,
+    0xd41941e8912ec5d5,
+    0xf8b164912cee0c01,
+    0xda8d7d81e66c046a,
+    0x142ed24ccda95e1a,
+    0xbc3d5853786ec4d5,
+    0xf46cd5b321f2a34b,
+    0x4ddcd048280fabbc,
+    0xbdda08d446755016,
+    0x9d799a8ede0b2817,
+    0x494d45d56d8acbe2,
+    0xe9fde5a13e56188e,
+    0x6d94ce33e3acf37e,
+    0x2242ff8adc7be991,
+    0xf8b6c1e4cc6b6e23,
+    0x9216ddb2d20a2221,
+    0x6b471ff1ad920d40,
+    0x7d72c0ecfe17ec3d,
+    0x822b83c61166693a,
+    0xf9ec5e2c9b9a5697,
+    0xfa68d75e69a6a607,
+    0x47aa3a0c0931f3e3,
+    0x89e627c5deac3787,
+    0x3f579ecda14b5790,
+    0x55d0c08690045809,
+    0x402c8bb94b6f6a18,
+    0xd22991f887869c88,
+    0x821e84f7651251c6,
+    0x78418683c5f8ef13,
+    0x29412b4f174b4e2d,
+    0x9488804c907ced71,
+    0x56c391f7afec41cc,
+    0x2bfe28da9a9c1e97,
+    0x2e3a95db7556e432,
+    0x62548d6b60c20606,
+    0xaccfdc6c5ed75f7a,
+    0xad121d7cc592d216,
+    0xf132ed77eebab96b,
+    0x1bdb7d55e2b8485b,
+    0x8713fff4aebcaf63,
+    0x18a478078b7b7d34,
+    0x716222e0f60a6742,
+    0x7325bdedd8bc0a53,
+    0x227f3e8006d675e5,
+    0x95e96b3decc851c6,
+    0x4053e10036978e0f,
+    0x1fb9502d4b374b40,
+    0x74230defa336c869,
+    0x41b373a9fd396ba4,
+    0x84236cb47524298a,
+    0x25a4098d7608431f,
+    0xc6f6de238198452f,
+    0xbbde606f9bb85b75,
+    0xe2daf8f81bf2c9df,
+    0x4c0e56d5beb483c2,
+    0xdd6ce59ebfeb8c2e,
+    0x7749e03e1780224e,
+    0x168c83c2f3879e8d,
+    0x2b3c3e547ea13f58,
+    0x2456e8c50ecca9de,
+    0x13f319066573d75d,
+    0x6a5dd4f57bcb8d58,
+    0x707457d72cdd80ad,
+    0x309111cd56c3800b,
+    0x8d24ba3247f41293,
+    0xa6d2ea659ccf1c16,
+    0x5c53a2862d427d6b,
+    0xfbd3bf726e640016,
+    0xe10f3505c5041358,
+    0x8eb1a170e420533a,
+    0x2dc3c9624bd74561,
+    0xf4371c31fd6b4fe9,
+    0x24b8f198bb541640,
+    0xe34cb3bcf7737624,
+    0x4ba5edc6aa07c2e3,
+    0x6865c1e7cfba9c03,
+    0xbdce4d58b0187acd,
+    0x5adf64b488ef8349,
+    0x8cd1b7dd5a22d21b,
+    0x2bb4b18a68ef313a,
+    0xc3e1b2982b6422a,
+    0xa380d8431afc4314,
+    0x85d60839ca25f335,
+    0x6ac889882a1bc99c,
+    0xfe548149903610ad,
+    0xba05eade2634a64a,
+    0xe2859f099f740ff3,
+    0xe035bef0eacf7f24,
+    0xac2865f372e407aa,
+    0x17f0b3f34f80a462,
+    0x82ecdbdbe999db5b,
+    0xe16e352108f66673,
+    0x7ef9a8d69f65a3e4,
+    0xa10ac4d9bc1d654c,
+    0x389793001efc0f57,
+    0xd3fa41988aa5950b,
+    0xf043bbb338ae9424,
+    0x26b5a7f19e70fd8c,
+    0xe199a2418f3d45a3,
+    0x411c4ab586a8d092,
+    0x67f99937e64dc5d4,
+    0x46b255671aae80a4,
+    0xee4be6b6cfb233d7,
+    0x5f083d7e17c3b095,
+    0x139c53fb6fa84d25,
+    0xb7aef12fef8e1bf5,
+    0xf236a34d6aa18901,
+    0x9fff397b269c2ed,
+    0xded963366f7bedb8,
+    0x7eafab16a56d238c,
+    0x48d27758d58b5cfd,
+    0x3b7eff9043383986,
+    0xbd5d6ab9db4d4062,
+    0x390ea0c1d68b0186,
+    0x70d1470b57439609,
+    0x84fc8707f213fa77,
+    0x35724f939d3ba527,
+    0x54530b8d80ecd0d5,
+    0x1fb3715fa7aaced5,
+    0xfcdb91ca6ecfb8,
+    0x4d0340ca96662115,
+    0xdc4a4951811b9103,
+    0xcebf7aaa945af366,
+    0x3be1fa2a4298df58,
+    0x56ceb64afd169691,
+    0x865585b75ed722c,
+    0x397c43874a3d5d60,
+    0x52184ab0ba9bae4b,
+    0x3ab7ee80e5a5c006,
+    0x17be8fcbc84375f8,
+    0x3d68367148c2022a,
+    0xbd5484cab47a919c,
+    0x905154c0a67bd568,
+    0x6feb52218b177a47,
+    0xbc3c2176249f7e3b,
+    0xa793daa97ae4acad,
+    0x1ff809fd2f99fc63,
+    0x4536bb424e7eb4e3,
+    0x4eea7f2fa52605bf,
+    0xfcbd760fa4559ef8,
+    0x67f69c8afa227b25,
+    0xad662ff2287e6392,
+    0x4aac1921557122f2,
+    0x95cd2bb47e567a0f,
+    0x40bf492da64145fa,
+    0xa4cf88345cf9eaa8,
+    0x35fc2893bcc69085,
+    0x365d5c16465f687,
+    0x9bdf7c770e06ecfa,
+    0xbc7e3de76b708ade,
+    0x9ae33d937fcba56c,
+    0xba06b0ac9c5e7103,
+    0x16df94480e3e680c,
+    0x2f5143fdbd916453,
+    0x822247a68a0c7c84,
+    0xe83c18938e606109,
+    0xf1c5afc25b1b46fe,
+    0x63b90737df42dc20,
+    0x75d05ee5a4e3be87,
+    0xae97e4b140fade9a,
+    0x38190da71d2e436f,
+    0xf14189f32d13789c,
+    0x5bdbcd32516511e3,
+    0x39e8daaa5570529f,
+    0x8c7c87dfe7adbc5d,
+    0x50d1098ecac642ba,
+    0xe677c04653aaa619,
+    0x7a20968a512c296b,
+    0x990df3efb1ceaee3,
+    0x17da489b676ac3a4,
+    0x79ba2e55f32fad03,
+    0xb37ce69551720d7a,
+    0x5d0b3eb463f019b0,
+    0x62bbdd8b6715f148,
+    0xa940b326d83de2a,
+    0x8e5a2dcd4ba03685,
+    0xb62d69e32c8314e2,
+    0xe4e43bd0bc6fd756,
+    0x47d2423df247e991,
+    0x503146259a6bf177,
+    0xbc071ed7ccc80aaa,
+    0x18751079f7643c5b,
+    0x9dc9b6f977e0c539,
+    0x90c462ad08a9a651,
+    0xfa9d11bca71e85da,
+    0x562ea95ac0eac5d2,
+    0xabc52cc38f227959,
+    0x61e28120aeab8e04,
+    0xd7caa318a90ddb1c,
+    0x47df2dec08976f53,
+    0x508e5cf7968b5f06,
+    0x9d542dc0202217c9,
+    0xb5fbb778e47cef3c,
+    0x35719d9b3159107e,
+    0x795d82718446fdb9,
+    0x74719785149066a1,
+    0x29df70265e8cb030,
+    0x150d9f1266d32dd9,
+    0xd3593edda36a9f63,
+    0xe5b15f241b72e992,
+    0x255e9fda6075281b,
+    0x103e191fff1ffa38,
+    0x40a2e2bf7589f6e1,
+    0xa4234c1aa029d558,
+    0xbf3d27d70d1402a9,
+    0xab34a04a7f4aec3d,
+    0xd0e7a747e730e9e6,
+    0x14c67175e68b1704,
+    0x2eb754dfc9fc48e3,
+    0x7670085f792e9b19,
+    0xb3be41ed0350f22d,
+    0x4ef33c277c998ff3,
+    0xe419d5a85119da11,
+    0xe5996746c039dbfd,
+    0xf5841d4d323fc908,
+    0xb624fb1b778e8aa8,
+    0x5d54b5e25319d19b,
+    0xdc1acdc2a6e99aae,
+    0xde7308dce8599b17,
+    0xd988ef1895850c6e,
+    0x3d452fc1431b6d8e,
+    0xd06380fa69e8e046,
+    0x12433d76c539fd0a,
+    0x45ee3e59fbeb8a8d,
+    0xa848ac60c178cea5,
+    0xffd053e1de3d28ae,
+    0xe1c92bb64c11e36d,
+    0x5c9aaa5d70913918,
+    0x85fadc3292cb242d,
+    0x892cca20533a952d,
+    0x8607306140cbd3b2,
+    0xcc441b019a64360f,
+    0x5f0396df1d28fe6e,
+    0x7e95629ee291758,
+    0x1f0b5fa654adca2,
+    0x4cb03949e91923f0,
+    0x484aea83f22e44e2,
+    0xdf20b712e5e844b5,
+    0x298406cbab4a5868,
+    0x61bac3297f7b891f,
+    0xd4dacd09cc44945c,
+    0xdfd3929aaded2df5,
+    0xe960feb3b5872131,
+    0x4fbe945f87f2d20d,
+    0x96b0fba49a9d57c3,
+    0xeba86aa55b875910,
+    0x164041a3c942b3a4,
+    0xb2b7c9f36e845f6f,
+    0xb3d22fd313c7bc90,
+    0x53cb0664d4d2e6dc,
+    0x36844fefd481861e,
+    0x92cf94f061b35d5f,
+    0x7f428c27efbff7ca,
+    0x2d5ce8c43200cf06,
+    0x99e08a40c4b8fcdb,
+    0x5c6fd9566eee8f9b,
+    0x7b466a3b8fa67ab8,
+    0x7d273f1bd59ff4a7,
+    0xdc95fe4e16fb8655,
+    0x2d5fae0629c98b00,
+    0x9220b71955e8ab6,
+    0x7170d50e413d974,
+    0x7f01c903f1d97aa7,
+    0xf40880c65f0faeb6,
+    0xcde101c03a517f73,
+    0x5a5fa1adcc05baee,
+    0x67b0f0cfa88b4ba4,
+    0x76a968ee07dcdcad,
+    0x663960f054f22c5c,
+    0xb1f75ef509fc7903,
+    0xf2eab48778508c2f,
+    0xc1b4f77198bca25c,
+    0x1b207b3e5e14caa8,
+    0xb8bac391b73842e5,
+    0x2a1440419e91b212,
+    0x30e7af38d59b7590,
+    0x6b334411596ccd07,
+    0x8f3062e4e33fc6b1,
+    0x55e5e8d70b29ee6c,
+    0x7667d602322f954f,
+    0x3ffc5edf4e31a129,
+    0xec5ddbeb8749502,
+    0x69c6782e0a679d8,
+    0xd02d3c1c37cc9050,
+    0x1b6725be16d41a84,
+    0x560627655da1f9a4,
+    0xd7f1687f661e6331,
+    0x7c07a32ef8c4032b,
+    0xa9654865f21f8dc0,
+    0x7e23a6c66bc04687,
+    0x3e2837a03217f6d1,
+    0xfc5642e5a17e3bc2,
+    0xa289882e6a4a964a,
+    0xeaaa829544036360,
+    0x89d81efc893eba23,
+    0x22166bd59fd68bbc,
+    0xb28e16f1c8981f37,
+    0xdf64fcd474810716,
+    0xc87c82759a51e77b,
+    0x21d4acc7bd02ebc7,
+    0x6644c6b2998e918f,
+    0xca25bafb4eee22f2,
+    0xad141d6104fbacbe,
+    0xe89df6cd1e457a17,
+    0x5798b7d63eab784f,
+    0x6d601e2fb1f8ee92,
+    0x5eb7c4b3ad85007,
+    0xe066d8f74242cbc6,
+    0x85753a7848a8840a,
+    0x126929552558e634,
+    0xe8a270762e730088,
+    0x9b1dfab808fb08d1,
+    0xc5bf1e271885a721,
+    0xfa5994c4724b2c64,
+    0xec0fbc4421a6ebb3,
+    0x1ad4d2c777bd38a7,
+    0x3b4a7a2e4dc32ecd,
+    0xde85db5f8c28a8b6,
+    0x55807b90629e99a2,
+    0x8aedc7dd6bbf9c37,
+    0x40b62148a6fac191,
+    0xc526d6dc47f31a19,
+    0xd6d1dfab7b708bed,
+    0xa80e2d39c3566a30,
+    0x867f5fcdbc017d29,
+    0xe935e38f4cb1d6f3,
+    0x3fdce795454f0710,
+    0xea7fe50a127d4be4,
+    0x949ee2f989301db9,
+    0xc7ff6f9a45841162,
+    0x13f626abbe00ce9,
+    0xe7f60a0221a1f747,
+    0x784c860b6ad3f55f,
+    0x684c6e4d0baeb7e2,
+    0xf238dc9a9d03680e,
+    0xe8b61d2401fbed59,
+    0xcea62b7fc6ef1e24,
+    0x2701d1cf11ae0a10,
+    0x6d5600b5a3382085,
+    0x9e5954c079733c71,
+    0xc5c3ec7398a7fd64,
+    0x738e214bf36774ed,
+    0xb4146174aad7dcce,
+    0x7f1c1916feb42425,
+    0x7ebbdf024a693b28,
+    0xfa8ec51c90ee7641,
+    0x58b18f59807c967f,
+    0xb777c514b363f564,
+    0x44c558a518f5a4a7,
+    0x83477d823952f525,
+    0x9630fe6c3a5d0317,
+    0xee824b26f1808aeb,
+    0x49d499d48212cff0,
+    0x5f8a66d8e922071a,
+    0x918dd98c86694037,
+    0xee53eaf7d0392faf,
+    0x54fe9ad2164082d1,
+    0xe62a7021b9bdc11c,
+    0x7f0adc28f514186c,
+    0x8629e7c28950e3a8,
+    0x877e6fb01620a119,
+    0x5463523e10092a82,
+    0x99816225c0a6df35,
+    0xdb41f17b5e8f8ea,
+    0x31379366445a855d,
+    0x3396af3796c4311c,
+    0xcd6854360e371258,
+    0x8a9e404c646c57e3,
+    0xd58c6975ead8c431,
+    0xda5d16f7a0864855,
+    0x7d5d67a834b4674a,
+    0xdf7fa63dd8881298,
+    0x37f42ddac105de1e,
+    0x1cf1dcd954034fe0,
+    0x922997aef2e5b5ac,
+    0x52f5df1219e20910,
+    0xd56cadb512ede205,
+    0x633c7ef5636245fd,
+    0xd854f3fdcf1cbf36,
+    0x3e828e23836f36a2,
+    0x920d15090363eb91,
+    0x4b4f687d473617f,
+    0x15221fe408b34b92,
+    0x69dd9146e76196ce,
+    0x6134908b2df9d298,
+    0xe772dd0977fe33dd,
+    0x5ef1a3688791ca45,
+    0x4be5bceacd589bdf,
+    0xdc9f2ea1b83b7d1f,
+    0xb6a9907f14403fd0,
+    0xd74deb241ac45f11,
+)
+
+CASTLING_KEYS = (
+    0xc783edc5fe915aff,
+    0xf5b61bf5abae079f,
+    0xf5b9d75cebff81f5,
+    0xd8852833489406a3,
+)
+
+EN_PASSANT_KEYS = (
+    0x4f9ab50e3052024f,
+    0x2e0245494236c98f,
+    0x4625132fedd531c4,
+    0xa3acf465eaaa7750,
+    0x15a5c3df3a19e25c,
+    0x1bcbd5e0f54c8ea5,
+    0x8361d908e88efccb,
+    0x11f5aee40e294406,
+)
+
+TO_MOVE_KEY = 0xad983e6c755afe25
@@ -0,0 +1,137 @@
+"""
+Generated by src/chess_board/magic_generator.py, do not edit by hand
+"""
+
+ROOK_MAGICS = (
+    0x800124c0081080,
+    0x240100040002004,
+    0x200102200400880,
+    0x8080100080080004,
+    0x1080080002040081,
+    0x180020080030400,
+    0x400080201009430,
+    0x8001000058a280,
+    0x1002041008005,
+    0x1060400040201006,
+    0x82808020001000,
+    0x1241001001000b20,
+    0x1800800800040080,
+    0x1a001008050200,
+    0x404808002000100,
+    0x101000080510022,
+    0x38450020800100,
+    0x880404010002000,
+    0x120010020110040,
+    0xc118808010000802,
+    0x1a0808008000400,
+    0x8808002000400,
+    0x8180040001420810,
+    0x2206000042840b,
+    0x4000400180022080,
+    0x1200200240100242,
+    0x2200401100200100,
+    0x1062100480080082,
+    0x208008880040080,
+    0x40080020080,
+    0x301a010080800200,
+    0x8200004124,
+    0x9880004000402000,
+    0x4d0002000400052,
+    0x1000410019002000,
+    0x8420012002008,
+    0x800800400800801,
+    0x78020080800400,
+    0x300008a204000110,
+    0x4000408042000104,
+    0x840008000488020,
+    0x10002000404000,
+    0x52004080120020,
+    0xa21041000090020,
+    0x50b0040801010010,
+    0x2002000804010100,
+    0x500080102040010,
+    0x200410040820004,
+    0x16010044208200,
+    0x8000822004400880,
+    0x402200108200,
+    0x1110000800801080,
+    0xb18100500080100,
+    0x4900040002008080,
+    0x8801000402000100,
+    0x1100008054090200,
+    0x1044020108003,
+    0x2022248801102,
+    0x4002001020420982,
+    0x6000200c400a0006,
+    0x8102010810200402,
+    0x5002004408015002,
+    0x6000100201208804,
+    0xc418130408204082,
+)
+
+BISHOP_MAGICS = (
+    0x2120241040850010,
+    0x10301214822418,
+    0x8182040844000,
+    0xa08208020000c40,
+    0x10510c008000000,
+    0x180082a060000490,
+    0x2430c0202415400,
+    0x10440218020208,
+    0x41000ad090008100,
+    0x4008100420940048,
+    0xa00410401004002,
+    0x6200082042401600,
+    0x411240420010000,
+    0x200010160100ca0,
+    0x200080849010d002,
+    0x2210011042100414,
+    0x8004926028300100,
+    0x8010000210210104,
+    0x8000488210200,
+    0x324008202120000,
+    0x40c022480a00182,
+    0x9404201100154,
+    0x1a10441108267020,
+    0x800890c40441000,
+    0x422206208085018,
+    0xb00800302200a6,
+    0xa000404084010202,
+    0x2008840008041010,
+    0x4020808010082000,
+    0x40081018a010080,
+    0x200102000110b000,
+    0x1140080810090b2,
+    0x10090410610400,
+    0x8008121302880804,
+    0x8204020100122400,
+    0x200800190050,
+    0x2062020200040084,
+    0x2a0208082810800,
+    0x4010010240010c38,
+    0x1640020010100,
+    0x1002100c14006100,
+    0x804020804244201,
+    0x304101088001011,
+    0x420800205800c302,
+    0x1000284100401400,
+    0xe011410116000b00,
+    0x4408020444003c48,
+    0x810208081003080,
+    0x88084210a842,
+    0x82009094300200,
+    0x411002004a088802,
+    0x8a000784340000,
+    0x8910810240008,
+    0xa2008208044,
+    0x8488800a41404,
+    0x2841440820022,
+    0x14a044048280800,
+    0x42090041046000,
+    0x600212044240400,
+    0x10400000208840,
+    0x240020010820200,
+    0x20840410820208,
+    0x400222002008101,
+    0x4121041002004211,
+)
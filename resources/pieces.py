@@ -13,3 +13,24 @@ piece_tokens = {
     "k": "♔",
     " ": " ",
 }
+
+# Index of every piece in 12 entry piece tables (e.g. Zobrist keys), white pieces first
+piece_indices = {
+    "P": 0,
+    "N": 1,
+    "B": 2,
+    "R": 3,
+    "Q": 4,
+    "K": 5,
+    "p": 6,
+    "n": 7,
+    "b": 8,
+    "r": 9,
+    "q": 10,
+    "k": 11,
+}
+
+# Piece on a square for every value of the board's mailbox, 0 is an empty square and every other
+# value is the piece's index above plus one
+mailbox_pieces = " PNBRQKpnbrqk"
+mailbox_values = {piece: value for value, piece in enumerate(mailbox_pieces)}
@@ -0,0 +1,168 @@
+"""
+File containing attack tables for the leaping pieces (knights, kings and pawn captures), plus the
+slow ray walking helpers used to build the sliding piece tables. The leaper tables are built once
+at import and are indexed by square (see bitboard.coord_to_square). Each entry is a plain 64-bit
+integer with the attacked squares set. The BETWEEN table of aligned square pairs is used for
+check evasions and pins.
+"""
+
+from typing import Dict, List, Tuple
+
+from src.chess_board.bitboard import coord_to_square, square_to_coord
+
+KNIGHT_OFFSETS = [
+    (2, 1), (2, -1), (-2, 1), (-2, -1),
+    (1, 2), (-1, 2), (1, -2), (-1, -2),
+]
+
+KING_OFFSETS = [
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (1, -1), (-1, 1), (-1, -1),
+]
+
+# Pawns capture diagonally forward: white (1) towards row 0, black (-1) towards row 7
+PAWN_CAPTURE_OFFSETS = {
+    1: [(-1, 1), (-1, -1)],
+    -1: [(1, 1), (1, -1)],
+}
+
+
+def _build_leaper_table(offsets: List[Tuple[int, int]]) -> Tuple[int, ...]:
+    """
+    Builds a 64 entry attack table for a piece that jumps by fixed offsets
+
+    Args:
+        offsets (List[Tuple[int, int]]): (row, col) offsets the piece can move by
+
+    Returns:
+        table (Tuple[int, ...]): Attack bitboard for every square
+    """
+    table = []
+
+    for square in range(64):
+        row, col = square_to_coord(square)
+        attacks = 0
+
+        for row_offset, col_offset in offsets:
+            target_row = row + row_offset
+            target_col = col + col_offset
+
+            if 0 <= target_row <= 7 and 0 <= target_col <= 7:
+                attacks |= 1 << coord_to_square(target_row, target_col)
+
+        table.append(attacks)
+
+    return tuple(table)
+
+
+KNIGHT_ATTACKS: Tuple[int, ...] = _build_leaper_table(KNIGHT_OFFSETS)
+KING_ATTACKS: Tuple[int, ...] = _build_leaper_table(KING_OFFSETS)
+PAWN_ATTACKS: Dict[int, Tuple[int, ...]] = {
+    color: _build_leaper_table(offsets) for color, offsets in PAWN_CAPTURE_OFFSETS.items()
+}
+
+
+# Sliding piece directions as (row, col) steps
+BISHOP_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+ROOK_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def get_ray_attacks(
+    square: int,
+    occupancy: int,
+    directions: List[Tuple[int, int]],
+) -> int:
+    """
+    Walks each ray from a square one step at a time, stopping at (and including) the first
+    occupied square. This is slow and is only used to generate and verify the sliding attack
+    lookup tables.
+
+    Args:
+        square (int): Square index of the sliding piece
+        occupancy (int): Bitboard of all pieces that block the rays
+        directions (List[Tuple[int, int]]): (row, col) steps of the rays
+
+    Returns:
+        attacks (int): Bitboard of all squares reached by the rays
+    """
+    row, col = square_to_coord(square)
+    attacks = 0
+
+    for row_step, col_step in directions:
+        target_row = row + row_step
+        target_col = col + col_step
+
+        while 0 <= target_row <= 7 and 0 <= target_col <= 7:
+            mask = 1 << coord_to_square(target_row, target_col)
+            attacks |= mask
+
+            if occupancy & mask:
+                break
+
+            target_row += row_step
+            target_col += col_step
+
+    return attacks
+
+
+def get_relevant_occupancy_mask(
+    square: int,
+    directions: List[Tuple[int, int]],
+) -> int:
+    """
+    Returns the squares whose occupancy can change a slider's attacks from a square. The last
+    square of every ray is left out since a piece there never blocks anything behind it.
+
+    Args:
+        square (int): Square index of the sliding piece
+        directions (List[Tuple[int, int]]): (row, col) steps of the rays
+
+    Returns:
+        mask (int): Bitboard of the relevant blocker squares
+    """
+    row, col = square_to_coord(square)
+    mask = 0
+
+    for row_step, col_step in directions:
+        target_row = row + row_step
+        target_col = col + col_step
+
+        while 0 <= target_row + row_step <= 7 and 0 <= target_col + col_step <= 7:
+            mask |= 1 << coord_to_square(target_row, target_col)
+            target_row += row_step
+            target_col += col_step
+
+    return mask
+
+
+def _build_between_table() -> Tuple[int, ...]:
+    """
+    Builds the table of squares strictly between every pair of aligned squares, indexed by
+    first_square * 64 + second_square. Pairs that do not share a rank, file or diagonal are 0.
+
+    Returns:
+        between (Tuple[int, ...]): Squares strictly between the two squares
+    """
+    between = [0] * 4096
+
+    for square in range(64):
+        row, col = square_to_coord(square)
+
+        for row_step, col_step in BISHOP_DIRECTIONS + ROOK_DIRECTIONS:
+            ray = 0
+            target_row = row + row_step
+            target_col = col + col_step
+
+            while 0 <= target_row <= 7 and 0 <= target_col <= 7:
+                target_square = coord_to_square(target_row, target_col)
+
+                between[square * 64 + target_square] = ray
+
+                ray |= 1 << target_square
+                target_row += row_step
+                target_col += col_step
+
+    return tuple(between)
+
+
+BETWEEN = _build_between_table()
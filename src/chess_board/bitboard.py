@@ -1,4 +1,72 @@
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
+
+
+def coord_to_square(row: int, col: int) -> int:
+    """
+    Converts (row, col) coordinates to a square index, which is the position of the square's
+    bit on the bitboard. Row 0, col 0 is the most significant bit (square 63), row 7, col 7 is
+    the least significant bit (square 0).
+
+    Args:
+        row (int): Specified row
+        col (int): Specified column
+
+    Returns:
+        square (int): Square index between 0 and 63
+    """
+    return 63 - (row * 8 + col)
+
+
+def square_to_coord(square: int) -> Tuple[int, int]:
+    """
+    Converts a square index back to (row, col) coordinates.
+
+    Args:
+        square (int): Square index between 0 and 63
+
+    Returns:
+        coord (Tuple[int, int]): Coordinates of the square
+    """
+    return divmod(63 - square, 8)
+
+
+def pop_count(bitboard: int) -> int:
+    """
+    Counts the set bits of an integer bitboard
+    """
+    return bitboard.bit_count()
+
+
+def get_lsb(bitboard: int) -> int:
+    """
+    Isolates the least significant set bit of an integer bitboard, 0 if the bitboard is empty
+    """
+    return bitboard & -bitboard
+
+
+def get_lsb_square(bitboard: int) -> int:
+    """
+    Returns the square index of the least significant set bit, -1 if the bitboard is empty
+    """
+    return (bitboard & -bitboard).bit_length() - 1
+
+
+def iter_squares(bitboard: int) -> Iterator[int]:
+    """
+    Yields the square index of every set bit, lowest first, by repeatedly popping the least
+    significant bit. Nothing is built up front, so callers can stop early for free.
+
+    Args:
+        bitboard (int): Integer bitboard to iterate over
+    """
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        yield lowest_bit.bit_length() - 1
+        bitboard ^= lowest_bit
+
+
+# Mask of the 64 squares, keeps inverted bitboards non-negative
+FULL_BITBOARD = 0xFFFFFFFFFFFFFFFF
 
 
 class BitBoard:
@@ -7,10 +75,16 @@ class BitBoard:
     pieces on the chessboard. Also contains helper utility functions for common
     bitboard operations.
 
+    Binary operators return a new BitBoard while the in-place operators (|=, &=, ^=, +=, -=)
+    modify the left hand side. The *_mask methods work on plain integers so that hot code can
+    update a bitboard without creating any temporary BitBoard objects.
+
     Attributes:
         bitboard (int): Integer storing binary representation of a bitboard
     """
 
+    __slots__ = ("bitboard",)
+
     def __init__(
         self,
         coordinates: Optional[List[Tuple[int, int]]] = None,
@@ -19,7 +93,7 @@ class BitBoard:
         if bitboard is not None:
             self.bitboard = bitboard.bitboard
         elif coordinates is not None:
-            self.bitboard = int('0b0', 2)
+            self.bitboard = 0
 
             for coord in coordinates:
                 try:
@@ -30,7 +104,22 @@ class BitBoard:
                 except AssertionError:
                     print(f"Error: invalid coordinates {coord}, skipping...")
         else:
-            self.bitboard = int('0b0', 2)
+            self.bitboard = 0
+
+    @classmethod
+    def from_int(cls, bitboard: int) -> 'BitBoard':
+        """
+        Fast constructor wrapping an integer bitboard, skips the argument handling of __init__
+
+        Args:
+            bitboard (int): Integer bitboard
+
+        Returns:
+            result (BitBoard): New BitBoard holding the integer
+        """
+        result = cls.__new__(cls)
+        result.bitboard = bitboard
+        return result
 
     def __eq__(self, bitboard: 'BitBoard') -> bool:
         return self.bitboard == bitboard.bitboard
@@ -39,38 +128,72 @@ class BitBoard:
         return self.bitboard != bitboard.bitboard
 
     def __or__(self, bitboard: 'BitBoard') -> 'BitBoard':
-        temp_bitboard = self.__copy__()
-        temp_bitboard.bitboard = self.bitboard | bitboard.bitboard
-        return temp_bitboard
+        return BitBoard.from_int(self.bitboard | bitboard.bitboard)
 
     def __and__(self, bitboard: 'BitBoard') -> 'BitBoard':
-        temp_bitboard = self.__copy__()
-        temp_bitboard.bitboard = self.bitboard & bitboard.bitboard
-        return temp_bitboard
+        return BitBoard.from_int(self.bitboard & bitboard.bitboard)
 
     def __xor__(self, bitboard: 'BitBoard') -> 'BitBoard':
-        temp_bitboard = self.__copy__()
-        temp_bitboard.bitboard = self.bitboard ^ bitboard.bitboard
-        return temp_bitboard
+        return BitBoard.from_int(self.bitboard ^ bitboard.bitboard)
 
     def __invert__(self) -> 'BitBoard':
-        self.bitboard = ~self.bitboard
-        return self.__copy__()
+        return BitBoard.from_int(~self.bitboard & FULL_BITBOARD)
 
     def __add__(self, bitboard: 'BitBoard') -> 'BitBoard':
-        return self | bitboard
+        return BitBoard.from_int(self.bitboard | bitboard.bitboard)
 
     def __sub__(self, bitboard: 'BitBoard') -> 'BitBoard':
-        return self ^ (self & bitboard)
+        return BitBoard.from_int(self.bitboard & ~bitboard.bitboard)
+
+    def __ior__(self, bitboard: 'BitBoard') -> 'BitBoard':
+        self.bitboard |= bitboard.bitboard
+        return self
+
+    def __iand__(self, bitboard: 'BitBoard') -> 'BitBoard':
+        self.bitboard &= bitboard.bitboard
+        return self
+
+    def __ixor__(self, bitboard: 'BitBoard') -> 'BitBoard':
+        self.bitboard ^= bitboard.bitboard
+        return self
 
     def __iadd__(self, bitboard: 'BitBoard') -> 'BitBoard':
-        return self + bitboard
+        self.bitboard |= bitboard.bitboard
+        return self
 
     def __isub__(self, bitboard: 'BitBoard') -> 'BitBoard':
-        return self - bitboard
+        self.bitboard &= ~bitboard.bitboard
+        return self
 
     def __copy__(self):
-        return BitBoard(bitboard=self)
+        return BitBoard.from_int(self.bitboard)
+
+    def set_mask(self, mask: int) -> None:
+        """
+        Sets every square of an integer mask
+
+        Args:
+            mask (int): Integer bitboard of the squares to set
+        """
+        self.bitboard |= mask
+
+    def clear_mask(self, mask: int) -> None:
+        """
+        Clears every square of an integer mask
+
+        Args:
+            mask (int): Integer bitboard of the squares to clear
+        """
+        self.bitboard &= ~mask
+
+    def toggle_mask(self, mask: int) -> None:
+        """
+        Flips every square of an integer mask, e.g. the start and end square of a move
+
+        Args:
+            mask (int): Integer bitboard of the squares to flip
+        """
+        self.bitboard ^= mask
 
     def __str__(self) -> str:
         result = bin(self.bitboard)
@@ -161,20 +284,26 @@ class BitBoard:
         Returns:
             result (List[Tuple[int, int]]): List of coordinate tuples
         """
-        string_rep = bin(self.bitboard)[2:]
-        string_rep = (64 - len(string_rep)) * "0" + string_rep  # Re-add the leading zeros
-
         result = []
+        bitboard = self.bitboard
 
-        for i, char in enumerate(string_rep):
-            if char == "1":
-                result.append((i//8, i%8))
+        # Pop the most significant bit first to keep row-major order, (0, 0) is square 63
+        while bitboard:
+            square = bitboard.bit_length() - 1
+            result.append(divmod(63 - square, 8))
+            bitboard ^= 1 << square
 
-        return [(i//8, i%8) for i, char in enumerate(string_rep) if char == "1"]
+        return result
+
+    def squares(self) -> Iterator[int]:
+        """
+        Yields the square index of every position on the bitboard, lowest first (see
+        iter_squares)
+        """
+        return iter_squares(self.bitboard)
 
     def count(self) -> int:
         """
         Counts the number of pieces present on the bitboard
         """
-        bin_str = bin(self.bitboard)
-        return bin_str.count("1")
+        return self.bitboard.bit_count()
@@ -0,0 +1,159 @@
+"""
+Micro-benchmark of BitBoard allocations. Counts the BitBoard objects created and the time taken
+per call on the paths that still build BitBoards, piece_handler.get_moves, Board.check_move and
+Board.move (followed by unmake_move), over the legal moves of a few positions and their
+children. Also times the basic operators. Run from the repository root with
+`python -m src.chess_board.bitboard_benchmark`.
+"""
+
+import time
+import timeit
+
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+
+from resources import FENs
+from src.chess_board.bitboard import BitBoard
+from src.chess_board.board import Board
+from src.chess_board import piece_handler
+
+BENCHMARK_POSITIONS = [
+    ("initial", FENs.STARTING_FEN),
+    ("kiwipete", FENs.KIWIPETE_FEN),
+    ("middlegame", FENs.PERFT_MIDDLEGAME_FEN),
+]
+
+
+@contextmanager
+def count_allocations() -> Iterator[List[int]]:
+    """
+    Counts every BitBoard created inside the block, through any constructor
+
+    Yields:
+        counter (List[int]): Single element list holding the running count
+    """
+    counter = [0]
+    original_init = BitBoard.__init__
+    original_from_int = BitBoard.__dict__.get("from_int")
+
+    def counting_init(self, *args, **kwargs):
+        counter[0] += 1
+        original_init(self, *args, **kwargs)
+
+    BitBoard.__init__ = counting_init
+
+    # from_int skips __init__, so it is counted separately
+    if original_from_int is not None:
+        def counting_from_int(cls, bitboard):
+            counter[0] += 1
+            return original_from_int.__func__(cls, bitboard)
+
+        BitBoard.from_int = classmethod(counting_from_int)
+
+    try:
+        yield counter
+    finally:
+        BitBoard.__init__ = original_init
+
+        if original_from_int is not None:
+            BitBoard.from_int = original_from_int
+
+
+def _get_benchmark_boards(fen: str) -> List[Board]:
+    """
+    Returns the position of a FEN string followed by every position one legal move deep
+    """
+    board = Board(fen)
+    boards = [board]
+
+    for move in board.get_legal_moves():
+        board.make_move(*move)
+        boards.append(Board(board.get_fen()))
+        board.unmake_move()
+
+    return boards
+
+
+def _get_benchmark_calls(boards: List[Board]) -> List[Tuple[str, List[Callable[[], object]]]]:
+    """
+    Returns the calls to measure for every path, one per piece or legal move of every board
+    """
+    get_moves_calls = []
+    check_move_calls = []
+    move_calls = []
+
+    for board in boards:
+        legal_moves = board.get_legal_moves()
+
+        for start_coord in sorted({move[0] for move in legal_moves}):
+            piece = board.get_piece(*start_coord).lower()
+            get_moves_calls.append(
+                lambda board=board, start_coord=start_coord, piece=piece:
+                    piece_handler.get_moves(board, start_coord, piece)
+            )
+
+        for move in legal_moves:
+            check_move_calls.append(lambda board=board, move=move: board.check_move(*move))
+            move_calls.append(
+                lambda board=board, move=move: (board.move(*move), board.unmake_move())
+            )
+
+    return [
+        ("piece_handler.get_moves", get_moves_calls),
+        ("Board.check_move", check_move_calls),
+        ("Board.move + unmake_move", move_calls),
+    ]
+
+
+def run_benchmark() -> None:
+    """
+    Prints the BitBoards created and the time taken per call of every path for each benchmark
+    position, followed by the time per call of the common BitBoard operations
+    """
+    for name, fen in BENCHMARK_POSITIONS:
+        for label, calls in _get_benchmark_calls(_get_benchmark_boards(fen)):
+            with count_allocations() as counter:
+                for call in calls:
+                    call()
+
+            elapsed = float("inf")
+
+            for _ in range(3):
+                start = time.perf_counter()
+                for call in calls:
+                    call()
+                elapsed = min(elapsed, time.perf_counter() - start)
+
+            print(
+                f"{name:<12} {label:<26} {len(calls):>6} calls "
+                f"{counter[0] / len(calls):>8.2f} BitBoards {elapsed / len(calls) * 1e6:>8.1f} us"
+            )
+
+    operations = {
+        "a | b": "a | b",
+        "a - b": "a - b",
+        "a += b": "a += b",
+        "BitBoard(bitboard=a)": "BitBoard(bitboard=a)",
+        "BitBoard(coordinates=[...])": "BitBoard(coordinates=[(4, 4)])",
+    }
+
+    if hasattr(BitBoard, "from_int"):
+        operations["BitBoard.from_int(x)"] = "BitBoard.from_int(0xFF)"
+        operations["a.toggle_mask(x)"] = "a.toggle_mask(0xFF)"
+
+    setup = "a = BitBoard(coordinates=[(6, 0), (6, 7), (1, 0)]); b = BitBoard(coordinates=[(4, 4)])"
+
+    for label, operation in operations.items():
+        number = 200_000
+        elapsed = min(timeit.repeat(
+            operation,
+            setup=setup,
+            number=number,
+            repeat=3,
+            globals={"BitBoard": BitBoard},
+        ))
+        print(f"{label:<28} {elapsed / number * 1e9:>8.1f} ns")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,13 +1,53 @@
-import copy
+from typing import Tuple, Dict, List, NamedTuple, Optional
 
-from typing import Tuple, Dict, List
-
-from resources import FENs, hash_keys
-from resources.pieces import piece_tokens
+from resources import FENs
+from resources.pieces import piece_tokens, mailbox_pieces
 
 from src.chess_board import parsers
-from src.chess_board.bitboard import BitBoard
+from src.chess_board.bitboard import BitBoard, coord_to_square, get_lsb_square, square_to_coord
 from src.chess_board import piece_handler
+from src.chess_board import legal_moves
+from src.chess_board import moves
+from src.chess_board.attack_tables import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS
+from src.chess_board.sliding_attacks import get_bishop_attacks, get_rook_attacks
+from src.chess_board.incremental_updates import (
+    compute_hash, hash_piece, hash_piece_move, move_mailbox_piece, move_occupancy,
+    set_mailbox_square, switch_side, unmove_occupancy, update_castling, update_en_passant,
+    update_mailbox, update_occupancy,
+)
+
+
+class MoveRecord(NamedTuple):
+    """
+    Undo information pushed onto the move stack by Board.make_move. Holds everything that
+    cannot be recovered from the move itself.
+
+    Attributes:
+        start_coord (Tuple): Piece start coordinates
+        end_coord (Tuple): Piece end coordinates
+        piece (str): Lowercase type of the piece that was moved
+        promotion_piece_type (str): Piece type promoted to, if applicable
+        captured_piece (str): Lowercase type of the captured piece, None if no capture
+        captured_coord (Tuple): Square the captured piece stood on (differs from end_coord for
+            en passant captures)
+        castling (str): Castling state before the move
+        en_passant (BitBoard): En passant bitboard before the move
+        fifty_move (int): Fifty move counter before the move
+        moves (int): Full move counter before the move
+        zobrist_hash (int): Zobrist hash before the move
+    """
+    start_coord: Tuple[int, int]
+    end_coord: Tuple[int, int]
+    piece: str
+    promotion_piece_type: Optional[str]
+    captured_piece: Optional[str]
+    captured_coord: Optional[Tuple[int, int]]
+    castling: str
+    en_passant: BitBoard
+    fifty_move: int
+    moves: int
+    zobrist_hash: int
+
 
 class Board:
     """
@@ -21,17 +61,30 @@ class Board:
         moves (int): Number of moves in total
         black_positions (dict): Stores bitboards for all black pieces
         white_positions (dict): Stores bitboards for all white pieces
+        white_occupancy (int): Cached bitboard of all white pieces
+        black_occupancy (int): Cached bitboard of all black pieces
+        all_occupancy (int): Cached bitboard of all pieces
+        zobrist_hash (int): Zobrist hash of the position, updated incrementally by every move
+        mg_score (int): Middlegame material plus piece-square total, white positive (see
+            resources.evaluation_totals), updated incrementally with the mailbox
+        eg_score (int): Endgame material plus piece-square total, white positive
+        phase (int): Game phase counter, TOTAL_PHASE with every minor and major piece on the board
+        debug_hash (bool): If True, every move checks the incremental hash against a full
+            recompute
+        move_stack (list): Stack of MoveRecord entries used to unmake moves
     """
 
     def __init__(
         self,
-        fen_string: str = FENs.STARTING_FEN
+        fen_string: str = FENs.STARTING_FEN,
+        debug_hash: bool = False,
     ):
         """
         Constructor for the Board class by parsing FEN string
 
         Args:
             fen_string (str): FEN string representing the board state
+            debug_hash (bool): Verify the incremental Zobrist hash after every move
         """
         self.black_positions = {
             "p": BitBoard(),
@@ -61,6 +114,8 @@ class Board:
         # Use custom setter to initialize board_state dictionary
         self.board_state = components
 
+        self.move_stack = []
+
         board_rows = components[0].split("/")
         assert len(board_rows) == 8
 
@@ -81,6 +136,12 @@ class Board:
                     raise ValueError(f"Unexpected piece type: {char}")
                 j += 1
 
+        update_occupancy(self)
+        update_mailbox(self)
+
+        self.debug_hash = debug_hash
+        self.zobrist_hash = compute_hash(self)
+
     def get_color_bitboard(self, color: int) -> BitBoard:
         """
         Returns bitboard specifying the location of all pieces of a
@@ -93,16 +154,19 @@ class Board:
             bitboard (BitBoard): Bitboard object containing piece
                 location information
         """
-        bitboard = BitBoard()
+        return BitBoard.from_int(self.black_occupancy if color == -1 else self.white_occupancy)
 
-        if color == -1:
-            for _, black_position in self.black_positions.items():
-                bitboard += black_position
-        else:
-            for _, white_position in self.white_positions.items():
-                bitboard += white_position
+    def get_color_occupancy(self, color: int) -> int:
+        """
+        Returns the cached occupancy of a specified color as a plain integer
 
-        return bitboard
+        Args:
+            color (int): Specifies color of desired pieces
+
+        Returns:
+            occupancy (int): Integer bitboard of all pieces of that color
+        """
+        return self.black_occupancy if color == -1 else self.white_occupancy
 
     def check_overlap(self) -> None:
         """
@@ -137,17 +201,54 @@ class Board:
             piece (str): Single letter representation of the piece
         """
 
-        mask = 1 << 63 - (8 * row + col)
+        return mailbox_pieces[self.mailbox[63 - (8 * row + col)]]
 
-        for piece, black_position in self.black_positions.items():
-            if mask & black_position.bitboard:
-                return piece
+    def attacked_squares(self, color: int) -> int:
+        """
+        Returns every square attacked by one side in a single pass over its pieces, whether
+        the square is empty or occupied by either side
 
-        for piece, white_position in self.white_positions.items():
-            if mask & white_position.bitboard:
-                return piece.upper()
+        Args:
+            color (int): Color of the attacking side, 1 for white and -1 for black
 
-        return " "
+        Returns:
+            attacks (int): Bitboard of the attacked squares
+        """
+        positions = self.white_positions if color == 1 else self.black_positions
+
+        return legal_moves.get_attack_mask(positions, color, self.all_occupancy)
+
+    def is_square_attacked(self, square: int, by_color: int) -> bool:
+        """
+        Determines if a square is attacked by one side. Attacks are looked up in reverse from
+        the target square: a piece of each type placed on the square attacks exactly the
+        squares an opponent piece of that type could attack it from.
+
+        Args:
+            square (int): Square index of the target square (see bitboard.coord_to_square)
+            by_color (int): Color of the attacking side, 1 for white and -1 for black
+
+        Returns:
+            result (bool): True if any piece of by_color attacks the square
+        """
+        positions = self.white_positions if by_color == 1 else self.black_positions
+
+        # A pawn of the defending color on the square attacks the attacking pawns' squares
+        if PAWN_ATTACKS[-by_color][square] & positions["p"].bitboard:
+            return True
+        if KNIGHT_ATTACKS[square] & positions["n"].bitboard:
+            return True
+        if KING_ATTACKS[square] & positions["k"].bitboard:
+            return True
+
+        queens = positions["q"].bitboard
+
+        if get_bishop_attacks(square, self.all_occupancy) & (positions["b"].bitboard | queens):
+            return True
+
+        return bool(
+            get_rook_attacks(square, self.all_occupancy) & (positions["r"].bitboard | queens)
+        )
 
     def in_check(
         self,
@@ -166,57 +267,17 @@ class Board:
                 opponent pieces
         """
         to_move = self.board_state["to_move"]
-        self.board_state["to_move"] *= -1  # Change to opponents move for piece targeting
-
-        if to_move == 1:
-            king_bitboard = self.white_positions["k"]
-            opponent_positions = self.black_positions
-        else:
-            king_bitboard = self.black_positions["k"]
-            opponent_positions = self.white_positions
-
-        target_bitboard = BitBoard()
-
-        # Handle pawn moves separately, pawn movement action does not imply the ability to capture
-        pawn_bitboard = BitBoard()
-        pawn_positions = opponent_positions["p"].get_coordinates()
-
-        for position in pawn_positions:
-            pawn_bitboard += piece_handler.get_pawn_moves(
-                board=self,
-                position=position,
-                captures_only=True,
-            )
-
-        target_bitboard += pawn_bitboard
-
-        # Process remaining pieces
-        target_move_functions = [
-            (piece_handler.get_knight_moves, "n"),
-            (piece_handler.get_bishop_moves, "b"),
-            (piece_handler.get_rook_moves, "r"),
-            (piece_handler.get_queen_moves, "q"),
-        ]
-
-        for func, piece_type in target_move_functions:
-            piece_bitboard = BitBoard()
-            piece_positions = opponent_positions[piece_type].get_coordinates()
-
-            for position in piece_positions:
-                piece_bitboard += func(
-                    board=self,
-                    position=position,
-                )
 
-            target_bitboard += piece_bitboard
+        if return_target_bitboard:
+            return BitBoard.from_int(self.attacked_squares(-to_move))
 
-        # Reset to_move to original state
-        self.board_state["to_move"] *= -1
+        king_bitboard = self.white_positions["k"] if to_move == 1 else self.black_positions["k"]
 
-        if return_target_bitboard:
-            return target_bitboard
+        # A side without a king (test positions) is never in check
+        if not king_bitboard.bitboard:
+            return False
 
-        return (target_bitboard - king_bitboard) != target_bitboard
+        return self.is_square_attacked(king_bitboard.bitboard.bit_length() - 1, -to_move)
 
     def handle_king_moves(
         self,
@@ -239,49 +300,67 @@ class Board:
         opponent_pieces = self.black_positions \
             if self.board_state["to_move"] == 1 else self.white_positions
 
-        start_bitboard = BitBoard(coordinates=[start_coord])
-        end_bitboard = BitBoard(coordinates=[end_coord])
+        start_mask = 1 << coord_to_square(*start_coord)
+        end_mask = 1 << coord_to_square(*end_coord)
+
+        king = "K" if self.board_state["to_move"] == 1 else "k"
+        rook = "R" if self.board_state["to_move"] == 1 else "r"
 
         if start_coord[1] - end_coord[1] == 2:  # Queenside castling
-            friendly_pieces["k"] -= start_bitboard
-            friendly_pieces["k"] += end_bitboard
+            friendly_pieces["k"].toggle_mask(start_mask | end_mask)
+            hash_piece_move(self, self.board_state["to_move"], "k", start_coord, end_coord)
 
-            rook_start_bitboard = BitBoard(coordinates=[(start_coord[0], 0)])
-            rook_end_bitboard = BitBoard(coordinates=[(start_coord[0], 3)])
+            rook_mask = (1 << coord_to_square(start_coord[0], 0)) | \
+                (1 << coord_to_square(start_coord[0], 3))
 
-            friendly_pieces["r"] -= rook_start_bitboard
-            friendly_pieces["r"] += rook_end_bitboard
+            friendly_pieces["r"].toggle_mask(rook_mask)
+            hash_piece_move(self, self.board_state["to_move"], "r", (start_coord[0], 0),
+                            (start_coord[0], 3))
+            move_mailbox_piece(self, (start_coord[0], 0), (start_coord[0], 3), rook)
+
+            move_occupancy(self, start_mask | end_mask | rook_mask)
 
         elif start_coord[1] - end_coord[1] == -2: # Kingside castling
-            friendly_pieces["k"] -= start_bitboard
-            friendly_pieces["k"] += end_bitboard
+            friendly_pieces["k"].toggle_mask(start_mask | end_mask)
+            hash_piece_move(self, self.board_state["to_move"], "k", start_coord, end_coord)
+
+            rook_mask = (1 << coord_to_square(start_coord[0], 7)) | \
+                (1 << coord_to_square(start_coord[0], 5))
 
-            rook_start_bitboard = BitBoard(coordinates=[(start_coord[0], 7)])
-            rook_end_bitboard = BitBoard(coordinates=[(start_coord[0], 5)])
+            friendly_pieces["r"].toggle_mask(rook_mask)
+            hash_piece_move(self, self.board_state["to_move"], "r", (start_coord[0], 7),
+                            (start_coord[0], 5))
+            move_mailbox_piece(self, (start_coord[0], 7), (start_coord[0], 5), rook)
 
-            friendly_pieces["r"] -= rook_start_bitboard
-            friendly_pieces["r"] += rook_end_bitboard
+            move_occupancy(self, start_mask | end_mask | rook_mask)
 
         else:
             # Update friendly pieces
-            friendly_pieces["k"] -= start_bitboard
-            friendly_pieces["k"] += end_bitboard
+            friendly_pieces["k"].toggle_mask(start_mask | end_mask)
+            hash_piece_move(self, self.board_state["to_move"], "k", start_coord, end_coord)
 
-            # Remove captured pieces
-            for piece in opponent_pieces:
-                opponent_pieces[piece] -= end_bitboard
+            # Remove captured piece
+            captured_piece = self.get_piece(*end_coord)
+            if captured_piece != " ":
+                opponent_pieces[captured_piece.lower()].clear_mask(end_mask)
+
+            move_occupancy(self, start_mask | end_mask, end_mask)
+
+        move_mailbox_piece(self, start_coord, end_coord, king)
 
         # Any king move (non-castling moves included) forfeits the right to castle in the future
         if self.board_state["castling"] == "-":
             return
 
         if self.board_state["to_move"] == 1:
-            self.board_state["castling"] = "--" + self.board_state["castling"][2:]
+            castling_state = "--" + self.board_state["castling"][2:]
         else:
-            self.board_state["castling"] = self.board_state["castling"][:2] + "--"
+            castling_state = self.board_state["castling"][:2] + "--"
+
+        if castling_state == "----":
+            castling_state = "-"
 
-        if self.board_state["castling"] == "----":
-            self.board_state["castling"] = "-"
+        update_castling(self, castling_state)
 
     def handle_pawn_moves(
         self,
@@ -307,48 +386,66 @@ class Board:
         opponent_pieces = self.black_positions \
             if self.board_state["to_move"] == 1 else self.white_positions
 
-        start_bitboard = BitBoard(coordinates=[start_coord])
-        end_bitboard = BitBoard(coordinates=[end_coord])
+        start_mask = 1 << coord_to_square(*start_coord)
+        end_mask = 1 << coord_to_square(*end_coord)
+
+        pawn = "P" if self.board_state["to_move"] == 1 else "p"
+        captured_piece = self.get_piece(*end_coord)
 
         if abs(start_coord[0] - end_coord[0]) == 2:
             # Update friendly pieces
-            friendly_pieces["p"] -= start_bitboard
-            friendly_pieces["p"] += end_bitboard
+            friendly_pieces["p"].toggle_mask(start_mask | end_mask)
+            hash_piece_move(self, self.board_state["to_move"], "p", start_coord, end_coord)
+
+            move_occupancy(self, start_mask | end_mask)
 
             # Set the en_passant bitboard
-            self.board_state["en_passant"] = BitBoard(
-                coordinates=[(end_coord[0] + self.board_state["to_move"], end_coord[1])]
-            )
+            update_en_passant(self, BitBoard.from_int(
+                1 << coord_to_square(end_coord[0] + self.board_state["to_move"], end_coord[1])
+            ))
         elif self.board_state["en_passant"].is_occupied(*end_coord):
             # Update friendly pieces
-            friendly_pieces["p"] -= start_bitboard
-            friendly_pieces["p"] += end_bitboard
+            friendly_pieces["p"].toggle_mask(start_mask | end_mask)
+            hash_piece_move(self, self.board_state["to_move"], "p", start_coord, end_coord)
 
             # Remove captured piece
-            capture_bitboard = BitBoard(
-                coordinates=[(end_coord[0] + self.board_state["to_move"], end_coord[1])]
-            )
-            opponent_pieces["p"] -= capture_bitboard
+            capture_coord = (end_coord[0] + self.board_state["to_move"], end_coord[1])
+            capture_mask = 1 << coord_to_square(*capture_coord)
+            opponent_pieces["p"].clear_mask(capture_mask)
+            set_mailbox_square(self, capture_coord)
+
+            move_occupancy(self, start_mask | end_mask, capture_mask)
         elif end_coord[0] == 0 or end_coord[0] == 7:  # Promotions
             if promotion_piece_type is None:
                 raise ValueError("Need to specify piece type for promotion move: n, b, r or q")
 
             # Update friendly pieces
-            friendly_pieces["p"] -= start_bitboard
-            friendly_pieces[promotion_piece_type] += end_bitboard
+            friendly_pieces["p"].clear_mask(start_mask)
+            friendly_pieces[promotion_piece_type].set_mask(end_mask)
+            hash_piece(self, self.board_state["to_move"], "p", start_coord)
+            hash_piece(self, self.board_state["to_move"], promotion_piece_type, end_coord)
 
-            # Remove captured pieces
-            for piece in opponent_pieces:
-                opponent_pieces[piece] -= end_bitboard
+            # Remove captured piece
+            if captured_piece != " ":
+                opponent_pieces[captured_piece.lower()].clear_mask(end_mask)
+
+            move_occupancy(self, start_mask | end_mask, end_mask)
+
+            pawn = promotion_piece_type.upper() if self.board_state["to_move"] == 1 \
+                else promotion_piece_type
         else:
             # Update friendly pieces
-            friendly_pieces["p"] -= start_bitboard
-            friendly_pieces["p"] += end_bitboard
+            friendly_pieces["p"].toggle_mask(start_mask | end_mask)
+            hash_piece_move(self, self.board_state["to_move"], "p", start_coord, end_coord)
+
+            # Remove captured piece
+            if captured_piece != " ":
+                opponent_pieces[captured_piece.lower()].clear_mask(end_mask)
+
+            move_occupancy(self, start_mask | end_mask, end_mask)
+
+        move_mailbox_piece(self, start_coord, end_coord, pawn)
 
-            # Remove captured pieces
-            for piece in opponent_pieces:
-                opponent_pieces[piece] -= end_bitboard
-    
     def check_rook_positions(
         self,
     ) -> None:
@@ -398,31 +495,32 @@ class Board:
         if castling_state == "----":
             castling_state = "-"
         
-        self.board_state["castling"] = castling_state
+        update_castling(self, castling_state)
 
     def move(
         self,
-        start_coord: Tuple[int, int],
-        end_coord: Tuple[int, int],
+        start_coord: Tuple[int, int] | int,
+        end_coord: Tuple[int, int] = None,
         promotion_piece_type: str = None,
     ) -> None:
         """
         Verifies and executes move on the board
 
         Args:
-            start_coords (Tuple): Tuple specifying start coordinates
+            start_coords (Tuple | int): Tuple specifying start coordinates, or a packed move
+                (see moves) in which case the remaining arguments are ignored
             end_coords (Tuple): Tuple specifying end coordinates
             promotion_piece_type (str): String specifying which piece to promote to, if applicable
 
         Returns:
             None
         """
+        if isinstance(start_coord, int):
+            start_coord, end_coord, promotion_piece_type = moves.move_to_tuple(start_coord)
+
         friendly_pieces = self.white_positions \
             if self.board_state["to_move"] == 1 else self.black_positions
 
-        opponent_pieces = self.black_positions \
-            if self.board_state["to_move"] == 1 else self.white_positions
-
         piece_found = False
 
         for selected_piece, piece_bitboard in friendly_pieces.items():
@@ -445,6 +543,73 @@ class Board:
                 f"Illegal move {start_coord}, {end_coord}" + f"\n{str(legal_moves)}"
             )
 
+        self.make_move(
+            start_coord,
+            end_coord,
+            promotion_piece_type,
+        )
+
+        self.check_overlap()
+
+    def make_move(
+        self,
+        start_coord: Tuple[int, int] | int,
+        end_coord: Tuple[int, int] = None,
+        promotion_piece_type: str = None,
+    ) -> None:
+        """
+        Executes a move on the board without verifying it, pushing the information needed to
+        reverse it onto the move stack. The move is assumed to be pseudo-legal.
+
+        Args:
+            start_coords (Tuple | int): Tuple specifying start coordinates, or a packed move
+                (see moves) in which case the remaining arguments are ignored
+            end_coords (Tuple): Tuple specifying end coordinates
+            promotion_piece_type (str): String specifying which piece to promote to, if applicable
+
+        Returns:
+            None
+        """
+        if isinstance(start_coord, int):
+            start_coord, end_coord, promotion_piece_type = moves.move_to_tuple(start_coord)
+
+        selected_piece = self.get_piece(*start_coord).lower()
+
+        if selected_piece == " ":
+            raise ValueError("ERROR: No friendly piece in selected square")
+
+        if selected_piece == "p" and end_coord[0] in (0, 7) and promotion_piece_type is None:
+            raise ValueError("Need to specify piece type for promotion move: n, b, r or q")
+
+        # Work out which piece (if any) is captured before the board is modified
+        if selected_piece == "p" and self.board_state["en_passant"].is_occupied(*end_coord):
+            captured_coord = (end_coord[0] + self.board_state["to_move"], end_coord[1])
+            captured_piece = "p"
+        else:
+            captured_coord = end_coord
+            captured_piece = self.get_piece(*end_coord).lower()
+
+            if captured_piece == " ":
+                captured_coord = None
+                captured_piece = None
+
+        self.move_stack.append(MoveRecord(
+            start_coord=start_coord,
+            end_coord=end_coord,
+            piece=selected_piece,
+            promotion_piece_type=promotion_piece_type if selected_piece == "p" else None,
+            captured_piece=captured_piece,
+            captured_coord=captured_coord,
+            castling=self.board_state["castling"],
+            en_passant=self.board_state["en_passant"],
+            fifty_move=self.board_state["fifty_move"],
+            moves=self.board_state["moves"],
+            zobrist_hash=self.zobrist_hash,
+        ))
+
+        if captured_piece is not None:
+            hash_piece(self, -self.board_state["to_move"], captured_piece, captured_coord)
+
         # Pawn and king moves need to be handled separately to deal with castling and en passant.
         # These moves require two pieces on different squares to be updated concurrently
         if selected_piece == "p":
@@ -459,144 +624,279 @@ class Board:
                 end_coord,
             )
         else:
-            start_bitboard = BitBoard(coordinates=[start_coord])
-            end_bitboard = BitBoard(coordinates=[end_coord])
+            friendly_pieces = self.white_positions \
+                if self.board_state["to_move"] == 1 else self.black_positions
+
+            opponent_pieces = self.black_positions \
+                if self.board_state["to_move"] == 1 else self.white_positions
+
+            start_mask = 1 << coord_to_square(*start_coord)
+            end_mask = 1 << coord_to_square(*end_coord)
 
             # Update friendly piece
-            piece_bitboard = friendly_pieces[selected_piece]
-            friendly_pieces[selected_piece] = piece_bitboard ^ start_bitboard
-            friendly_pieces[selected_piece] += end_bitboard
+            friendly_pieces[selected_piece].toggle_mask(start_mask | end_mask)
+            hash_piece_move(self, self.board_state["to_move"], selected_piece, start_coord,
+                            end_coord)
 
             # Update opponent piece (if any)
-            for piece in opponent_pieces:
-                opponent_pieces[piece] -= end_bitboard
+            if captured_piece is not None:
+                opponent_pieces[captured_piece].clear_mask(end_mask)
+
+            move_occupancy(self, start_mask | end_mask, end_mask)
+
+            move_mailbox_piece(
+                self,
+                start_coord,
+                end_coord,
+                selected_piece.upper() if self.board_state["to_move"] == 1 else selected_piece,
+            )
 
         self.check_rook_positions()
 
-        if selected_piece != "p":
-            # Reset en passant bitboard (if last pawn move was a two square advance)
-            self.board_state["en_passant"] = BitBoard()
+        if selected_piece != "p" or abs(start_coord[0] - end_coord[0]) != 2:
+            # En passant is only possible directly after a two square advance
+            update_en_passant(self, BitBoard.from_int(0))
+
+        if selected_piece == "p" or captured_piece is not None:
+            self.board_state["fifty_move"] = 0
+        else:
+            self.board_state["fifty_move"] += 1
 
         if self.board_state["to_move"] == -1:  # Updated once every "full" move
             self.board_state["moves"] += 1
 
+        switch_side(self)
+
+        if self.debug_hash:
+            assert self.zobrist_hash == compute_hash(self), \
+                f"Incremental hash mismatch after move {start_coord}, {end_coord}"
+
+    def unmake_move(self) -> None:
+        """
+        Reverses the last move made with make_move (or move), restoring the board exactly to the
+        state it was in before that move.
+
+        Returns:
+            None
+        """
+        if not self.move_stack:
+            raise ValueError("ERROR: No move to unmake")
+
+        record = self.move_stack.pop()
+
         self.board_state["to_move"] = self.board_state["to_move"] * -1
 
-        self.check_overlap()
+        friendly_pieces = self.white_positions \
+            if self.board_state["to_move"] == 1 else self.black_positions
+
+        opponent_pieces = self.black_positions \
+            if self.board_state["to_move"] == 1 else self.white_positions
+
+        start_row, start_col = record.start_coord
+        end_row, end_col = record.end_coord
+
+        # Move the piece back, turning promoted pieces back into pawns
+        end_piece = record.promotion_piece_type or record.piece
+        friendly_pieces[end_piece].unset(end_row, end_col)
+        friendly_pieces[record.piece].set(start_row, start_col)
+
+        to_token = str.upper if self.board_state["to_move"] == 1 else str.lower
+        move_mailbox_piece(self, record.end_coord, record.start_coord, to_token(record.piece))
+
+        friendly_toggle = (1 << coord_to_square(start_row, start_col)) | \
+            (1 << coord_to_square(end_row, end_col))
+
+        # Move the rook back for castling moves
+        if record.piece == "k" and start_col - end_col == 2:
+            friendly_pieces["r"].unset(start_row, 3)
+            friendly_pieces["r"].set(start_row, 0)
+            move_mailbox_piece(self, (start_row, 3), (start_row, 0), to_token("r"))
+            friendly_toggle |= (1 << coord_to_square(start_row, 3)) | \
+                (1 << coord_to_square(start_row, 0))
+        elif record.piece == "k" and start_col - end_col == -2:
+            friendly_pieces["r"].unset(start_row, 5)
+            friendly_pieces["r"].set(start_row, 7)
+            move_mailbox_piece(self, (start_row, 5), (start_row, 7), to_token("r"))
+            friendly_toggle |= (1 << coord_to_square(start_row, 5)) | \
+                (1 << coord_to_square(start_row, 7))
+
+        captured_mask = 0
+
+        if record.captured_piece is not None:
+            opponent_pieces[record.captured_piece].set(*record.captured_coord)
+            set_mailbox_square(
+                self,
+                record.captured_coord,
+                record.captured_piece.lower() if self.board_state["to_move"] == 1
+                else record.captured_piece.upper(),
+            )
+            captured_mask = 1 << coord_to_square(*record.captured_coord)
+
+        unmove_occupancy(self, friendly_toggle, captured_mask)
+
+        self.board_state["castling"] = record.castling
+        self.board_state["en_passant"] = record.en_passant
+        self.board_state["fifty_move"] = record.fifty_move
+        self.board_state["moves"] = record.moves
+        self.zobrist_hash = record.zobrist_hash
+
+        if self.debug_hash:
+            assert self.zobrist_hash == compute_hash(self), \
+                f"Incremental hash mismatch after unmaking {record.start_coord}, {record.end_coord}"
+
+    def make_null_move(self) -> None:
+        """
+        Passes the turn to the opponent without moving a piece, as used by null move pruning.
+        The record pushed onto the move stack has no start or end coordinates and must be
+        reversed with unmake_null_move. The fifty move counter restarts, so no repetition is
+        detected across the null move.
+
+        Returns:
+            None
+        """
+        self.move_stack.append(MoveRecord(
+            start_coord=None,
+            end_coord=None,
+            piece=None,
+            promotion_piece_type=None,
+            captured_piece=None,
+            captured_coord=None,
+            castling=self.board_state["castling"],
+            en_passant=self.board_state["en_passant"],
+            fifty_move=self.board_state["fifty_move"],
+            moves=self.board_state["moves"],
+            zobrist_hash=self.zobrist_hash,
+        ))
+
+        update_en_passant(self, BitBoard.from_int(0))
+        self.board_state["fifty_move"] = 0
+
+        if self.board_state["to_move"] == -1:
+            self.board_state["moves"] += 1
+
+        switch_side(self)
+
+    def unmake_null_move(self) -> None:
+        """
+        Reverses the last move made with make_null_move
+
+        Returns:
+            None
+        """
+        if not self.move_stack or self.move_stack[-1].piece is not None:
+            raise ValueError("ERROR: No null move to unmake")
+
+        record = self.move_stack.pop()
+
+        self.board_state["to_move"] = self.board_state["to_move"] * -1
+        self.board_state["en_passant"] = record.en_passant
+        self.board_state["fifty_move"] = record.fifty_move
+        self.board_state["moves"] = record.moves
+        self.zobrist_hash = record.zobrist_hash
 
     def check_move(
         self,
-        start_coord: Tuple[int, int],
-        end_coord: Tuple[int, int],
+        start_coord: Tuple[int, int] | int,
+        end_coord: Tuple[int, int] = None,
         promotion_piece_type: str = None,
     ) -> bool:
         """
-        Returns True if a move is legal, False otherwise
+        Returns True if a pseudo-legal move is legal, False otherwise. The move is made and
+        unmade in place, leaving the board unchanged.
 
         Args:
-            start_coords (Tuple): Tuple specifying start coordinates
+            start_coords (Tuple | int): Tuple specifying start coordinates, or a packed move
             end_coords (Tuple): Tuple specifying end coordinates
             promotion_piece_type (str): String specifying which piece to promote to, if applicable
 
         Returns:
             result (bool): Boolean value specifying whether or not move is legal
         """
-        # Create a new copy of the board to execute the move on
-        temp_board = copy.deepcopy(self)
-
-        # Execute_move
-        temp_board.move(
+        self.make_move(
             start_coord,
             end_coord,
             promotion_piece_type,
         )
-        temp_board.board_state["to_move"] = self.board_state["to_move"]
 
-        return not temp_board.in_check()
+        # Check whether the player who just moved left their own king in check
+        opponent = self.board_state["to_move"]
+        king_bitboard = self.black_positions["k"] if opponent == 1 else self.white_positions["k"]
+        in_check = bool(king_bitboard.bitboard) and \
+            self.is_square_attacked(king_bitboard.bitboard.bit_length() - 1, opponent)
+
+        self.unmake_move()
+
+        return not in_check
 
     def get_legal_moves(
-        self
+        self,
+        captures_only: bool = False,
     ) -> List[Tuple[Tuple, Tuple, str]]:
         """
-        Returns a list of legal moves on the given board in the form of a tuple.
+        Returns a list of legal moves on the given board in the form of a tuple. Moves are
+        generated legal directly from the checkers and pins of the position, see legal_moves.
+
+        Args:
+            captures_only (bool): Only return captures and promotions. Quiet moves are never
+                generated in this mode
 
         Returns:
             legal_moves: Tuple in the form -> (<start_coord>, <end_coord>, <promotion_piece_type>)
         """
+        return legal_moves.get_legal_moves(self, captures_only)
 
-        pseudo_legal_moves = []
-
-        friendly_pieces = self.white_positions if self.board_state["to_move"] == 1 \
-            else self.black_positions
-
-        for piece, piece_bitboard in friendly_pieces.items():
-            piece_coordinates = piece_bitboard.get_coordinates()
-
-            for coord in piece_coordinates:
-                end_coords = piece_handler.get_moves(
-                    board=self,
-                    position=coord,
-                    piece_type=piece,
-                ).get_coordinates()
+    def get_fen(self) -> str:
+        """
+        Returns the FEN string of the current position, castling rights are written in the
+        same positional KQkq format the constructor accepts so the result round trips
 
-                pseudo_legal_moves += zip(
-                    [coord] * len(end_coords),
-                    end_coords,
-                    [None] * len(end_coords),
-                )
-        
-        for i, move in enumerate(pseudo_legal_moves):
-            if (move[1][0] == 0 or move[1][0] == 7) and move[2] is not None:
-                promotion_move = pseudo_legal_moves.pop(i)
+        Returns:
+            fen_string (str): FEN string representing the board state
+        """
+        rows = []
 
-                all_promotions = [
-                    (promotion_move[0], promotion_move[1], "b"),
-                    (promotion_move[0], promotion_move[1], "n"),
-                    (promotion_move[0], promotion_move[1], "r"),
-                    (promotion_move[0], promotion_move[1], "q"),
-                ]
+        for row_num in range(8):
+            row = ""
+            empty = 0
 
-                pseudo_legal_moves += all_promotions
+            for col_num in range(8):
+                piece = self.get_piece(row_num, col_num)
 
-        return [move for move in pseudo_legal_moves if self.check_move(*move)]
-    
-    def hash(self):
+                if piece == " ":
+                    empty += 1
+                    continue
+
+                if empty:
+                    row += str(empty)
+                    empty = 0
+                row += piece
+
+            if empty:
+                row += str(empty)
+            rows.append(row)
+
+        en_passant = self.board_state["en_passant"].bitboard
+        en_passant = parsers.index_to_alphanumeric(square_to_coord(get_lsb_square(en_passant))) \
+            if en_passant else "-"
+
+        return " ".join([
+            "/".join(rows),
+            "w" if self.board_state["to_move"] == 1 else "b",
+            self.board_state["castling"],
+            en_passant,
+            str(self.board_state["fifty_move"]),
+            str(self.board_state["moves"]),
+        ])
+
+    def hash(self) -> int:
         """
-        Returns the hash value of the current position using Zobrist hash keys specified in the
-        resources directory.
+        Returns the hash value of the current position. The value is kept up to date
+        incrementally by every move, so this is a constant time read.
 
         Returns:
             hash (int): Hashed value of the board position
         """
-        hash = 0
-        hash_key_dict = hash_keys.HASH_KEYS
-
-        # Process white piece positions
-        for piece, piece_bitboard in self.white_positions.items():
-            for coord in piece_bitboard.get_coordinates():
-                coord_key = f"{coord[0]}{coord[1]}"
-                hash = hash ^ hash_key_dict["position"][coord_key][piece]
-
-        # Process black piece positions
-        for piece, piece_bitboard in self.black_positions.items():
-            for coord in piece_bitboard.get_coordinates():
-                coord_key = f"{coord[0]}{coord[1]}"
-                hash = hash ^ hash_key_dict["position"][coord_key][piece]
-
-        # Process castling state
-        hash = hash ^ hash_key_dict["castling"][self.board_state["castling"]]
-
-        # Process en passant
-        en_passant_square = self.board_state["en_passant"].get_coordinates()
-
-        if len(en_passant_square) == 1:
-            hash = hash ^ hash_key_dict["en_passant"][en_passant_square[0][1]]
-
-        # Process to_move state
-        if self.board_state["to_move"] == 1:
-            hash = hash ^ hash_key_dict["to_move"]
-
-        return hash
+        return self.zobrist_hash
 
     def __str__(self) -> None:
         self.check_overlap()
@@ -670,7 +970,7 @@ class Board:
                   state[1] not in set("12345678")):
                 raise ValueError(f"Invalid en passant string: {state}")
 
-            coords = parsers.alphanumeric_to_index(state)
+            coords, _ = parsers.alphanumeric_to_index(state)
             return BitBoard(coordinates=[coords])
 
         raise ValueError(
@@ -0,0 +1,362 @@
+"""
+File containing the caches a Board keeps alongside its piece bitboards and how they are kept up
+to date: the occupancy bitboards, the mailbox with the evaluation totals built on it, and the
+Zobrist hash. Each cache has a function that rebuilds it from scratch and functions that update
+it for a single change, which Board.make_move and Board.unmake_move call for every piece they
+move.
+
+The evaluation totals are the middlegame and endgame material plus piece-square totals (white
+positive) and the game phase, see resources.piece_square_tables.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from resources import hash_keys
+from resources.pieces import piece_indices, mailbox_values
+from resources.piece_square_tables import (
+    MG_MAILBOX_SCORES,
+    EG_MAILBOX_SCORES,
+    PHASE_MAILBOX_VALUES,
+)
+
+from src.chess_board.bitboard import BitBoard, coord_to_square, get_lsb_square, square_to_coord
+
+# Zobrist key of every castling state: the XOR of the keys of all rights still available
+CASTLING_STATE_KEYS = {}
+
+for castling_rights in range(16):
+    castling_state = "".join(
+        right if castling_rights & (1 << i) else "-" for i, right in enumerate("KQkq")
+    )
+    castling_key = 0
+
+    for i in range(4):
+        if castling_rights & (1 << i):
+            castling_key ^= hash_keys.CASTLING_KEYS[i]
+
+    CASTLING_STATE_KEYS["-" if castling_state == "----" else castling_state] = castling_key
+
+
+def update_occupancy(board: Board) -> None:
+    """
+    Recomputes the cached occupancy bitboards from the piece bitboards. Only needed after
+    piece bitboards are modified directly, moves keep the caches up to date incrementally.
+
+    Args:
+        board (Board): Board to update
+
+    Returns:
+        None
+    """
+    board.white_occupancy = 0
+    board.black_occupancy = 0
+
+    for _, white_position in board.white_positions.items():
+        board.white_occupancy |= white_position.bitboard
+
+    for _, black_position in board.black_positions.items():
+        board.black_occupancy |= black_position.bitboard
+
+    board.all_occupancy = board.white_occupancy | board.black_occupancy
+
+
+def move_occupancy(
+    board: Board,
+    friendly_toggle: int,
+    opponent_clear: int = 0,
+) -> None:
+    """
+    Incrementally updates the cached occupancy bitboards for a move by the player to move
+
+    Args:
+        board (Board): Board to update
+        friendly_toggle (int): Squares vacated or entered by the player's own pieces
+        opponent_clear (int): Squares of captured opponent pieces
+
+    Returns:
+        None
+    """
+    if board.board_state["to_move"] == 1:
+        board.white_occupancy ^= friendly_toggle
+        board.black_occupancy &= ~opponent_clear
+    else:
+        board.black_occupancy ^= friendly_toggle
+        board.white_occupancy &= ~opponent_clear
+
+    board.all_occupancy = board.white_occupancy | board.black_occupancy
+
+
+def unmove_occupancy(
+    board: Board,
+    friendly_toggle: int,
+    opponent_restore: int = 0,
+) -> None:
+    """
+    Reverses move_occupancy for the last move, called once the player to move has been
+    switched back to the player who made it
+
+    Args:
+        board (Board): Board to update
+        friendly_toggle (int): Squares vacated or entered by the player's own pieces
+        opponent_restore (int): Squares of the captured opponent pieces to put back
+
+    Returns:
+        None
+    """
+    if board.board_state["to_move"] == 1:
+        board.white_occupancy ^= friendly_toggle
+        board.black_occupancy |= opponent_restore
+    else:
+        board.black_occupancy ^= friendly_toggle
+        board.white_occupancy |= opponent_restore
+
+    board.all_occupancy = board.white_occupancy | board.black_occupancy
+
+
+def update_mailbox(board: Board) -> None:
+    """
+    Rebuilds the mailbox, a 64 entry bytearray holding the piece on every square (see
+    resources.pieces.mailbox_pieces), and the evaluation totals from the piece bitboards. Only
+    needed after piece bitboards are modified directly, moves keep both in sync incrementally.
+
+    Args:
+        board (Board): Board to update
+
+    Returns:
+        None
+    """
+    board.mailbox = bytearray(64)
+
+    for piece, white_position in board.white_positions.items():
+        for square in white_position.squares():
+            board.mailbox[square] = mailbox_values[piece.upper()]
+
+    for piece, black_position in board.black_positions.items():
+        for square in black_position.squares():
+            board.mailbox[square] = mailbox_values[piece]
+
+    board.mg_score, board.eg_score, board.phase = compute_totals(board.mailbox)
+
+
+def compute_totals(mailbox: bytearray) -> Tuple[int, int, int]:
+    """
+    Computes the evaluation totals from scratch from a mailbox
+
+    Args:
+        mailbox (bytearray): Mailbox value of every square (see resources.pieces.mailbox_pieces)
+
+    Returns:
+        mg_score (int): Middlegame material plus piece-square total, white positive
+        eg_score (int): Endgame material plus piece-square total, white positive
+        phase (int): Game phase counter
+    """
+    mg_score = eg_score = phase = 0
+
+    for square, value in enumerate(mailbox):
+        mg_score += MG_MAILBOX_SCORES[value * 64 + square]
+        eg_score += EG_MAILBOX_SCORES[value * 64 + square]
+        phase += PHASE_MAILBOX_VALUES[value]
+
+    return mg_score, eg_score, phase
+
+
+def set_mailbox_square(
+    board: Board,
+    coord: Tuple[int, int],
+    piece: str = " ",
+) -> None:
+    """
+    Sets the piece on a square of the mailbox, moving the evaluation totals from the piece
+    that stood there (if any) to the new one
+
+    Args:
+        board (Board): Board to update
+        coord (Tuple): Coordinates of the square
+        piece (str): Single letter representation of the piece, " " for an empty square
+
+    Returns:
+        None
+    """
+    square = 63 - (8 * coord[0] + coord[1])
+    old_value = board.mailbox[square]
+    value = mailbox_values[piece]
+    old_index = old_value * 64 + square
+    new_index = value * 64 + square
+
+    board.mg_score += MG_MAILBOX_SCORES[new_index] - MG_MAILBOX_SCORES[old_index]
+    board.eg_score += EG_MAILBOX_SCORES[new_index] - EG_MAILBOX_SCORES[old_index]
+    board.phase += PHASE_MAILBOX_VALUES[value] - PHASE_MAILBOX_VALUES[old_value]
+    board.mailbox[square] = value
+
+
+def move_mailbox_piece(
+    board: Board,
+    start_coord: Tuple[int, int],
+    end_coord: Tuple[int, int],
+    piece: str,
+) -> None:
+    """
+    Moves a piece between two squares of the mailbox, replacing any piece on the end square
+
+    Args:
+        board (Board): Board to update
+        start_coord (Tuple): Coordinates of the square the piece leaves
+        end_coord (Tuple): Coordinates of the square the piece enters
+        piece (str): Single letter representation of the piece on the end square
+
+    Returns:
+        None
+    """
+    set_mailbox_square(board, start_coord)
+    set_mailbox_square(board, end_coord, piece)
+
+
+def compute_hash(board: Board) -> int:
+    """
+    Computes the hash value of a position from scratch using Zobrist hash keys specified in
+    the resources directory.
+
+    Args:
+        board (Board): Position to hash
+
+    Returns:
+        hash (int): Hashed value of the board position
+    """
+    hash = 0
+
+    # Process white piece positions
+    for piece, piece_bitboard in board.white_positions.items():
+        piece_offset = piece_indices[piece.upper()] * 64
+
+        for square in piece_bitboard.squares():
+            hash = hash ^ hash_keys.PIECE_SQUARE_KEYS[piece_offset + square]
+
+    # Process black piece positions
+    for piece, piece_bitboard in board.black_positions.items():
+        piece_offset = piece_indices[piece] * 64
+
+        for square in piece_bitboard.squares():
+            hash = hash ^ hash_keys.PIECE_SQUARE_KEYS[piece_offset + square]
+
+    # Process castling state
+    hash = hash ^ CASTLING_STATE_KEYS[board.board_state["castling"]]
+
+    # Process en passant
+    en_passant = board.board_state["en_passant"].bitboard
+
+    if en_passant:
+        hash = hash ^ hash_keys.EN_PASSANT_KEYS[square_to_coord(get_lsb_square(en_passant))[1]]
+
+    # Process to_move state
+    if board.board_state["to_move"] == 1:
+        hash = hash ^ hash_keys.TO_MOVE_KEY
+
+    return hash
+
+
+def hash_piece(
+    board: Board,
+    color: int,
+    piece: str,
+    coord: Tuple[int, int],
+) -> None:
+    """
+    XORs a piece on a square into (or out of) the Zobrist hash
+
+    Args:
+        board (Board): Board to update
+        color (int): Color of the piece (1 or -1)
+        piece (str): Lowercase piece type
+        coord (Tuple): Coordinates of the piece
+
+    Returns:
+        None
+    """
+    piece_index = piece_indices[piece.upper() if color == 1 else piece]
+
+    board.zobrist_hash ^= hash_keys.PIECE_SQUARE_KEYS[
+        piece_index * 64 + coord_to_square(*coord)
+    ]
+
+
+def hash_piece_move(
+    board: Board,
+    color: int,
+    piece: str,
+    start_coord: Tuple[int, int],
+    end_coord: Tuple[int, int],
+) -> None:
+    """
+    Moves a piece between two squares in the Zobrist hash
+
+    Args:
+        board (Board): Board to update
+        color (int): Color of the piece (1 or -1)
+        piece (str): Lowercase piece type
+        start_coord (Tuple): Coordinates of the square the piece leaves
+        end_coord (Tuple): Coordinates of the square the piece enters
+
+    Returns:
+        None
+    """
+    hash_piece(board, color, piece, start_coord)
+    hash_piece(board, color, piece, end_coord)
+
+
+def update_castling(
+    board: Board,
+    castling_state: str,
+) -> None:
+    """
+    Sets the castling state, updating the Zobrist hash accordingly
+
+    Args:
+        board (Board): Board to update
+        castling_state (str): New KQkq type castling string
+
+    Returns:
+        None
+    """
+    board.zobrist_hash ^= CASTLING_STATE_KEYS[board.board_state["castling"]]
+    board.zobrist_hash ^= CASTLING_STATE_KEYS[castling_state]
+
+    board.board_state["castling"] = castling_state
+
+
+def update_en_passant(
+    board: Board,
+    en_passant: BitBoard,
+) -> None:
+    """
+    Sets the en passant bitboard, updating the Zobrist hash accordingly
+
+    Args:
+        board (Board): Board to update
+        en_passant (BitBoard): New en passant bitboard (empty if not applicable)
+
+    Returns:
+        None
+    """
+    # Only the file of the en passant square is hashed
+    for bitboard in [board.board_state["en_passant"], en_passant]:
+        if bitboard.bitboard:
+            _, file = square_to_coord(bitboard.bitboard.bit_length() - 1)
+            board.zobrist_hash ^= hash_keys.EN_PASSANT_KEYS[file]
+
+    board.board_state["en_passant"] = en_passant
+
+
+def switch_side(board: Board) -> None:
+    """
+    Passes the turn to the other player, updating the Zobrist hash accordingly
+
+    Args:
+        board (Board): Board to update
+
+    Returns:
+        None
+    """
+    board.board_state["to_move"] = board.board_state["to_move"] * -1
+    board.zobrist_hash ^= hash_keys.TO_MOVE_KEY
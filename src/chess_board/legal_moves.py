@@ -0,0 +1,348 @@
+"""
+File containing the legal move generator. Instead of making every pseudo-legal move and testing
+whether it leaves the king in check, the checkers, pinned pieces and squares the king must not
+enter are worked out once per position and every piece is restricted to moves that are legal by
+construction. Only en passant captures, which can expose the king along the rank of the two
+pawns that disappear, are still verified by making the move. Moves are written as packed moves
+(see moves) into preallocated buffers.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Tuple
+
+from src.chess_board import piece_handler
+from src.chess_board.bitboard import BitBoard, coord_to_square, iter_squares
+from src.chess_board.attack_tables import (
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    PAWN_ATTACKS,
+    BETWEEN,
+)
+from src.chess_board.sliding_attacks import (
+    get_bishop_attacks,
+    get_rook_attacks,
+    MASK_64,
+)
+from src.chess_board.moves import (
+    QUIET,
+    DOUBLE_PAWN_PUSH,
+    KING_CASTLE,
+    QUEEN_CASTLE,
+    CAPTURE,
+    EN_PASSANT,
+    PROMOTION_FLAGS,
+    MAX_MOVES,
+    pack_move,
+    move_to_tuple,
+    tuple_to_move,
+)
+
+# Order in which promotions are generated
+PROMOTION_ORDER = ["b", "n", "r", "q"]
+
+# Rows 0 and 7, where pawns promote
+LAST_RANKS = 0xFF000000000000FF
+
+# Starting rows of the pawns that may still double push
+PAWN_START_RANKS = {1: 0x000000000000FF00, -1: 0x00FF000000000000}
+
+
+def _mask(*coords: Tuple[int, int]) -> int:
+    """Returns a bitboard with the given coordinates set"""
+    result = 0
+
+    for coord in coords:
+        result |= 1 << coord_to_square(*coord)
+
+    return result
+
+
+# (castling right index, color, squares that must be empty, squares the king passes through
+# that must not be attacked, rook square, packed castling move)
+CASTLING_MOVES = [
+    (0, 1, _mask((7, 5), (7, 6)), _mask((7, 5), (7, 6)), coord_to_square(7, 7),
+     pack_move(coord_to_square(7, 4), coord_to_square(7, 6), KING_CASTLE)),
+    (1, 1, _mask((7, 1), (7, 2), (7, 3)), _mask((7, 2), (7, 3)), coord_to_square(7, 0),
+     pack_move(coord_to_square(7, 4), coord_to_square(7, 2), QUEEN_CASTLE)),
+    (2, -1, _mask((0, 5), (0, 6)), _mask((0, 5), (0, 6)), coord_to_square(0, 7),
+     pack_move(coord_to_square(0, 4), coord_to_square(0, 6), KING_CASTLE)),
+    (3, -1, _mask((0, 1), (0, 2), (0, 3)), _mask((0, 2), (0, 3)), coord_to_square(0, 0),
+     pack_move(coord_to_square(0, 4), coord_to_square(0, 2), QUEEN_CASTLE)),
+]
+
+
+def get_attack_mask(
+    positions: Dict[str, BitBoard],
+    color: int,
+    occupancy: int,
+) -> int:
+    """
+    Returns every square attacked by one side, whether or not it is occupied
+
+    Args:
+        positions (Dict[str, BitBoard]): Piece bitboards of the attacking side
+        color (int): Color of the attacking side, 1 for white and -1 for black
+        occupancy (int): Bitboard of the pieces that block sliding attacks
+
+    Returns:
+        attacks (int): Bitboard of the attacked squares
+    """
+    attacks = 0
+
+    for square in iter_squares(positions["p"].bitboard):
+        attacks |= PAWN_ATTACKS[color][square]
+
+    for square in iter_squares(positions["n"].bitboard):
+        attacks |= KNIGHT_ATTACKS[square]
+
+    for square in iter_squares(positions["b"].bitboard | positions["q"].bitboard):
+        attacks |= get_bishop_attacks(square, occupancy)
+
+    for square in iter_squares(positions["r"].bitboard | positions["q"].bitboard):
+        attacks |= get_rook_attacks(square, occupancy)
+
+    for square in iter_squares(positions["k"].bitboard):
+        attacks |= KING_ATTACKS[square]
+
+    return attacks
+
+
+def get_legal_moves(
+    board: Board,
+    captures_only: bool = False,
+) -> List[Tuple[Tuple, Tuple, str]]:
+    """
+    Returns a list of legal moves for the side to move in tuple form
+
+    Args:
+        board (Board): Board state information
+        captures_only (bool): Only return captures and promotions
+
+    Returns:
+        legal_moves: Tuple in the form -> (<start_coord>, <end_coord>, <promotion_piece_type>)
+    """
+    buffer = array("H", bytes(2 * MAX_MOVES))
+    count = generate_legal_moves(board, buffer, captures_only)
+
+    return [move_to_tuple(buffer[i]) for i in range(count)]
+
+
+def generate_legal_moves(
+    board: Board,
+    buffer: array,
+    captures_only: bool = False,
+    quiets_only: bool = False,
+) -> int:
+    """
+    Writes the legal moves for the side to move into a preallocated buffer as packed moves
+    (see moves), overwriting its first entries
+
+    Args:
+        board (Board): Board state information
+        buffer (array): array("H") of at least MAX_MOVES entries
+        captures_only (bool): Only generate captures and promotions
+        quiets_only (bool): Only generate the moves captures_only leaves out, so that the two
+            together generate every legal move once
+
+    Returns:
+        count (int): Number of moves written to the buffer
+    """
+    to_move = board.board_state["to_move"]
+
+    if to_move == 1:
+        friendly_positions, opponent_positions = board.white_positions, board.black_positions
+    else:
+        friendly_positions, opponent_positions = board.black_positions, board.white_positions
+
+    friendly = board.get_color_occupancy(to_move)
+    opponent = board.get_color_occupancy(-to_move)
+    occupancy = board.all_occupancy
+
+    king_mask = friendly_positions["k"].bitboard
+    king_square = king_mask.bit_length() - 1
+
+    opponent_diagonals = opponent_positions["b"].bitboard | opponent_positions["q"].bitboard
+    opponent_orthogonals = opponent_positions["r"].bitboard | opponent_positions["q"].bitboard
+
+    if captures_only:
+        target_mask = opponent
+    elif quiets_only:
+        target_mask = ~occupancy & MASK_64
+    else:
+        target_mask = ~friendly & MASK_64
+    count = 0
+
+    check_mask = MASK_64
+    pin_rays = {}
+
+    # Without a king (test positions) there are no king moves, checks, castling or pins
+    if king_mask:
+        checkers = (KNIGHT_ATTACKS[king_square] & opponent_positions["n"].bitboard) | \
+            (PAWN_ATTACKS[to_move][king_square] & opponent_positions["p"].bitboard) | \
+            (get_bishop_attacks(king_square, occupancy) & opponent_diagonals) | \
+            (get_rook_attacks(king_square, occupancy) & opponent_orthogonals)
+
+        # Sliders attack through the king so that it cannot step back along a checking ray
+        danger = get_attack_mask(opponent_positions, -to_move, occupancy ^ king_mask)
+        king_targets = KING_ATTACKS[king_square] & target_mask & ~danger
+
+        while king_targets:
+            target = king_targets & -king_targets
+            king_targets ^= target
+            buffer[count] = king_square | (target.bit_length() - 1) << 6 | \
+                (CAPTURE << 12 if target & opponent else 0)
+            count += 1
+
+        # Only the king can move out of a double check
+        if checkers & (checkers - 1):
+            return count
+
+        if checkers:
+            # Capture the checker or block the checking ray
+            check_mask = checkers | BETWEEN[king_square * 64 + checkers.bit_length() - 1]
+        elif not captures_only and board.board_state["castling"] != "-":
+            castling = board.board_state["castling"]
+            rooks = friendly_positions["r"].bitboard
+
+            for index, color, empty, safe, rook_square, move in CASTLING_MOVES:
+                if color == to_move and castling[index] != "-" and not occupancy & empty \
+                        and not danger & safe and rooks & (1 << rook_square):
+                    buffer[count] = move
+                    count += 1
+
+        # A piece is pinned if it is the only piece between the king and an opponent slider,
+        # it may then only move along the line between the two
+        snipers = (get_bishop_attacks(king_square, 0) & opponent_diagonals) | \
+            (get_rook_attacks(king_square, 0) & opponent_orthogonals)
+
+        for square in iter_squares(snipers):
+            blockers = BETWEEN[king_square * 64 + square] & occupancy
+
+            if blockers & friendly and not blockers & (blockers - 1):
+                pin_rays[blockers.bit_length() - 1] = \
+                    BETWEEN[king_square * 64 + square] | (1 << square)
+
+    allowed_mask = target_mask & check_mask
+
+    for piece in "nbrq":
+        for square in iter_squares(friendly_positions[piece].bitboard):
+            if piece == "n":
+                if square in pin_rays:
+                    continue
+                targets = KNIGHT_ATTACKS[square]
+            elif piece == "b":
+                targets = get_bishop_attacks(square, occupancy)
+            elif piece == "r":
+                targets = get_rook_attacks(square, occupancy)
+            else:
+                targets = get_bishop_attacks(square, occupancy) | \
+                    get_rook_attacks(square, occupancy)
+
+            targets &= allowed_mask
+
+            if square in pin_rays:
+                targets &= pin_rays[square]
+
+            while targets:
+                target = targets & -targets
+                targets ^= target
+                buffer[count] = square | (target.bit_length() - 1) << 6 | \
+                    (CAPTURE << 12 if target & opponent else 0)
+                count += 1
+
+    en_passant = board.board_state["en_passant"].bitboard
+
+    for square in iter_squares(friendly_positions["p"].bitboard):
+        mask = 1 << square
+
+        # White pawns move towards row 0 (higher square indices), black towards row 7
+        if to_move == 1:
+            single_push = (mask << 8) & ~occupancy
+            double_push = (single_push << 8) & ~occupancy \
+                if mask & PAWN_START_RANKS[to_move] else 0
+        else:
+            single_push = (mask >> 8) & ~occupancy
+            double_push = (single_push >> 8) & ~occupancy \
+                if mask & PAWN_START_RANKS[to_move] else 0
+
+        if captures_only:
+            single_push &= LAST_RANKS
+            double_push = 0
+        elif quiets_only:
+            single_push &= ~LAST_RANKS
+
+        captures = PAWN_ATTACKS[to_move][square] & opponent if not quiets_only else 0
+        targets = (captures | single_push | double_push) & check_mask
+
+        if square in pin_rays:
+            targets &= pin_rays[square]
+
+        while targets:
+            target = targets & -targets
+            targets ^= target
+
+            if target & opponent:
+                flags = CAPTURE
+            elif target & double_push:
+                flags = DOUBLE_PAWN_PUSH
+            else:
+                flags = QUIET
+
+            move = square | (target.bit_length() - 1) << 6
+
+            if target & LAST_RANKS:
+                for promotion_piece_type in PROMOTION_ORDER:
+                    buffer[count] = move | (flags | PROMOTION_FLAGS[promotion_piece_type]) << 12
+                    count += 1
+            else:
+                buffer[count] = move | flags << 12
+                count += 1
+
+        # En passant removes two pieces from the capturing rank, verify it by making the move
+        if PAWN_ATTACKS[to_move][square] & en_passant and not quiets_only:
+            move = pack_move(square, en_passant.bit_length() - 1, EN_PASSANT)
+
+            if board.check_move(move):
+                buffer[count] = move
+                count += 1
+
+    return count
+
+
+def is_legal_move(
+    board: Board,
+    move: int,
+) -> bool:
+    """
+    Checks whether a packed move taken from elsewhere, e.g. a hash or killer move, is legal in
+    the current position, flags included, without generating every move
+
+    Args:
+        board (Board): Board state information
+        move (int): Packed move
+
+    Returns:
+        legal (bool): True if the move is legal
+    """
+    start_coord, end_coord, promotion_piece_type = move_to_tuple(move)
+    piece = board.get_piece(*start_coord)
+
+    if piece == " " or piece.isupper() != (board.board_state["to_move"] == 1):
+        return False
+
+    piece = piece.lower()
+
+    # Pawns reaching the last rank must promote, nothing else may
+    if (piece == "p" and end_coord[0] in (0, 7)) != (promotion_piece_type is not None):
+        return False
+
+    # Flags must match the position, e.g. a quiet killer move may since have become a capture
+    if tuple_to_move(board, (start_coord, end_coord, promotion_piece_type)) != move:
+        return False
+
+    if not piece_handler.get_moves(board, start_coord, piece).is_occupied(*end_coord):
+        return False
+
+    return board.check_move(move)
@@ -0,0 +1,138 @@
+"""
+Script to generate the magic numbers and attack tables used for sliding piece move generation.
+Run from the repository root with `python -m src.chess_board.magic_generator`. The output is
+written to the resources directory and loaded by src/chess_board/sliding_attacks.py at startup.
+"""
+
+import os
+import random
+import sys
+import zlib
+
+from array import array
+from typing import List, Tuple
+
+from src.chess_board.attack_tables import (
+    BISHOP_DIRECTIONS,
+    ROOK_DIRECTIONS,
+    get_ray_attacks,
+    get_relevant_occupancy_mask,
+)
+
+MASK_64 = (1 << 64) - 1
+SEED = 20240101
+MAX_ATTEMPTS = 10_000_000
+
+RESOURCES_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "resources")
+MAGIC_NUMBERS_PATH = os.path.join(RESOURCES_PATH, "magic_numbers.py")
+ATTACK_TABLES_PATH = os.path.join(RESOURCES_PATH, "sliding_attack_tables.bin")
+
+
+def get_occupancy_subsets(mask: int) -> List[int]:
+    """
+    Enumerates every subset of the bits in a mask (Carry-Rippler trick)
+
+    Args:
+        mask (int): Bitboard mask
+
+    Returns:
+        subsets (List[int]): All 2^n subsets of the mask, starting with the empty set
+    """
+    subsets = []
+    subset = 0
+
+    while True:
+        subsets.append(subset)
+        subset = (subset - mask) & mask
+
+        if subset == 0:
+            return subsets
+
+
+def find_magic(
+    square: int,
+    directions: List[Tuple[int, int]],
+    rng: random.Random,
+) -> Tuple[int, List[int]]:
+    """
+    Searches for a magic number that maps every relevant occupancy of a square to a table index
+    without destructive collisions.
+
+    Args:
+        square (int): Square index of the sliding piece
+        directions (List[Tuple[int, int]]): (row, col) steps of the rays
+        rng (random.Random): Seeded random number generator
+
+    Returns:
+        magic (int): Magic number for the square
+        table (List[int]): Attack table for the square, indexed by magic index
+    """
+    mask = get_relevant_occupancy_mask(square, directions)
+    num_bits = mask.bit_count()
+    shift = 64 - num_bits
+
+    occupancies = get_occupancy_subsets(mask)
+    attacks = [get_ray_attacks(square, occupancy, directions) for occupancy in occupancies]
+
+    for _ in range(MAX_ATTEMPTS):
+        # Sparse random numbers make much better magic candidates
+        magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+
+        if (((mask * magic) & MASK_64) >> 56).bit_count() < 6:
+            continue
+
+        # Slider attacks are never empty, so 0 marks an unused slot
+        table = [0] * (1 << num_bits)
+        collision = False
+
+        for occupancy, attack in zip(occupancies, attacks):
+            index = ((occupancy * magic) & MASK_64) >> shift
+
+            if table[index] == 0:
+                table[index] = attack
+            elif table[index] != attack:
+                collision = True
+                break
+
+        if not collision:
+            return magic, table
+
+    raise RuntimeError(f"Failed to find magic number for square {square}")
+
+
+def generate_magics():
+    rng = random.Random(SEED)
+
+    magics = {}
+    tables = array("Q")
+
+    # Tables are stored rook first, then bishop, each in square order
+    for name, directions in [("ROOK", ROOK_DIRECTIONS), ("BISHOP", BISHOP_DIRECTIONS)]:
+        magics[name] = []
+
+        for square in range(64):
+            magic, table = find_magic(square, directions, rng)
+            magics[name].append(magic)
+            tables.extend(table)
+
+            print(f"{name} square {square}: {hex(magic)}")
+
+    with open(MAGIC_NUMBERS_PATH, "w") as f:
+        f.write('"""\nGenerated by src/chess_board/magic_generator.py, do not edit by hand\n"""\n')
+
+        for name, values in magics.items():
+            f.write(f"\n{name}_MAGICS = (\n")
+            for value in values:
+                f.write(f"    {hex(value)},\n")
+            f.write(")\n")
+
+    # Store little-endian regardless of the machine the tables were generated on
+    if sys.byteorder == "big":
+        tables.byteswap()
+
+    with open(ATTACK_TABLES_PATH, "wb") as f:
+        f.write(zlib.compress(tables.tobytes(), 9))
+
+
+if __name__ == "__main__":
+    generate_magics()
@@ -0,0 +1,131 @@
+"""
+File containing the packed move format. A move fits in 16 bits so that move lists can be kept in
+preallocated array("H") buffers instead of lists of tuples:
+
+    bits 0-5    start square (see bitboard.coord_to_square)
+    bits 6-11   end square
+    bits 12-15  flags
+
+The flags follow the usual layout where bit 2 marks captures and bit 3 marks promotions, with
+the low two bits selecting the promotion piece. The value 0 (h1 to h1) is never a legal move and
+is used as "no move".
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import List, Tuple
+
+from src.chess_board.bitboard import coord_to_square, square_to_coord
+
+QUIET = 0
+DOUBLE_PAWN_PUSH = 1
+KING_CASTLE = 2
+QUEEN_CASTLE = 3
+CAPTURE = 4
+EN_PASSANT = 5  # Capture flag plus the en passant bit
+PROMOTION = 8  # Plus the index of the piece in PROMOTION_PIECE_TYPES, and CAPTURE if capturing
+
+NO_MOVE = 0
+
+PROMOTION_PIECE_TYPES = ("n", "b", "r", "q")
+PROMOTION_FLAGS = {piece: PROMOTION | i for i, piece in enumerate(PROMOTION_PIECE_TYPES)}
+
+# Upper bound on the number of legal moves in any position (218 is the known maximum)
+MAX_MOVES = 256
+
+# Coordinates of every square, saves recomputing them when unpacking moves
+SQUARE_COORDS = tuple(square_to_coord(square) for square in range(64))
+
+
+def pack_move(
+    start_square: int,
+    end_square: int,
+    flags: int = QUIET,
+) -> int:
+    """
+    Packs a move into 16 bits
+
+    Args:
+        start_square (int): Square index the piece moves from
+        end_square (int): Square index the piece moves to
+        flags (int): Move flags, e.g. CAPTURE or PROMOTION_FLAGS["q"] | CAPTURE
+
+    Returns:
+        move (int): Packed move
+    """
+    return start_square | end_square << 6 | flags << 12
+
+
+def get_promotion_piece_type(move: int) -> str | None:
+    """
+    Returns the promotion piece type of a packed move, None if it is not a promotion
+    """
+    flags = move >> 12
+
+    return PROMOTION_PIECE_TYPES[flags & 3] if flags & PROMOTION else None
+
+
+def move_to_tuple(move: int) -> Tuple[Tuple, Tuple, str]:
+    """
+    Unpacks a move into the tuple form used by the rest of the Board API
+
+    Args:
+        move (int): Packed move
+
+    Returns:
+        move (Tuple): Move in the form (<start_coord>, <end_coord>, <promotion_piece_type>)
+    """
+    flags = move >> 12
+
+    return (
+        SQUARE_COORDS[move & 0x3F],
+        SQUARE_COORDS[move >> 6 & 0x3F],
+        PROMOTION_PIECE_TYPES[flags & 3] if flags & PROMOTION else None,
+    )
+
+
+def tuple_to_move(
+    board: Board,
+    move: Tuple[Tuple, Tuple, str],
+) -> int:
+    """
+    Packs a move in tuple form, working out its flags from the position it is played in
+
+    Args:
+        board (Board): Position before the move
+        move (Tuple): Move in the form (<start_coord>, <end_coord>, <promotion_piece_type>)
+
+    Returns:
+        move (int): Packed move
+    """
+    start_coord, end_coord, promotion_piece_type = move
+    piece = board.get_piece(*start_coord).lower()
+
+    flags = CAPTURE if board.get_piece(*end_coord) != " " else QUIET
+
+    if piece == "p":
+        if promotion_piece_type is not None:
+            flags |= PROMOTION_FLAGS[promotion_piece_type]
+        elif board.board_state["en_passant"].is_occupied(*end_coord):
+            flags = EN_PASSANT
+        elif abs(start_coord[0] - end_coord[0]) == 2:
+            flags = DOUBLE_PAWN_PUSH
+    elif piece == "k" and abs(start_coord[1] - end_coord[1]) == 2:
+        flags = KING_CASTLE if end_coord[1] == 6 else QUEEN_CASTLE
+
+    return pack_move(coord_to_square(*start_coord), coord_to_square(*end_coord), flags)
+
+
+def allocate_move_buffers(num_buffers: int) -> List[array]:
+    """
+    Preallocates move list buffers, one per search ply, so that move generation can reuse
+    them instead of building new lists
+
+    Args:
+        num_buffers (int): Number of buffers
+
+    Returns:
+        buffers (List[array]): array("H") buffers of MAX_MOVES moves each
+    """
+    return [array("H", bytes(2 * MAX_MOVES)) for _ in range(num_buffers)]
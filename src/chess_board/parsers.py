@@ -94,3 +94,25 @@ def alphanumeric_to_index(position: str) -> Tuple[int, int]:
         promotion_piece_type = None
 
     return (8 - int(rank), file_no), promotion_piece_type
+
+
+def index_to_alphanumeric(position: Tuple[int, int]) -> str:
+    """
+    Helper function to turn positions from numerical index form to
+    alphanumeric form, the inverse of alphanumeric_to_index
+
+    Args:
+        position (Tuple[int, int]): Position in index form
+
+    Returns:
+        result (str): Position in alphanumeric form
+
+    Throws:
+        ValueError: For coordinates outside of the board
+    """
+    row, col = position
+
+    if not (0 <= row <= 7 and 0 <= col <= 7):
+        raise ValueError(f"Invalid position: {position}")
+
+    return f"{FILES[col]}{8 - row}"
@@ -0,0 +1,445 @@
+"""
+Perft (performance test) tool. Counts the leaf nodes of the legal move tree to a fixed depth,
+which checks move generation against known reference counts and measures its speed. Run from
+the repository root with `python -m src.chess_board.perft [max_depth] [--workers N]`, or with
+`--scaling 1 2 4` to time the suite at several worker counts.
+"""
+
+import argparse
+import time
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from resources import FENs
+from src.chess_board.board import Board
+from src.chess_board.legal_moves import generate_legal_moves
+from src.chess_board.moves import allocate_move_buffers
+
+# Bytes per cache entry: key (8), depth (1), node count (8), time spent counting (8)
+CACHE_ENTRY_SIZE = 25
+
+# (name, FEN, {depth: node count}) for the standard reference positions
+PERFT_SUITE = [
+    ("initial", FENs.STARTING_FEN, {1: 20, 2: 400, 3: 8902, 4: 197281, 5: 4865609}),
+    ("kiwipete", FENs.KIWIPETE_FEN, {1: 48, 2: 2039, 3: 97862, 4: 4085603}),
+    ("en passant", FENs.PERFT_ENPASSANT_FEN, {1: 14, 2: 191, 3: 2812, 4: 43238, 5: 674624}),
+    ("promotion", FENs.PERFT_PROMOTION_FEN, {1: 6, 2: 264, 3: 9467, 4: 422333}),
+    ("promotion 2", FENs.PERFT_PROMOTION_2_FEN, {1: 44, 2: 1486, 3: 62379, 4: 2103487}),
+    ("middlegame", FENs.PERFT_MIDDLEGAME_FEN, {1: 46, 2: 2079, 3: 89890, 4: 3894594}),
+]
+
+
+class PerftCache:
+    """
+    Fixed size hash table of subtree leaf counts keyed by the board's Zobrist hash and the
+    remaining depth, so transposed subtrees are only counted once.
+
+    Entries live in preallocated flat arrays (one per field) in buckets of two slots, the same
+    layout as the search's TranspositionTable: the first slot keeps the deepest (most
+    expensive) subtree seen, the second is always replaced. Each entry also records the time
+    its subtree took to count, which is added up on every hit as the time saved.
+
+    Attributes:
+        num_buckets (int): Number of two slot buckets
+        keys, depths, counts, times (array): Entry fields indexed by slot, depth 0 marks an
+            empty slot
+    """
+
+    def __init__(
+        self,
+        size_mb: float = 16,
+    ) -> None:
+        """
+        Constructor for the PerftCache class
+
+        Args:
+            size_mb (float): Memory budget for the table in megabytes
+        """
+        self.num_buckets = max(1, int(size_mb * 1024 * 1024) // (2 * CACHE_ENTRY_SIZE))
+        num_slots = 2 * self.num_buckets
+
+        self.keys = array("Q", bytes(8 * num_slots))
+        self.depths = array("B", bytes(num_slots))
+        self.counts = array("Q", bytes(8 * num_slots))
+        self.times = array("d", bytes(8 * num_slots))
+
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+        self.filled = 0
+
+    def probe(
+        self,
+        key: int,
+        depth: int,
+    ) -> Optional[int]:
+        """
+        Looks up the leaf count of a subtree
+
+        Args:
+            key (int): Zobrist hash of the position
+            depth (int): Remaining depth of the subtree
+
+        Returns:
+            nodes (int): Leaf count if the subtree is stored, None otherwise
+        """
+        slot = 2 * (key % self.num_buckets)
+
+        for index in (slot, slot + 1):
+            if self.depths[index] == depth and self.keys[index] == key:
+                self.hits += 1
+                self.time_saved += self.times[index]
+
+                return self.counts[index]
+
+        self.misses += 1
+
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        nodes: int,
+        elapsed: float,
+    ) -> None:
+        """
+        Stores the leaf count of a subtree. The depth-preferred slot is replaced if it is empty
+        or holds a subtree at most as deep, otherwise the count goes in the always-replace slot.
+
+        Args:
+            key (int): Zobrist hash of the position
+            depth (int): Remaining depth of the subtree, at least 1
+            nodes (int): Leaf count of the subtree
+            elapsed (float): Seconds spent counting the subtree
+        """
+        slot = 2 * (key % self.num_buckets)
+        index = slot if depth >= self.depths[slot] else slot + 1
+
+        if not self.depths[index]:
+            self.filled += 1
+
+        self.keys[index] = key
+        self.depths[index] = depth
+        self.counts[index] = nodes
+        self.times[index] = elapsed
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns usage statistics of the cache
+
+        Returns:
+            stats (Dict): Hit and miss counts, hit rate (as a fraction of probes), time saved in
+                seconds and fill ratio (as a fraction of all slots)
+        """
+        probes = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "time_saved": self.time_saved,
+            "fill_ratio": self.filled / (2 * self.num_buckets),
+        }
+
+
+def perft(
+    board: Board,
+    depth: int,
+    cache: Optional[PerftCache] = None,
+) -> int:
+    """
+    Counts the leaf nodes of the legal move tree. Leaves are bulk counted: at depth 1 the
+    number of legal moves is returned instead of making each move.
+
+    Args:
+        board (Board): Position to count from, left unchanged
+        depth (int): Depth in plies
+        cache (PerftCache): Reuses the counts of transposed subtrees if given. Leave unset for
+            a reference count that relies on move generation alone.
+
+    Returns:
+        nodes (int): Number of leaf nodes
+    """
+    return _perft(board, depth, cache, allocate_move_buffers(depth + 1))
+
+
+def _perft(
+    board: Board,
+    depth: int,
+    cache: Optional[PerftCache],
+    buffers: List[array],
+) -> int:
+    """
+    Recursive part of perft, moves at each depth are generated into buffers[depth]
+    """
+    if depth == 0:
+        return 1
+
+    if cache is not None:
+        nodes = cache.probe(board.hash(), depth)
+
+        if nodes is not None:
+            return nodes
+
+        start_time = time.perf_counter()
+
+    buffer = buffers[depth]
+    count = generate_legal_moves(board, buffer)
+
+    if depth == 1:
+        nodes = count
+    else:
+        nodes = 0
+
+        for i in range(count):
+            board.make_move(buffer[i])
+            nodes += _perft(board, depth - 1, cache, buffers)
+            board.unmake_move()
+
+    if cache is not None:
+        cache.store(board.hash(), depth, nodes, time.perf_counter() - start_time)
+
+    return nodes
+
+
+def divide(
+    board: Board,
+    depth: int,
+    cache: Optional[PerftCache] = None,
+) -> Dict[Tuple[Tuple, Tuple, str], int]:
+    """
+    Counts the leaf nodes under every root move separately, useful for finding which move a
+    wrong perft count comes from
+
+    Args:
+        board (Board): Position to count from, left unchanged
+        depth (int): Depth in plies, at least 1
+        cache (PerftCache): Reuses the counts of transposed subtrees if given
+
+    Returns:
+        counts (Dict): Leaf node count for every legal root move
+    """
+    counts = {}
+
+    for move in board.get_legal_moves():
+        board.make_move(*move)
+        counts[move] = perft(board, depth - 1, cache)
+        board.unmake_move()
+
+    return counts
+
+
+def _perft_task(
+    task: Tuple[str, int],
+) -> int:
+    """
+    Worker entry point, runs perft on a position sent across the process boundary as FEN
+
+    Args:
+        task (Tuple[str, int]): FEN string of the position and the remaining depth
+
+    Returns:
+        nodes (int): Number of leaf nodes
+    """
+    fen_string, depth = task
+    return perft(Board(fen_string), depth)
+
+
+def parallel_divide(
+    board: Board,
+    depth: int,
+    workers: Optional[int] = None,
+    split_depth: int = 1,
+    chunksize: int = 1,
+) -> Dict[Tuple[Tuple, Tuple, str], int]:
+    """
+    Same result as divide, with the subtrees counted across a process pool. The tree is split
+    at the root moves (split_depth 1) or at every reply to them (split_depth 2), giving
+    roughly 30 or 1000 tasks in a typical position. Splitting deeper balances the load better
+    across many workers at the cost of more FEN round trips.
+
+    Args:
+        board (Board): Position to count from, left unchanged
+        depth (int): Depth in plies, at least 1
+        workers (int): Number of worker processes, defaults to the number of CPUs
+        split_depth (int): Ply at which the tree is split into tasks, 1 or 2
+        chunksize (int): Number of tasks handed to a worker at a time
+
+    Returns:
+        counts (Dict): Leaf node count for every legal root move
+    """
+    if split_depth not in {1, 2}:
+        raise ValueError(f"Expected split_depth of 1 or 2, instead got: {split_depth}")
+
+    split_depth = min(split_depth, depth)
+
+    # Collect every position at the split depth, tagged with the root move it belongs to
+    root_moves = []
+    tasks = []
+
+    for move in board.get_legal_moves():
+        board.make_move(*move)
+
+        if split_depth == 1:
+            root_moves.append(move)
+            tasks.append((board.get_fen(), depth - 1))
+        else:
+            for reply in board.get_legal_moves():
+                board.make_move(*reply)
+                root_moves.append(move)
+                tasks.append((board.get_fen(), depth - 2))
+                board.unmake_move()
+
+        board.unmake_move()
+
+    # Root moves without any replies still appear in the result with a count of 0
+    counts = {move: 0 for move in board.get_legal_moves()}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for move, nodes in zip(root_moves, executor.map(_perft_task, tasks, chunksize=chunksize)):
+            counts[move] += nodes
+
+    return counts
+
+
+def parallel_perft(
+    board: Board,
+    depth: int,
+    workers: Optional[int] = None,
+    split_depth: int = 1,
+    chunksize: int = 1,
+) -> int:
+    """
+    Same result as perft, with the subtrees counted across a process pool. See
+    parallel_divide for the arguments.
+
+    Returns:
+        nodes (int): Number of leaf nodes
+    """
+    if depth == 0:
+        return 1
+
+    return sum(parallel_divide(board, depth, workers, split_depth, chunksize).values())
+
+
+def run_suite(
+    max_depth: int = 3,
+    suite: List[Tuple[str, str, Dict[int, int]]] = None,
+    workers: Optional[int] = None,
+    split_depth: int = 1,
+    cache_mb: Optional[float] = None,
+) -> bool:
+    """
+    Runs perft on every reference position up to a maximum depth, printing the node count,
+    whether it matches the reference and the nodes per second
+
+    Args:
+        max_depth (int): Maximum depth to run each position to
+        suite (List): Positions to run, defaults to PERFT_SUITE
+        workers (int): Run each perft across this many processes, single process if None
+        split_depth (int): Ply at which parallel runs split the tree into tasks
+        cache_mb (float): Size of a PerftCache for single process runs, uncached if None
+
+    Returns:
+        passed (bool): True if every count matched its reference
+    """
+    passed = True
+
+    for name, fen, expected_counts in suite or PERFT_SUITE:
+        for depth, expected in sorted(expected_counts.items()):
+            if depth > max_depth:
+                break
+
+            board = Board(fen)
+            cache = PerftCache(cache_mb) if cache_mb is not None else None
+
+            start_time = time.perf_counter()
+            if workers is None:
+                nodes = perft(board, depth, cache)
+            else:
+                nodes = parallel_perft(board, depth, workers, split_depth)
+            elapsed = time.perf_counter() - start_time
+
+            status = "OK" if nodes == expected else f"FAIL (expected {expected})"
+            passed = passed and nodes == expected
+
+            nps = nodes / elapsed if elapsed > 0 else 0.0
+            print(f"{name:<12} depth {depth}: {nodes:>10} nodes {nps:>10.0f} nps  {status}")
+
+            if cache is not None:
+                stats = cache.get_stats()
+                print(
+                    f"{'':<12} cache: {stats['hits']} hits, {stats['misses']} misses, "
+                    f"{stats['hit_rate']:.1%} hit rate, {stats['time_saved']:.2f}s saved"
+                )
+
+    return passed
+
+
+def run_scaling_benchmark(
+    max_depth: int = 5,
+    worker_counts: List[int] = (1, 2, 4),
+    suite: List[Tuple[str, str, Dict[int, int]]] = None,
+    split_depth: int = 1,
+) -> Dict[int, float]:
+    """
+    Times run_suite with parallel perft at several worker counts, then prints the speedup and
+    parallel efficiency of each count relative to the first one
+
+    Args:
+        max_depth (int): Maximum depth to run each position to
+        worker_counts (List[int]): Numbers of worker processes to time, the first is the baseline
+        suite (List): Positions to run, defaults to PERFT_SUITE
+        split_depth (int): Ply at which the tree is split into tasks
+
+    Returns:
+        timings (Dict[int, float]): Seconds taken by the whole suite for every worker count
+    """
+    timings = {}
+
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        passed = run_suite(max_depth, suite, workers, split_depth)
+        timings[workers] = time.perf_counter() - start_time
+
+        if not passed:
+            raise ValueError(f"Perft counts do not match the reference with {workers} workers")
+
+    baseline_workers = worker_counts[0]
+
+    for workers, elapsed in timings.items():
+        speedup = timings[baseline_workers] / elapsed
+        efficiency = speedup * baseline_workers / workers
+        print(
+            f"{workers:>3} workers: {elapsed:>8.2f}s {speedup:>6.2f}x speedup "
+            f"{efficiency:>7.1%} efficiency"
+        )
+
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run perft on the reference positions")
+    parser.add_argument("max_depth", type=int, nargs="?", default=3)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes, single process if omitted")
+    parser.add_argument("--split-depth", type=int, default=1, choices=[1, 2],
+                        help="Ply at which parallel runs split the tree into tasks")
+    parser.add_argument("--cache-mb", type=float, default=None,
+                        help="Size of the subtree count cache in megabytes, uncached if omitted")
+    parser.add_argument("--scaling", type=int, nargs="+", default=None, metavar="WORKERS",
+                        help="Time the suite at each of these worker counts and print the speedup")
+    args = parser.parse_args()
+
+    if args.scaling is not None:
+        run_scaling_benchmark(args.max_depth, args.scaling, split_depth=args.split_depth)
+    else:
+        run_suite(
+            args.max_depth,
+            workers=args.workers,
+            split_depth=args.split_depth,
+            cache_mb=args.cache_mb,
+        )
@@ -1,36 +1,45 @@
 from __future__ import annotations
 from typing import Tuple
 
-from src.chess_board.bitboard import BitBoard
+from src.chess_board.bitboard import BitBoard, coord_to_square
+from src.chess_board.attack_tables import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS
+from src.chess_board.sliding_attacks import (
+    get_bishop_attacks,
+    get_rook_attacks,
+    get_queen_attacks,
+)
 
 """
 File containing helper funcitons to retrieve legal moves for a given piece on a board
 """
 
-def _in_range(
-    row: int,
-    col: int
-) -> bool:
+
+def _get_target_mask(
+    board: Board,
+    captures_only: bool,
+) -> int:
     """
-    Helper function to check if a given position is inside of a chessboard
+    Helper function returning the squares a piece may move to: anything not occupied by a
+    friendly piece, or only opponent pieces when generating captures
 
     Args:
-    row (int): Row index of piece
-    col(int): Column index of piece
+    board (Board): Board state information
+    captures_only (bool): Whether only captures are being generated
 
     Returns:
-    isValid (bool): Whether or not position is within chessboard
+    mask (int): Bitboard of allowed target squares
     """
-    i_valid = 0 <= row <= 7
-    j_valid = 0 <= col <= 7
+    if captures_only:
+        return board.get_color_occupancy(board.board_state["to_move"] * -1)
 
-    return i_valid and j_valid
+    return ~board.get_color_occupancy(board.board_state["to_move"])
 
 
 def get_pawn_moves(
     board: Board,
     position: Tuple[int, int],
     captures_only: bool = False,  # Moves do not imply captures for pawns
+    include_promotions: bool = False,  # Keep promotion pushes when only returning captures
 ) -> BitBoard:
     piece = board.get_piece(position[0], position[1])
     if board.board_state["to_move"] == -1:
@@ -40,48 +49,36 @@ def get_pawn_moves(
 
     bitboard = BitBoard()
 
-    all_pieces = board.get_color_bitboard(1) + board.get_color_bitboard(-1)
+    all_pieces = BitBoard.from_int(board.all_occupancy)
 
     if board.board_state["to_move"] == -1:
         if not all_pieces.is_occupied(position[0] + 1, position[1]):
             bitboard.set(position[0] + 1, position[1])
 
-        if position[0] == 1 and \
-                not all_pieces.is_occupied(position[0] + 2, position[1]):
-            bitboard.set(position[0] + 2, position[1])
+            if position[0] == 1 and \
+                    not all_pieces.is_occupied(position[0] + 2, position[1]):
+                bitboard.set(position[0] + 2, position[1])
     else:
         if not all_pieces.is_occupied(position[0] - 1, position[1]):
             bitboard.set(position[0] - 1, position[1])
 
-        if position[0] == 6 and \
-                not all_pieces.is_occupied(position[0] - 2, position[1]):
-            bitboard.set(position[0] - 2, position[1])
-
-    # List possible captures
-    if board.board_state["to_move"] == -1:
-        candidate_locations = [
-            (position[0] + 1, position[1] + 1),
-            (position[0] + 1, position[1] - 1)
-        ]
-    else:
-        candidate_locations = [
-            (position[0] - 1, position[1] + 1),
-            (position[0] - 1, position[1] - 1)
-        ]
-
-    capture_bitboard = BitBoard()
-
-    for location in candidate_locations:
-        if _in_range(location[0], location[1]):
-            capture_bitboard.set(location[0], location[1])
+            if position[0] == 6 and \
+                    not all_pieces.is_occupied(position[0] - 2, position[1]):
+                bitboard.set(position[0] - 2, position[1])
 
-    # Check if opponent pieces exist on capture square
-    opponent_bitboard = board.get_color_bitboard(board.board_state["to_move"] * -1)
-    opponent_bitboard += board.board_state["en_passant"]  # Add en-passant captures
+    # Check if opponent pieces exist on capture square (including en-passant captures)
+    opponent_occupancy = board.get_color_occupancy(board.board_state["to_move"] * -1) | \
+        board.board_state["en_passant"].bitboard
 
-    capture_bitboard = capture_bitboard & opponent_bitboard
+    capture_bitboard = BitBoard.from_int(
+        PAWN_ATTACKS[board.board_state["to_move"]][coord_to_square(*position)] & opponent_occupancy
+    )
 
     if captures_only:
+        if include_promotions:
+            # Pushes onto the last rank (row 0 or 7)
+            capture_bitboard.bitboard |= bitboard.bitboard & 0xFF000000000000FF
+
         return capture_bitboard
 
     bitboard += capture_bitboard
@@ -92,34 +89,16 @@ def get_pawn_moves(
 def get_knight_moves(
     board: Board,
     position: Tuple[int, int],
+    captures_only: bool = False,
 ) -> BitBoard:
     if board.board_state["to_move"] == -1:
         assert board.get_piece(position[0], position[1]) == 'n'
     else:
         assert board.get_piece(position[0], position[1]) == 'N'
 
-    bitboard = BitBoard()
-
-    candidate_locations = [
-        (position[0] + 2, position[1] + 1),
-        (position[0] + 2, position[1] - 1),
-        (position[0] - 2, position[1] + 1),
-        (position[0] - 2, position[1] - 1),
-        (position[0] + 1, position[1] + 2),
-        (position[0] - 1, position[1] + 2),
-        (position[0] + 1, position[1] - 2),
-        (position[0] - 1, position[1] - 2)
-    ]
-
-    for location in candidate_locations:
-        if _in_range(location[0], location[1]):
-            bitboard.set(location[0], location[1])
-
-    # Check if knight is attacking friendly pieces
-    friendly_bitboard = board.get_color_bitboard(board.board_state["to_move"])
-    friendly_bitboard = friendly_bitboard & bitboard
-
-    bitboard = bitboard ^ friendly_bitboard
+    bitboard = BitBoard.from_int(
+        KNIGHT_ATTACKS[coord_to_square(*position)] & _get_target_mask(board, captures_only)
+    )
 
     return bitboard
 
@@ -127,35 +106,18 @@ def get_knight_moves(
 def get_bishop_moves(
     board: Board,
     position: Tuple[int, int],
+    captures_only: bool = False,
 ) -> BitBoard:
     if board.board_state["to_move"] == -1:
         assert board.get_piece(position[0], position[1]) in set("bq")
     else:
         assert board.get_piece(position[0], position[1]) in set("BQ")
 
-    bitboard = BitBoard()
-
-    friendly_bitboard = board.get_color_bitboard(board.board_state["to_move"])
-    opponent_bitboard = board.get_color_bitboard(board.board_state["to_move"] * -1)
-
-    for i in [-1, 1]:
-        for j in [-1, 1]:
-            row_index = position[0]
-            col_index = position[1]
-            while True:
-                row_index += i
-                col_index += j
-
-                if not _in_range(row_index, col_index):
-                    break
-
-                if friendly_bitboard.is_occupied(row_index, col_index):
-                    break
-
-                bitboard.set(row_index, col_index)
-
-                if opponent_bitboard.is_occupied(row_index, col_index):
-                    break
+    # Attacks stop at the first blocker, which is only capturable if it is an opponent piece
+    bitboard = BitBoard.from_int(
+        get_bishop_attacks(coord_to_square(*position), board.all_occupancy) &
+        _get_target_mask(board, captures_only)
+    )
 
     return bitboard
 
@@ -163,47 +125,18 @@ def get_bishop_moves(
 def get_rook_moves(
     board: Board,
     position: Tuple[int, int],
+    captures_only: bool = False,
 ) -> BitBoard:
     if board.board_state["to_move"] == -1:
         assert board.get_piece(position[0], position[1]) in set("rq")
     else:
         assert board.get_piece(position[0], position[1]) in set("RQ")
 
-    bitboard = BitBoard()
-
-    friendly_bitboard = board.get_color_bitboard(board.board_state["to_move"])
-    opponent_bitboard = board.get_color_bitboard(board.board_state["to_move"] * -1)
-
-    for i in [-1, 1]:
-        index = position[0]
-        while True:
-            index += i
-
-            if not _in_range(index, position[1]):
-                break
-
-            if friendly_bitboard.is_occupied(index, position[1]):
-                break
-
-            bitboard.set(index, position[1])
-
-            if opponent_bitboard.is_occupied(index, position[1]):
-                break
-
-        index = position[1]
-        while True:
-            index += i
-
-            if not _in_range(position[0], index):
-                break
-
-            if friendly_bitboard.is_occupied(position[0], index):
-                break
-
-            bitboard.set(position[0], index)
-
-            if opponent_bitboard.is_occupied(position[0], index):
-                break
+    # Attacks stop at the first blocker, which is only capturable if it is an opponent piece
+    bitboard = BitBoard.from_int(
+        get_rook_attacks(coord_to_square(*position), board.all_occupancy) &
+        _get_target_mask(board, captures_only)
+    )
 
     return bitboard
 
@@ -211,53 +144,49 @@ def get_rook_moves(
 def get_queen_moves(
     board: Board,
     position: Tuple[int, int],
+    captures_only: bool = False,
 ) -> BitBoard:
     if board.board_state["to_move"] == -1:
         assert board.get_piece(position[0], position[1]) == 'q'
     else:
         assert board.get_piece(position[0], position[1]) == 'Q'
 
-    bishop_component = get_bishop_moves(board, position)
-    rook_component = get_rook_moves(board, position)
+    # Attacks stop at the first blocker, which is only capturable if it is an opponent piece
+    bitboard = BitBoard.from_int(
+        get_queen_attacks(coord_to_square(*position), board.all_occupancy) &
+        _get_target_mask(board, captures_only)
+    )
 
-    return bishop_component + rook_component
+    return bitboard
 
 
 def get_king_moves(
     board: Board,
     position: Tuple[int, int],
+    captures_only: bool = False,
 ) -> BitBoard:
     if board.board_state["to_move"] == -1:
         assert board.get_piece(position[0], position[1]) == 'k'
     else:
         assert board.get_piece(position[0], position[1]) == 'K'
 
-    bitboard = BitBoard()
-
-    candidate_locations = [
-        (position[0] + 1, position[1]),
-        (position[0] - 1, position[1]),
-        (position[0], position[1] + 1),
-        (position[0], position[1] - 1),
-        (position[0] + 1, position[1] + 1),
-        (position[0] + 1, position[1] - 1),
-        (position[0] - 1, position[1] + 1),
-        (position[0] - 1, position[1] - 1),
-    ]
+    bitboard = BitBoard.from_int(
+        KING_ATTACKS[coord_to_square(*position)] & _get_target_mask(board, captures_only)
+    )
 
-    friendly_bitboard = board.get_color_bitboard(board.board_state["to_move"])
+    # Handle castling moves:
+    if captures_only or board.board_state["castling"] == "-":
+        return bitboard
 
-    for location in candidate_locations:
-        if _in_range(location[0], location[1]) \
-                and not friendly_bitboard.is_occupied(location[0], location[1]):
-            bitboard.set(location[0], location[1])
+    # One attack map answers both whether the king is in check and which squares it may cross
+    opponent_target_bitboard = BitBoard.from_int(
+        board.attacked_squares(board.board_state["to_move"] * -1)
+    )
 
-    # Handle castling moves:
-    if board.in_check() or board.board_state["castling"] == "-":
+    if opponent_target_bitboard.is_occupied(position[0], position[1]):
         return bitboard
 
-    opponent_target_bitboard = board.in_check(return_target_bitboard=True)
-    combined_pieces = board.get_color_bitboard(1) + board.get_color_bitboard(-1)
+    combined_pieces = BitBoard.from_int(board.all_occupancy)
 
     if board.board_state["castling"][0] == "K" and board.board_state["to_move"] == 1:
         blocked = False
@@ -325,7 +254,8 @@ def get_king_moves(
 def get_moves(
     board: Board,
     position: Tuple[int, int],
-    piece_type: str
+    piece_type: str,
+    captures_only: bool = False,
 ) -> BitBoard:
     """
     Returns a bitboard of moves taking into account captures and
@@ -335,17 +265,24 @@ def get_moves(
         board (Board): Board state information
         position (Tuple[int, int]): Position of piece being moved
         piece_type (str): Piece being moved
+        captures_only (bool): Only generate captures (and pawn promotions), quiet moves are
+            masked out before any move is generated
     """
     assert piece_type in set("pnbrqk")
 
     if piece_type.lower() == "p":
-        return get_pawn_moves(board, position)
+        return get_pawn_moves(
+            board,
+            position,
+            captures_only=captures_only,
+            include_promotions=captures_only,
+        )
     if piece_type.lower() == "n":
-        return get_knight_moves(board, position)
+        return get_knight_moves(board, position, captures_only)
     if piece_type.lower() == "b":
-        return get_bishop_moves(board, position)
+        return get_bishop_moves(board, position, captures_only)
     if piece_type.lower() == "r":
-        return get_rook_moves(board, position)
+        return get_rook_moves(board, position, captures_only)
     if piece_type.lower() == "q":
-        return get_queen_moves(board, position)
-    return get_king_moves(board, position)
+        return get_queen_moves(board, position, captures_only)
+    return get_king_moves(board, position, captures_only)
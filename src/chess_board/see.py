@@ -0,0 +1,284 @@
+"""
+File containing static exchange evaluation (SEE). SEE works out the material balance of the
+sequence of captures on the end square of a move, with both sides always recapturing with their
+least valuable attacker and free to stop capturing once it would lose material. It works on the
+bitboards alone and never makes a move on the board: captured attackers are removed from a local
+occupancy, which uncovers the sliding pieces behind them (x-rays).
+
+Pins are ignored, as are promotions of recapturing pawns. A king only captures when the
+opponent has no attackers left.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from src.chess_board.attack_tables import KING_ATTACKS, KNIGHT_ATTACKS, PAWN_ATTACKS
+from src.chess_board.bitboard import get_lsb
+from src.chess_board.moves import (
+    EN_PASSANT,
+    KING_CASTLE,
+    PROMOTION,
+    QUEEN_CASTLE,
+)
+from src.chess_board.sliding_attacks import get_bishop_attacks, get_rook_attacks
+
+# Piece types in the order of the mailbox values (see resources.pieces.mailbox_pieces)
+PIECE_TYPES = "pnbrqk"
+
+# Exchange value of every piece type. The king is never captured, so its value is never used.
+SEE_VALUES = (100, 300, 300, 500, 900, 0)
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+# Index of the promotion piece in the move flags to piece type (see moves.PROMOTION_PIECE_TYPES)
+PROMOTION_TYPES = (KNIGHT, BISHOP, ROOK, QUEEN)
+
+
+def get_attackers(
+    board: Board,
+    square: int,
+    occupancy: int,
+) -> int:
+    """
+    Returns the pieces of both sides that attack a square, with sliding attacks blocked by the
+    given occupancy rather than the board's. Pieces missing from the occupancy are still
+    included, mask the result with the occupancy to leave them out.
+
+    Args:
+        board (Board): Position to look up the pieces in
+        square (int): Square index of the target square (see bitboard.coord_to_square)
+        occupancy (int): Bitboard of the pieces that block sliding attacks
+
+    Returns:
+        attackers (int): Bitboard of the attacking pieces of both colors
+    """
+    white = board.white_positions
+    black = board.black_positions
+
+    bishops = white["b"].bitboard | black["b"].bitboard
+    rooks = white["r"].bitboard | black["r"].bitboard
+    queens = white["q"].bitboard | black["q"].bitboard
+
+    # A pawn of one color on the square attacks the squares the other color's pawns attack
+    # it from
+    return (
+        PAWN_ATTACKS[-1][square] & white["p"].bitboard
+        | PAWN_ATTACKS[1][square] & black["p"].bitboard
+        | KNIGHT_ATTACKS[square] & (white["n"].bitboard | black["n"].bitboard)
+        | KING_ATTACKS[square] & (white["k"].bitboard | black["k"].bitboard)
+        | get_bishop_attacks(square, occupancy) & (bishops | queens)
+        | get_rook_attacks(square, occupancy) & (rooks | queens)
+    )
+
+
+def _setup_exchange(
+    board: Board,
+    move: int,
+) -> Tuple[int, int, int, int]:
+    """
+    Works out the state of the exchange once a move has been played
+
+    Returns:
+        exchange (tuple): Material won by the move, piece type left on the end square, end
+            square and occupancy after the move
+    """
+    flags = move >> 12
+    start_square = move & 0x3F
+    end_square = move >> 6 & 0x3F
+    mailbox = board.mailbox
+
+    piece_type = (mailbox[start_square] - 1) % 6
+    occupancy = board.all_occupancy ^ 1 << start_square
+
+    if flags == EN_PASSANT:
+        gain = SEE_VALUES[PAWN]
+        # The captured pawn is one row behind the end square, seen from the side to move
+        occupancy ^= 1 << end_square - 8 * board.board_state["to_move"]
+    elif mailbox[end_square]:
+        gain = SEE_VALUES[(mailbox[end_square] - 1) % 6]
+    else:
+        gain = 0
+
+    if flags & PROMOTION:
+        piece_type = PROMOTION_TYPES[flags & 3]
+        gain += SEE_VALUES[piece_type] - SEE_VALUES[PAWN]
+
+    return gain, piece_type, end_square, occupancy
+
+
+def _get_least_valuable_attacker(
+    pieces: Tuple[int, ...],
+    attackers: int,
+) -> Tuple[int, int]:
+    """
+    Finds the least valuable piece among a side's attackers
+
+    Args:
+        pieces (Tuple[int, ...]): Bitboard of every piece type of the side, pawns first
+        attackers (int): Bitboard of the side's attackers
+
+    Returns:
+        attacker (Tuple[int, int]): Piece type and bitboard of the attacking piece
+    """
+    for piece_type in range(6):
+        attacker = attackers & pieces[piece_type]
+
+        if attacker:
+            return piece_type, get_lsb(attacker)
+
+    raise ValueError("No attackers")
+
+
+def _get_side_pieces(
+    board: Board,
+) -> Dict[int, Tuple[int, ...]]:
+    """
+    Returns the bitboards of every piece type of both sides, indexed by color
+    """
+    return {
+        1: tuple(board.white_positions[piece].bitboard for piece in PIECE_TYPES),
+        -1: tuple(board.black_positions[piece].bitboard for piece in PIECE_TYPES),
+    }
+
+
+def _add_x_rays(
+    pieces: Dict[int, Tuple[int, ...]],
+    attackers: int,
+    piece_type: int,
+    square: int,
+    occupancy: int,
+) -> int:
+    """
+    Adds the sliding pieces uncovered by moving a piece of the given type off the square's
+    lines. Only pawns, bishops, rooks and queens can stand in front of another attacker.
+    """
+    white, black = pieces[1], pieces[-1]
+
+    if piece_type in (PAWN, BISHOP, QUEEN):
+        attackers |= get_bishop_attacks(square, occupancy) & (
+            white[BISHOP] | black[BISHOP] | white[QUEEN] | black[QUEEN]
+        )
+    if piece_type in (ROOK, QUEEN):
+        attackers |= get_rook_attacks(square, occupancy) & (
+            white[ROOK] | black[ROOK] | white[QUEEN] | black[QUEEN]
+        )
+
+    return attackers & occupancy
+
+
+def see(
+    board: Board,
+    move: int,
+) -> int:
+    """
+    Static exchange evaluation of a move, usually a capture
+
+    Args:
+        board (Board): Position the move is played in
+        move (int): Packed move
+
+    Returns:
+        score (int): Material won by the side to move once the exchange on the end square is
+            resolved, negative if the move loses material
+    """
+    if move >> 12 in (KING_CASTLE, QUEEN_CASTLE):
+        return 0
+
+    gain, piece_type, square, occupancy = _setup_exchange(board, move)
+    attackers = get_attackers(board, square, occupancy) & occupancy
+
+    pieces = _get_side_pieces(board)
+    occupancies = {1: board.white_occupancy, -1: board.black_occupancy}
+    side = -board.board_state["to_move"]
+
+    # gains[i] is the balance for the side making capture i if the exchange stops after it
+    gains = [gain]
+
+    while attackers & occupancies[side]:
+        attacker_type, attacker = _get_least_valuable_attacker(
+            pieces[side], attackers & occupancies[side]
+        )
+
+        occupancy ^= attacker
+        attackers = _add_x_rays(pieces, attackers, attacker_type, square, occupancy)
+
+        # A king may not capture onto a square the opponent still attacks
+        if attacker_type == KING and attackers & occupancies[-side]:
+            break
+
+        gains.append(SEE_VALUES[piece_type] - gains[-1])
+        piece_type = attacker_type
+        side = -side
+
+    # Either side may decline to recapture, going back from the last capture
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+
+    return gains[0]
+
+
+def see_ge(
+    board: Board,
+    move: int,
+    threshold: int = 0,
+) -> bool:
+    """
+    Tests whether the static exchange evaluation of a move is at least a threshold. Cheaper
+    than see because the exchange stops as soon as the outcome is known.
+
+    Args:
+        board (Board): Position the move is played in
+        move (int): Packed move
+        threshold (int): Material the move has to win
+
+    Returns:
+        result (bool): True if see(board, move) >= threshold
+    """
+    if move >> 12 in (KING_CASTLE, QUEEN_CASTLE):
+        return threshold <= 0
+
+    gain, piece_type, square, occupancy = _setup_exchange(board, move)
+
+    # Even if the moved piece is taken for free the threshold is reached
+    swap = gain - threshold
+    if swap < 0:
+        return False
+
+    # Losing the moved piece for nothing still reaches the threshold
+    swap = SEE_VALUES[piece_type] - swap
+    if swap <= 0:
+        return True
+
+    attackers = get_attackers(board, square, occupancy)
+    pieces = _get_side_pieces(board)
+    occupancies = {1: board.white_occupancy, -1: board.black_occupancy}
+    side = board.board_state["to_move"]
+
+    # Every capture the side to capture can afford flips the result, swap is the margin by
+    # which the exchange so far beats the threshold for the side that captured last
+    result = True
+
+    while True:
+        side = -side
+        attackers &= occupancy
+        side_attackers = attackers & occupancies[side]
+
+        if not side_attackers:
+            break
+
+        result = not result
+        attacker_type, attacker = _get_least_valuable_attacker(pieces[side], side_attackers)
+
+        if attacker_type == KING:
+            # The king can only capture if the opponent has no attackers left
+            return result ^ bool(attackers & occupancies[-side])
+
+        swap = SEE_VALUES[attacker_type] - swap
+        if swap < result:
+            break
+
+        occupancy ^= attacker
+        attackers = _add_x_rays(pieces, attackers, attacker_type, square, occupancy)
+
+    return result
@@ -0,0 +1,119 @@
+"""
+File containing magic bitboard attack lookups for the sliding pieces. The magic numbers and
+attack tables are generated offline by src/chess_board/magic_generator.py and loaded from the
+resources directory at import. Looking up the attacks of a slider for any occupancy costs one
+multiply, one shift and one table read.
+"""
+
+import sys
+import zlib
+
+from array import array
+from importlib import resources as importlib_resources
+from typing import Tuple
+
+from resources.magic_numbers import BISHOP_MAGICS, ROOK_MAGICS
+from src.chess_board.attack_tables import (
+    BISHOP_DIRECTIONS,
+    ROOK_DIRECTIONS,
+    get_relevant_occupancy_mask,
+)
+
+MASK_64 = (1 << 64) - 1
+
+ROOK_MASKS = tuple(get_relevant_occupancy_mask(square, ROOK_DIRECTIONS) for square in range(64))
+BISHOP_MASKS = tuple(
+    get_relevant_occupancy_mask(square, BISHOP_DIRECTIONS) for square in range(64)
+)
+
+ROOK_SHIFTS = tuple(64 - mask.bit_count() for mask in ROOK_MASKS)
+BISHOP_SHIFTS = tuple(64 - mask.bit_count() for mask in BISHOP_MASKS)
+
+
+def _load_attack_tables() -> Tuple[Tuple[array, ...], Tuple[array, ...]]:
+    """
+    Loads the generated attack tables and splits them into one table per square
+
+    Returns:
+        rook_attacks (Tuple[array, ...]): Rook attack table for every square
+        bishop_attacks (Tuple[array, ...]): Bishop attack table for every square
+    """
+    data = importlib_resources.files("resources").joinpath("sliding_attack_tables.bin")
+
+    tables = array("Q")
+    tables.frombytes(zlib.decompress(data.read_bytes()))
+
+    # Tables are stored little-endian
+    if sys.byteorder == "big":
+        tables.byteswap()
+
+    result = []
+    offset = 0
+
+    for shifts in [ROOK_SHIFTS, BISHOP_SHIFTS]:
+        square_tables = []
+
+        for shift in shifts:
+            size = 1 << (64 - shift)
+            square_tables.append(tables[offset:offset + size])
+            offset += size
+
+        result.append(tuple(square_tables))
+
+    if offset != len(tables):
+        raise ValueError(
+            f"Sliding attack tables have unexpected size {len(tables)}, expected {offset}. " +
+            "Rerun src/chess_board/magic_generator.py"
+        )
+
+    return result[0], result[1]
+
+
+ROOK_ATTACKS, BISHOP_ATTACKS = _load_attack_tables()
+
+
+def get_rook_attacks(square: int, occupancy: int) -> int:
+    """
+    Returns the squares attacked by a rook
+
+    Args:
+        square (int): Square index of the rook
+        occupancy (int): Bitboard of all pieces on the board
+
+    Returns:
+        attacks (int): Bitboard of attacked squares, including the first blocker of each ray
+    """
+    return ROOK_ATTACKS[square][
+        ((occupancy & ROOK_MASKS[square]) * ROOK_MAGICS[square] & MASK_64) >> ROOK_SHIFTS[square]
+    ]
+
+
+def get_bishop_attacks(square: int, occupancy: int) -> int:
+    """
+    Returns the squares attacked by a bishop
+
+    Args:
+        square (int): Square index of the bishop
+        occupancy (int): Bitboard of all pieces on the board
+
+    Returns:
+        attacks (int): Bitboard of attacked squares, including the first blocker of each ray
+    """
+    return BISHOP_ATTACKS[square][
+        ((occupancy & BISHOP_MASKS[square]) * BISHOP_MAGICS[square] & MASK_64)
+        >> BISHOP_SHIFTS[square]
+    ]
+
+
+def get_queen_attacks(square: int, occupancy: int) -> int:
+    """
+    Returns the squares attacked by a queen
+
+    Args:
+        square (int): Square index of the queen
+        occupancy (int): Bitboard of all pieces on the board
+
+    Returns:
+        attacks (int): Bitboard of attacked squares, including the first blocker of each ray
+    """
+    return get_rook_attacks(square, occupancy) | get_bishop_attacks(square, occupancy)
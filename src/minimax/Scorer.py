@@ -1,17 +1,60 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List, Sequence
+
+from resources.piece_square_tables import (
+    MG_PIECE_VALUES,
+    MG_MAILBOX_SCORES,
+    EG_MAILBOX_SCORES,
+    PHASE_WEIGHTS,
+    TOTAL_PHASE,
+    get_square_table,
+)
+from resources.pieces import mailbox_values
+
 
 class Scorer:
     """
     Class that handles different types of board evaluation methods
+
+    Attributes:
+        piece_values (Dict): Value of every lowercase piece type
+        piece_square_tables (Dict): Optional 64 entry table per lowercase piece type, written
+            row-major from white's point of view (row 0 is the eighth rank) the way tables are
+            usually printed. Black uses the vertically mirrored table.
+        square_values (Dict): Piece-square bonus of every piece (uppercase white, lowercase
+            black) indexed by square index, signed from white's point of view. None when no
+            piece-square tables are given
     """
-    
+
     def __init__(
         self,
-        piece_values: Dict
+        piece_values: Dict,
+        piece_square_tables: Dict[str, Sequence[float]] | None = None,
     ) -> None:
         self.piece_values = piece_values
+        self.piece_square_tables = piece_square_tables
+        self.square_values = self._get_square_values(piece_square_tables) \
+            if piece_square_tables is not None else None
+
+    @staticmethod
+    def _get_square_values(
+        piece_square_tables: Dict[str, Sequence[float]],
+    ) -> Dict[str, List[float]]:
+        """
+        Converts row-major tables to signed tables indexed by square index (see
+        bitboard.coord_to_square), so that scoring can walk the set bits directly
+        """
+        square_values = {}
+
+        for piece, table in piece_square_tables.items():
+            if len(table) != 64:
+                raise ValueError(f"Piece-square table for {piece} needs 64 entries")
+
+            square_values[piece.upper()] = get_square_table(table, 1)
+            square_values[piece.lower()] = [-bonus for bonus in get_square_table(table, -1)]
+
+        return square_values
 
     def _get_piece_value_score(
         self,
@@ -30,9 +73,77 @@ class Scorer:
             score -= bitboard.count() * self.piece_values[piece]
 
         return score
-    
+
+    def _get_piece_square_score(
+        self,
+        board: Board
+    ) -> float:
+        score = 0
+
+        for positions, to_token in [
+            (board.white_positions, str.upper),
+            (board.black_positions, str.lower),
+        ]:
+            for piece, bitboard in positions.items():
+                square_values = self.square_values.get(to_token(piece))
+
+                if square_values is not None:
+                    score += sum(square_values[square] for square in bitboard.squares())
+
+        return score
+
+    def get_score(
+        self,
+        board: Board
+    ) -> float:
+        if self.square_values is None:
+            return self._get_piece_value_score(board)
+
+        return self._get_piece_value_score(board) + self._get_piece_square_score(board)
+
+
+class TaperedScorer(Scorer):
+    """
+    Tapered evaluation with the middlegame and endgame tables of resources.piece_square_tables.
+    The Board keeps the material plus piece-square totals and the game phase up to date on every
+    move, so scoring a leaf costs O(1) plus any terms that are not kept incrementally.
+
+    Attributes:
+        piece_values (Dict): Middlegame piece values, used by the search to estimate captures
+        mg_square_values (Dict): Middlegame material plus piece-square score of every piece
+            (uppercase white, lowercase black) indexed by square index, white positive
+        eg_square_values (Dict): Endgame scores in the same layout
+        phase_weights (Dict): Game phase contribution of every lowercase piece type
+    """
+
+    def __init__(self) -> None:
+        super().__init__(MG_PIECE_VALUES)
+
+        self.mg_square_values = {
+            piece: list(MG_MAILBOX_SCORES[value * 64:value * 64 + 64])
+            for piece, value in mailbox_values.items() if piece != " "
+        }
+        self.eg_square_values = {
+            piece: list(EG_MAILBOX_SCORES[value * 64:value * 64 + 64])
+            for piece, value in mailbox_values.items() if piece != " "
+        }
+        self.phase_weights = PHASE_WEIGHTS
+
+    @staticmethod
+    def blend(
+        mg_score: float,
+        eg_score: float,
+        phase: int,
+    ) -> float:
+        """
+        Blends middlegame and endgame scores by a game phase between 0 and TOTAL_PHASE, works
+        element-wise on arrays as well
+        """
+        return (mg_score * phase + eg_score * (TOTAL_PHASE - phase)) / TOTAL_PHASE
+
     def get_score(
         self,
         board: Board
     ) -> float:
-        return self._get_piece_value_score(board)
+        # Promotions can push the phase above TOTAL_PHASE
+        return self.blend(board.mg_score, board.eg_score, min(board.phase, TOTAL_PHASE))
@@ -0,0 +1,187 @@
+"""
+File containing batched evaluation of many boards at once with NumPy, for analysis jobs that score
+far more positions than a search does. Boards are packed into an (N, 12) uint64 array, one column
+per piece in resources.pieces.piece_indices order, and scored with vectorised popcounts (material,
+game phase) and bit unpacking (piece-square tables). The scores match Scorer.get_score and
+TaperedScorer.get_score board for board.
+
+NumPy is optional, the rest of the package does not need it.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from resources.piece_square_tables import TOTAL_PHASE
+from resources.pieces import mailbox_pieces
+
+# Column order of the packed array, white pieces first as in piece_indices
+PIECE_ORDER = mailbox_pieces[1:]
+
+# Rows scored per chunk, bounds the size of the unpacked (rows, 12, 64) bit array
+CHUNK_SIZE = 1 << 16
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Batch evaluation requires NumPy, install it with `pip install numpy`")
+
+
+def pack_boards(
+    boards: Iterable[Board],
+) -> np.ndarray:
+    """
+    Packs the piece bitboards of many boards into one array
+
+    Args:
+        boards (Iterable[Board]): Boards to pack
+
+    Returns:
+        packed (np.ndarray): (N, 12) uint64 array, columns in PIECE_ORDER
+    """
+    _require_numpy()
+
+    rows = [
+        [
+            (board.white_positions if piece.isupper() else board.black_positions)[
+                piece.lower()
+            ].bitboard
+            for piece in PIECE_ORDER
+        ]
+        for board in boards
+    ]
+
+    return np.array(rows, dtype=np.uint64).reshape(len(rows), len(PIECE_ORDER))
+
+
+def _popcount(packed: np.ndarray) -> np.ndarray:
+    """
+    Counts the set bits of every entry of a uint64 array
+    """
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0 and later
+        return np.bitwise_count(packed)
+
+    byte_counts = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+    return byte_counts[packed.view(np.uint8)].reshape(*packed.shape, 8).sum(axis=-1)
+
+
+def get_batch_scores(
+    scorer: Scorer,
+    packed: np.ndarray,
+) -> np.ndarray:
+    """
+    Scores every packed board from white's point of view, as Scorer.get_score would
+
+    Args:
+        scorer (Scorer): Scorer holding the piece values and optional piece-square tables, or a
+            TaperedScorer
+        packed (np.ndarray): (N, 12) uint64 array from pack_boards
+
+    Returns:
+        scores (np.ndarray): (N,) float64 array of scores
+    """
+    _require_numpy()
+
+    packed = np.ascontiguousarray(packed, dtype="<u8")
+
+    if packed.ndim != 2 or packed.shape[1] != len(PIECE_ORDER):
+        raise ValueError(f"Expected an (N, {len(PIECE_ORDER)}) array, got {packed.shape}")
+
+    if hasattr(scorer, "mg_square_values"):
+        return _get_tapered_scores(scorer, packed)
+
+    material_weights = np.array([
+        scorer.piece_values[piece.lower()] * (1 if piece.isupper() else -1)
+        for piece in PIECE_ORDER
+    ], dtype=np.float64)
+
+    scores = _popcount(packed).astype(np.float64) @ material_weights
+
+    if scorer.square_values is None:
+        return scores
+
+    # Row i of the weights holds the bonus of piece i on every square, 0 for pieces without a table
+    square_weights = np.array([
+        scorer.square_values.get(piece, [0] * 64) for piece in PIECE_ORDER
+    ], dtype=np.float64)
+
+    return scores + _get_square_scores(packed, square_weights)
+
+
+def _get_square_scores(
+    packed: np.ndarray,
+    square_weights: np.ndarray,
+) -> np.ndarray:
+    """
+    Sums the weight of every occupied (piece, square) pair of every packed board
+
+    Args:
+        packed (np.ndarray): (N, 12) little endian uint64 array
+        square_weights (np.ndarray): (..., 12, 64) weights, one (12, 64) table per output
+
+    Returns:
+        scores (np.ndarray): (N, ...) float64 array of sums
+    """
+    scores = np.zeros((len(packed),) + square_weights.shape[:-2], dtype=np.float64)
+
+    for start in range(0, len(packed), CHUNK_SIZE):
+        chunk = packed[start:start + CHUNK_SIZE]
+
+        # Little endian bytes unpacked little bit first put square i at position i
+        bits = np.unpackbits(
+            chunk.view(np.uint8).reshape(len(chunk), len(PIECE_ORDER), 8),
+            axis=-1,
+            bitorder="little",
+        )
+
+        scores[start:start + CHUNK_SIZE] = np.einsum(
+            "nps,...ps->n...", bits, square_weights, dtype=np.float64,
+        )
+
+    return scores
+
+
+def _get_tapered_scores(
+    scorer: TaperedScorer,
+    packed: np.ndarray,
+) -> np.ndarray:
+    """
+    Batched TaperedScorer.get_score, the middlegame and endgame totals come from one pass over
+    the unpacked bits and the phase from popcounts
+    """
+    square_weights = np.array([
+        [scorer.mg_square_values[piece] for piece in PIECE_ORDER],
+        [scorer.eg_square_values[piece] for piece in PIECE_ORDER],
+    ], dtype=np.float64)
+
+    phase_weights = np.array(
+        [scorer.phase_weights[piece.lower()] for piece in PIECE_ORDER], dtype=np.int64,
+    )
+
+    totals = _get_square_scores(packed, square_weights)
+    phase = _popcount(packed).astype(np.int64) @ phase_weights
+
+    return scorer.blend(totals[:, 0], totals[:, 1], np.minimum(phase, TOTAL_PHASE))
+
+
+def score_boards(
+    scorer: Scorer,
+    boards: Iterable[Board],
+) -> np.ndarray:
+    """
+    Packs and scores many boards in one call
+
+    Args:
+        scorer (Scorer): Scorer holding the piece values and optional piece-square tables
+        boards (Iterable[Board]): Boards to score
+
+    Returns:
+        scores (np.ndarray): (N,) float64 array of scores from white's point of view
+    """
+    return get_batch_scores(scorer, pack_boards(boards))
@@ -0,0 +1,153 @@
+"""
+File containing the move ordering used by the search. Alpha-beta cuts the most when the best move
+is searched first, so moves are scored before they are searched (the move picker searches the
+transposition table move ahead of all of them, see move_picker):
+
+    1. captures and queen promotions, most valuable victim first, then least valuable attacker
+    2. two killer moves per ply, quiet moves that caused a cutoff at the same ply before
+    3. the remaining quiet moves by their history score, indexed by colour, start and end square
+
+History scores are halved at the start of every search so that old results fade out.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+from src.chess_board.moves import CAPTURE, EN_PASSANT, NO_MOVE, PROMOTION
+
+CAPTURE_SCORE = 1 << 24
+KILLER_SCORES = (1 << 23, (1 << 23) - 1)
+
+# History scores are halved once one of them reaches this, keeping them below the killers
+HISTORY_MAX = 1 << 22
+
+# Entries per colour of the history table, one per (start square, end square) pair
+HISTORY_SIZE = 64 * 64
+
+# Promotion index of the queen in the move flags (see moves.PROMOTION_PIECE_TYPES)
+QUEEN_PROMOTION = 3
+
+
+class MoveOrderer:
+    """
+    Scores moves for the search, and keeps the killer moves and history table that
+    the scores are based on
+
+    Attributes:
+        killers (List[List[int]]): Two packed killer moves per ply, most recent first
+        history (List[int]): History score of every colour, start and end square, white first
+    """
+
+    def __init__(
+        self,
+        max_ply: int,
+    ) -> None:
+        """
+        Constructor for the MoveOrderer class
+
+        Args:
+            max_ply (int): Maximum search depth in plies, one killer slot pair per ply
+        """
+        self.killers = [[NO_MOVE, NO_MOVE] for _ in range(max_ply)]
+        self.history = [0] * (2 * HISTORY_SIZE)
+
+    def new_search(self) -> None:
+        """
+        Clears the killers, which are specific to a position, and ages the history table
+        """
+        for killers in self.killers:
+            killers[0] = killers[1] = NO_MOVE
+
+        self.age_history()
+
+    def age_history(self) -> None:
+        """
+        Halves every history score
+        """
+        self.history = [score >> 1 for score in self.history]
+
+    def score_moves(
+        self,
+        board: Board,
+        moves: List[int],
+        count: int,
+        ply: int,
+    ) -> List[int]:
+        """
+        Scores the first count moves of a move buffer, higher scores are searched first
+
+        Args:
+            board (Board): Position the moves are played in
+            moves (List[int]): Buffer of packed moves
+            count (int): Number of moves in the buffer
+            ply (int): Distance from the root, selects the killer moves
+
+        Returns:
+            scores (List[int]): Score of every move
+        """
+        mailbox = board.mailbox
+        history = self.history
+        history_offset = 0 if board.board_state["to_move"] == 1 else HISTORY_SIZE
+        killer_1, killer_2 = self.killers[ply]
+
+        scores = []
+
+        for i in range(count):
+            move = moves[i]
+            flags = move >> 12
+
+            if flags & CAPTURE or flags & 0xB == PROMOTION | QUEEN_PROMOTION:
+                # Mailbox values run P, N, B, R, Q, K for both colours, so (value - 1) % 6 is the
+                # piece type from pawn (0) to king (5). Empty squares are only reached by quiet
+                # queen promotions, which count as capturing a queen.
+                if flags == EN_PASSANT:
+                    victim = 0
+                elif flags & CAPTURE:
+                    victim = (mailbox[move >> 6 & 0x3F] - 1) % 6
+                else:
+                    victim = 4
+
+                score = CAPTURE_SCORE + victim * 8 + 7 - (mailbox[move & 0x3F] - 1) % 6
+
+                if flags & 0xB == PROMOTION | QUEEN_PROMOTION and flags & CAPTURE:
+                    score += 4 * 8
+            elif move == killer_1:
+                score = KILLER_SCORES[0]
+            elif move == killer_2:
+                score = KILLER_SCORES[1]
+            else:
+                score = history[history_offset + (move & 0xFFF)]
+
+            scores.append(score)
+
+        return scores
+
+    def update_quiet_cutoff(
+        self,
+        board: Board,
+        move: int,
+        ply: int,
+        depth: int,
+    ) -> None:
+        """
+        Records a quiet move that caused a beta cutoff as a killer at this ply and rewards it in
+        the history table, deeper cutoffs count for more
+
+        Args:
+            board (Board): Position the move was played in, before the move
+            move (int): Packed move
+            ply (int): Distance from the root
+            depth (int): Remaining depth of the node
+        """
+        killers = self.killers[ply]
+
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+
+        index = (0 if board.board_state["to_move"] == 1 else HISTORY_SIZE) + (move & 0xFFF)
+        self.history[index] += depth * depth
+
+        if self.history[index] >= HISTORY_MAX:
+            self.age_history()
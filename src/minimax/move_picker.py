@@ -0,0 +1,134 @@
+"""
+File containing the staged move picker. Most nodes of an alpha-beta search are cut off by one of
+the first moves searched, so instead of generating and sorting every move up front the picker
+produces moves in stages and only moves on to the next stage once the current one runs out:
+
+    1. hash move        the transposition table or principal variation move, legality checked
+    2. good captures    captures and queen promotions that do not lose material, MVV-LVA order
+    3. killers          the killer moves of the ply, legality checked
+    4. quiet moves      the remaining quiet moves, by history score
+    5. bad captures     captures that lose material by static exchange evaluation, and
+                        under-promotions
+
+Captures are only generated once the hash move has been searched and quiet moves only once the
+killers have been, so a cutoff in an early stage skips the later stages' work entirely. Within a
+stage the best remaining move is selected on demand rather than sorting the whole stage.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterator, List
+
+from src.chess_board.legal_moves import generate_legal_moves, is_legal_move
+from src.chess_board.moves import CAPTURE, NO_MOVE, PROMOTION
+from src.chess_board.see import see_ge
+from src.minimax.move_ordering import MoveOrderer, QUEEN_PROMOTION
+
+
+def _select(
+    moves: List[int],
+    scores: List[int],
+) -> Iterator[int]:
+    """
+    Yields moves best score first, finding each one only when it is asked for
+    """
+    for i in range(len(moves)):
+        best = max(range(i, len(moves)), key=scores.__getitem__)
+
+        if best != i:
+            moves[i], moves[best] = moves[best], moves[i]
+            scores[i], scores[best] = scores[best], scores[i]
+
+        yield moves[i]
+
+
+def _is_bad_capture(
+    board: Board,
+    move: int,
+) -> bool:
+    """
+    Captures that lose material in the exchange on the end square are searched last, as are
+    under-promotions
+    """
+    flags = move >> 12
+
+    if flags & PROMOTION and flags & 3 != QUEEN_PROMOTION:
+        return True
+
+    return not see_ge(board, move)
+
+
+def pick_moves(
+    board: Board,
+    orderer: MoveOrderer,
+    ply: int,
+    hash_move: int,
+    capture_buffer: array,
+    quiet_buffer: array,
+) -> Iterator[int]:
+    """
+    Yields the legal moves of a position one at a time, in stages (see the module docstring).
+    The board must be back in the same position whenever the next move is requested.
+
+    Args:
+        board (Board): Position to pick moves in
+        orderer (MoveOrderer): Killer moves and history scores to order by
+        ply (int): Distance from the root, selects the killer moves
+        hash_move (int): Packed move to search first, NO_MOVE if there is none
+        capture_buffer (array): Move buffer for the captures of this ply
+        quiet_buffer (array): Move buffer for the quiet moves of this ply
+
+    Yields:
+        move (int): Packed legal move
+    """
+    if hash_move != NO_MOVE and is_legal_move(board, hash_move):
+        yield hash_move
+    else:
+        hash_move = NO_MOVE
+
+    count = generate_legal_moves(board, capture_buffer, captures_only=True)
+
+    good_captures = []
+    bad_captures = []
+
+    for i in range(count):
+        move = capture_buffer[i]
+
+        if move == hash_move:
+            continue
+        if _is_bad_capture(board, move):
+            bad_captures.append(move)
+        else:
+            good_captures.append(move)
+
+    scores = orderer.score_moves(board, good_captures, len(good_captures), ply)
+
+    yield from _select(good_captures, scores)
+
+    killers = []
+
+    # Killers come from sibling positions, a killer that has become a capture here fails the
+    # legality check because its flags no longer match. Captures and promotions were searched
+    # in the capture stages already.
+    for killer in orderer.killers[ply]:
+        if killer in (NO_MOVE, hash_move) or killer in killers:
+            continue
+        if not killer >> 12 & (CAPTURE | PROMOTION) and is_legal_move(board, killer):
+            killers.append(killer)
+            yield killer
+
+    count = generate_legal_moves(board, quiet_buffer, quiets_only=True)
+    quiets = [
+        quiet_buffer[i] for i in range(count)
+        if quiet_buffer[i] != hash_move and quiet_buffer[i] not in killers
+    ]
+
+    # Killers were searched already, so quiet moves are scored by history alone
+    scores = orderer.score_moves(board, quiets, len(quiets), ply)
+
+    yield from _select(quiets, scores)
+
+    scores = orderer.score_moves(board, bad_captures, len(bad_captures), ply)
+
+    yield from _select(bad_captures, scores)
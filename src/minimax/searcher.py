@@ -0,0 +1,780 @@
+from __future__ import annotations
+
+import math
+import time
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.chess_board.legal_moves import generate_legal_moves
+from src.chess_board.see import see_ge
+from src.chess_board.moves import (
+    CAPTURE,
+    EN_PASSANT,
+    MAX_MOVES,
+    PROMOTION,
+    SQUARE_COORDS,
+    allocate_move_buffers,
+    get_promotion_piece_type,
+    move_to_tuple,
+)
+from src.minimax.Scorer import Scorer
+from src.minimax.move_ordering import MoveOrderer
+from src.minimax.move_picker import pick_moves
+from src.minimax.transposition_table import (
+    TranspositionTable,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+)
+
+INFINITY = 1_000_000
+MATE_SCORE = 100_000
+MAX_PLY = 128
+
+# Scores beyond this are mates, counted in plies from the root
+MATE_THRESHOLD = MATE_SCORE - MAX_PLY
+
+# Number of nodes between checks of the time limit
+CHECK_INTERVAL = 1024
+
+# Extra margin on top of the captured material before a capture is delta pruned
+DELTA_MARGIN = 200
+
+# Null move pruning searches the position with the opponent to move at this many plies less,
+# one more at NULL_MOVE_DEEP_DEPTH and above
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_DEEP_DEPTH = 7
+
+# Late quiet moves are searched at reduced depth, from this depth and move number on
+LMR_MIN_DEPTH = 3
+LMR_MIN_MOVE_NUMBER = 3
+
+# Reduction of every remaining depth and move number, growing with the logarithm of both
+LMR_REDUCTIONS = tuple(
+    tuple(
+        int(0.75 + math.log(depth) * math.log(move_number) / 2.25)
+        if depth and move_number else 0
+        for move_number in range(MAX_MOVES)
+    )
+    for depth in range(MAX_PLY)
+)
+
+# Margins by remaining depth for futility pruning (quiet moves are skipped if the static
+# evaluation plus the margin cannot reach alpha) and reverse futility pruning (the node fails
+# high if the static evaluation minus the margin still beats beta). Both stop at depth 2.
+FUTILITY_MARGINS = (0, 200, 500)
+REVERSE_FUTILITY_MARGINS = (0, 150, 300)
+
+# Iterations from this depth on search a window of ASPIRATION_WINDOW around the previous score
+# first. A window the score falls outside of grows by ASPIRATION_GROWTH on the failing side,
+# and opens up completely once it exceeds ASPIRATION_MAX_WINDOW.
+ASPIRATION_MIN_DEPTH = 3
+ASPIRATION_WINDOW = 50
+ASPIRATION_GROWTH = 2
+ASPIRATION_MAX_WINDOW = 1000
+
+# Counters kept for every selectivity technique (see Searcher.get_stats)
+SELECTIVITY_STATS = (
+    "null_move_searches",
+    "null_move_cutoffs",
+    "late_move_reductions",
+    "late_move_researches",
+    "futility_prunes",
+    "reverse_futility_prunes",
+)
+
+
+class SearchResult(NamedTuple):
+    """
+    Result of a search
+
+    Attributes:
+        best_move (Tuple): Best move found, None if there are no legal moves
+        score (int): Score of the best move from the point of view of the player to move
+        depth (int): Depth of the deepest completed iteration
+        nodes (int): Number of nodes searched
+        nps (float): Nodes searched per second
+        pv (List[Tuple]): Principal variation starting with the best move
+    """
+    best_move: Optional[Tuple[Tuple, Tuple, str]]
+    score: int
+    depth: int
+    nodes: int
+    nps: float
+    pv: List[Tuple[Tuple, Tuple, str]]
+
+
+class Searcher:
+    """
+    Negamax alpha-beta search with iterative deepening.
+
+    Each iteration searches one ply deeper than the last, starting with the previous iteration's
+    principal variation. The search stops once the maximum depth is reached or the node or time
+    limit is hit, in which case the result of the last completed iteration is returned. Leaves
+    are resolved with a capture-only quiescence search to avoid the horizon effect. Moves are
+    picked in stages (see move_picker) and ordered by a MoveOrderer (hash move, MVV-LVA,
+    killers, history), so later stages are never generated after an early cutoff.
+
+    Iterations search an aspiration window around the previous iteration's score, re-searching
+    with a wider window if the score falls outside of it. Within an iteration the first move of
+    every node is searched with the full window and the others with a null window (principal
+    variation search), re-searching the ones that turn out to beat alpha.
+
+    Away from the root the search is selective. Null move pruning lets the opponent move twice
+    and cuts the node if a reduced search still fails high, except in check or with only king
+    and pawns left (zugzwang). Late quiet moves are searched at a depth reduced by
+    LMR_REDUCTIONS and re-searched at full depth if they beat alpha. Near the leaves, futility
+    pruning skips quiet moves that cannot raise the static evaluation to alpha and reverse
+    futility pruning cuts nodes whose static evaluation is far above beta. Captures, promotions
+    and moves that give or evade check are never pruned or reduced.
+
+    Attributes:
+        scorer (Scorer): Evaluates leaf positions from white's point of view
+        transposition_table (TranspositionTable): Optional table of previous search results
+        use_quiescence (bool): Resolve captures at the leaves instead of scoring them directly
+        delta_margin (int): Margin used for delta pruning in the quiescence search
+        move_orderer (MoveOrderer): Orders moves before they are searched, None to only search
+            the hash move first
+        use_see_pruning (bool): Skip losing captures in the quiescence search
+        use_null_move (bool): Use null move pruning
+        use_late_move_reductions (bool): Reduce the depth of late quiet moves
+        use_futility_pruning (bool): Skip futile quiet moves near the leaves
+        use_reverse_futility_pruning (bool): Cut nodes near the leaves that are far above beta
+        use_principal_variation_search (bool): Search moves after the first with a null window
+        use_aspiration_windows (bool): Start iterations with a window around the last score
+        aspiration_window (int): Initial half width of the aspiration window
+        nodes (int): Nodes searched in the current search, including quiescence nodes
+        quiescence_nodes (int): Quiescence nodes searched in the current search
+        iteration_nodes (List[int]): Nodes searched by every completed iteration
+        cutoffs (int): Beta cutoffs in the main search
+        first_move_cutoffs (int): Beta cutoffs caused by the first move searched
+        pvs_researches (int): Null window searches that had to be repeated with the full window
+        iteration_researches (List[Dict[str, int]]): Aspiration fail lows, fail highs and
+            principal variation re-searches of every completed iteration
+        selectivity_stats (Dict[str, int]): How often every selectivity technique was tried
+            and succeeded in the current search (see SELECTIVITY_STATS)
+    """
+
+    def __init__(
+        self,
+        scorer: Scorer,
+        transposition_table: Optional[TranspositionTable] = None,
+        use_quiescence: bool = True,
+        delta_margin: int = DELTA_MARGIN,
+        use_move_ordering: bool = True,
+        use_see_pruning: bool = True,
+        use_null_move: bool = True,
+        use_late_move_reductions: bool = True,
+        use_futility_pruning: bool = True,
+        use_reverse_futility_pruning: bool = True,
+        use_principal_variation_search: bool = True,
+        use_aspiration_windows: bool = True,
+        aspiration_window: int = ASPIRATION_WINDOW,
+    ) -> None:
+        """
+        Constructor for the Searcher class
+
+        Args:
+            scorer (Scorer): Leaf evaluator, scores are rounded to integers
+            transposition_table (TranspositionTable): Table to reuse results from, if any
+            use_quiescence (bool): Resolve captures at the leaves with a quiescence search
+            delta_margin (int): Margin used for delta pruning in the quiescence search
+            use_move_ordering (bool): Order moves with a MoveOrderer, otherwise moves are
+                searched in generation order after the hash move
+            use_see_pruning (bool): Skip captures that lose material by static exchange
+                evaluation in the quiescence search
+            use_null_move (bool): Use null move pruning
+            use_late_move_reductions (bool): Reduce the depth of late quiet moves
+            use_futility_pruning (bool): Skip futile quiet moves near the leaves
+            use_reverse_futility_pruning (bool): Cut nodes near the leaves whose static
+                evaluation is far above beta
+            use_principal_variation_search (bool): Search moves after the first with a null
+                window, and with the full window only if they beat alpha
+            use_aspiration_windows (bool): Search iterations from ASPIRATION_MIN_DEPTH on with
+                a window around the previous iteration's score first
+            aspiration_window (int): Initial half width of the aspiration window
+        """
+        self.scorer = scorer
+        self.transposition_table = transposition_table
+        self.use_quiescence = use_quiescence
+        self.delta_margin = delta_margin
+        self.move_orderer = MoveOrderer(MAX_PLY) if use_move_ordering else None
+        self.use_see_pruning = use_see_pruning
+        self.use_null_move = use_null_move
+        self.use_late_move_reductions = use_late_move_reductions
+        self.use_futility_pruning = use_futility_pruning
+        self.use_reverse_futility_pruning = use_reverse_futility_pruning
+        self.use_principal_variation_search = use_principal_variation_search
+        self.use_aspiration_windows = use_aspiration_windows
+        self.aspiration_window = aspiration_window
+
+        self.nodes = 0
+        self.quiescence_nodes = 0
+        self.iteration_nodes = []
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.pvs_researches = 0
+        self.iteration_researches = []
+        self.selectivity_stats = dict.fromkeys(SELECTIVITY_STATS, 0)
+        self._node_limit = None
+        self._deadline = None
+        self._stopped = False
+
+        # Triangular principal variation table of packed moves, row n holds the PV found at
+        # ply n
+        self._pv_table = [[0] * MAX_PLY for _ in range(MAX_PLY)]
+        self._pv_length = [0] * MAX_PLY
+
+        # Move lists are generated into one reused buffer per ply, the staged move picker keeps
+        # quiet moves in a second one
+        self._move_buffers = allocate_move_buffers(MAX_PLY)
+        self._quiet_buffers = allocate_move_buffers(MAX_PLY)
+
+    def search(
+        self,
+        board: Board,
+        max_depth: int = MAX_PLY - 1,
+        max_nodes: Optional[int] = None,
+        max_time: Optional[float] = None,
+    ) -> SearchResult:
+        """
+        Searches the position with iterative deepening. The board is returned to its original
+        state afterwards.
+
+        Args:
+            board (Board): Position to search
+            max_depth (int): Maximum depth in plies
+            max_nodes (int): Hard limit on the number of nodes searched, if any
+            max_time (float): Hard limit on the search time in seconds, if any
+
+        Returns:
+            result (SearchResult): Best move, score, depth reached, nodes and principal variation
+        """
+        start_time = time.perf_counter()
+
+        self.nodes = 0
+        self.quiescence_nodes = 0
+        self.iteration_nodes = []
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.pvs_researches = 0
+        self.iteration_researches = []
+        self.selectivity_stats = dict.fromkeys(SELECTIVITY_STATS, 0)
+        self._node_limit = max_nodes
+        self._deadline = start_time + max_time if max_time is not None else None
+        self._stopped = False
+
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+
+        best_move = None
+        best_score = 0
+        depth_reached = 0
+        pv = []
+
+        for depth in range(1, min(max_depth, MAX_PLY - 1) + 1):
+            iteration_start_nodes = self.nodes
+            iteration_start_researches = self.pvs_researches
+            fail_lows = fail_highs = 0
+
+            window = self.aspiration_window
+
+            if self.use_aspiration_windows and depth >= ASPIRATION_MIN_DEPTH and \
+                    abs(best_score) < MATE_THRESHOLD:
+                alpha, beta = best_score - window, best_score + window
+            else:
+                alpha, beta = -INFINITY, INFINITY
+
+            while True:
+                score = self._negamax(board, depth, alpha, beta, 0, pv)
+
+                if self._stopped or alpha < score < beta:
+                    break
+
+                # Widen the side the score fell out of
+                window *= ASPIRATION_GROWTH
+
+                if score <= alpha:
+                    fail_lows += 1
+                    alpha = score - window if window <= ASPIRATION_MAX_WINDOW else -INFINITY
+                else:
+                    fail_highs += 1
+                    beta = score + window if window <= ASPIRATION_MAX_WINDOW else INFINITY
+
+            if self._stopped:
+                break
+
+            self.iteration_nodes.append(self.nodes - iteration_start_nodes)
+            self.iteration_researches.append({
+                "aspiration_fail_lows": fail_lows,
+                "aspiration_fail_highs": fail_highs,
+                "pvs_researches": self.pvs_researches - iteration_start_researches,
+            })
+
+            pv = self._pv_table[0][:self._pv_length[0]]
+            best_move = pv[0] if pv else None
+            best_score = score
+            depth_reached = depth
+
+            # No legal moves, or a forced mate was found
+            if best_move is None or abs(score) >= MATE_THRESHOLD:
+                break
+
+        # Fall back to any legal move if not even the first iteration completed
+        if best_move is None and depth_reached == 0:
+            count = generate_legal_moves(board, self._move_buffers[0])
+            best_move = self._move_buffers[0][0] if count else None
+            pv = [best_move] if best_move else []
+
+        elapsed = time.perf_counter() - start_time
+
+        return SearchResult(
+            best_move=move_to_tuple(best_move) if best_move else None,
+            score=best_score,
+            depth=depth_reached,
+            nodes=self.nodes,
+            nps=self.nodes / elapsed if elapsed > 0 else 0.0,
+            pv=[move_to_tuple(move) for move in pv],
+        )
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns statistics of the last search that show how well moves were ordered
+
+        Returns:
+            stats (Dict): Nodes, nodes per completed iteration, effective branching factor (ratio
+                of the node counts of the last two iterations), beta cutoffs, the fraction of
+                them caused by the first move searched, re-searches per iteration and the
+                selectivity statistics
+        """
+        iteration_nodes = self.iteration_nodes
+
+        return {
+            "nodes": self.nodes,
+            "iteration_nodes": list(iteration_nodes),
+            "effective_branching_factor": iteration_nodes[-1] / iteration_nodes[-2]
+            if len(iteration_nodes) >= 2 and iteration_nodes[-2] else 0.0,
+            "cutoffs": self.cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoffs / self.cutoffs
+            if self.cutoffs else 0.0,
+            "pvs_researches": self.pvs_researches,
+            "iteration_researches": [dict(researches) for researches in self.iteration_researches],
+            **self.selectivity_stats,
+        }
+
+    def _check_limits(self) -> None:
+        """
+        Sets the stop flag once the node or time limit has been reached
+        """
+        if self._node_limit is not None and self.nodes >= self._node_limit:
+            self._stopped = True
+        if self._deadline is not None and self.nodes % CHECK_INTERVAL == 0 and \
+                time.perf_counter() >= self._deadline:
+            self._stopped = True
+
+    def _evaluate(
+        self,
+        board: Board,
+    ) -> int:
+        """
+        Scores a leaf from the point of view of the player to move
+        """
+        return int(round(self.scorer.get_score(board))) * board.board_state["to_move"]
+
+    def _is_draw(
+        self,
+        board: Board,
+    ) -> bool:
+        """
+        Checks for draws by the fifty move rule or by repetition since the last irreversible
+        move
+        """
+        fifty_move = board.board_state["fifty_move"]
+
+        if fifty_move >= 100:
+            return True
+
+        # Positions with the same player to move are two plies apart
+        current_hash = board.zobrist_hash
+        move_stack = board.move_stack
+
+        for i in range(2, min(fifty_move, len(move_stack)) + 1, 2):
+            if move_stack[-i].zobrist_hash == current_hash:
+                return True
+
+        return False
+
+    @staticmethod
+    def _has_pieces(
+        board: Board,
+    ) -> bool:
+        """
+        Checks whether the player to move has any pieces besides the king and pawns
+        """
+        positions = board.white_positions if board.board_state["to_move"] == 1 \
+            else board.black_positions
+
+        return bool(
+            positions["n"].bitboard | positions["b"].bitboard | positions["r"].bitboard
+            | positions["q"].bitboard
+        )
+
+    def _negamax(
+        self,
+        board: Board,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+        previous_pv: List[int],
+        allow_null_move: bool = True,
+    ) -> int:
+        """
+        Alpha-beta search of a position
+
+        Args:
+            board (Board): Position to search
+            depth (int): Remaining depth in plies
+            alpha (int): Lower bound of the search window
+            beta (int): Upper bound of the search window
+            ply (int): Distance from the root
+            previous_pv (List[int]): Principal variation of the previous iteration as packed
+                moves, searched first
+            allow_null_move (bool): False directly after a null move, two in a row would only
+                give the move back
+
+        Returns:
+            score (int): Score from the point of view of the player to move
+        """
+        if self._stopped:
+            return 0
+
+        if depth <= 0 and self.use_quiescence:
+            return self._quiescence(board, alpha, beta, ply)
+
+        self.nodes += 1
+        self._pv_length[ply] = ply
+        self._check_limits()
+
+        if ply > 0 and self._is_draw(board):
+            return 0
+
+        if depth <= 0 or ply >= MAX_PLY - 1:
+            return self._evaluate(board)
+
+        original_alpha = alpha
+        table_move = 0
+
+        if self.transposition_table is not None:
+            entry = self.transposition_table.probe(board.zobrist_hash)
+
+            if entry is not None:
+                entry_depth, entry_score, entry_bound, entry_move = entry
+                entry_score = self._score_from_table(entry_score, ply)
+                table_move = entry_move
+
+                if ply > 0 and entry_depth >= depth:
+                    if entry_bound == EXACT:
+                        return entry_score
+                    if entry_bound == LOWER_BOUND and entry_score >= beta:
+                        return entry_score
+                    if entry_bound == UPPER_BOUND and entry_score <= alpha:
+                        return entry_score
+
+        in_check = board.in_check()
+        stats = self.selectivity_stats
+
+        # The static evaluation drives the pruning decisions, it means nothing in check
+        static_eval = self._evaluate(board) if ply > 0 and not in_check else None
+
+        if static_eval is not None and abs(beta) < MATE_THRESHOLD:
+            # Reverse futility pruning: far enough above beta that no move will fall below it
+            if self.use_reverse_futility_pruning and depth < len(REVERSE_FUTILITY_MARGINS) and \
+                    static_eval - REVERSE_FUTILITY_MARGINS[depth] >= beta:
+                stats["reverse_futility_prunes"] += 1
+                return static_eval
+
+            # Null move pruning: if passing still fails high, a real move will too. Not with
+            # only king and pawns, where passing may be the best move (zugzwang).
+            if self.use_null_move and allow_null_move and depth >= NULL_MOVE_MIN_DEPTH and \
+                    static_eval >= beta and self._has_pieces(board):
+                reduction = NULL_MOVE_REDUCTION + (depth >= NULL_MOVE_DEEP_DEPTH)
+
+                board.make_null_move()
+                score = -self._negamax(
+                    board, depth - 1 - reduction, -beta, -beta + 1, ply + 1, [], False
+                )
+                board.unmake_null_move()
+
+                stats["null_move_searches"] += 1
+
+                if self._stopped:
+                    return 0
+
+                if score >= beta:
+                    stats["null_move_cutoffs"] += 1
+
+                    # Mates found after passing are not proven
+                    return beta if score >= MATE_THRESHOLD else score
+
+        # Futility pruning: quiet moves cannot raise the score to alpha
+        futility_score = None
+
+        if self.use_futility_pruning and static_eval is not None and \
+                depth < len(FUTILITY_MARGINS) and abs(alpha) < MATE_THRESHOLD and \
+                static_eval + FUTILITY_MARGINS[depth] <= alpha:
+            futility_score = static_eval + FUTILITY_MARGINS[depth]
+
+        reduce_late_moves = self.use_late_move_reductions and depth >= LMR_MIN_DEPTH
+
+        # Search the previous iteration's PV move first, then the table move
+        first_move = previous_pv[ply] if ply < len(previous_pv) else table_move
+
+        if self.move_orderer is not None:
+            moves = pick_moves(
+                board,
+                self.move_orderer,
+                ply,
+                first_move,
+                self._move_buffers[ply],
+                self._quiet_buffers[ply],
+            )
+        else:
+            moves = self._move_buffers[ply]
+            count = generate_legal_moves(board, moves)
+
+            for i in range(count):
+                if moves[i] == first_move:
+                    moves[i] = moves[0]
+                    moves[0] = first_move
+                    break
+
+            moves = moves[:count]
+
+        best_score = -INFINITY
+        best_move = 0
+
+        for i, move in enumerate(moves):
+            # Only follow the previous PV while still on it
+            on_pv = i == 0 and ply < len(previous_pv) and move == previous_pv[ply]
+            child_pv = previous_pv if on_pv else []
+
+            # Candidates for pruning and reductions: quiet moves after the first, not in check
+            late_quiet_move = i > 0 and not in_check and not move >> 12 & (CAPTURE | PROMOTION) \
+                and (futility_score is not None or reduce_late_moves and i >= LMR_MIN_MOVE_NUMBER)
+
+            board.make_move(move)
+
+            # Moves that give check are neither pruned nor reduced
+            if late_quiet_move and board.in_check():
+                late_quiet_move = False
+
+            if late_quiet_move and futility_score is not None:
+                board.unmake_move()
+                stats["futility_prunes"] += 1
+                best_score = max(best_score, futility_score)
+                continue
+
+            reduction = min(LMR_REDUCTIONS[depth][i], depth - 2) if late_quiet_move else 0
+
+            full_search = True
+
+            if reduction > 0:
+                stats["late_move_reductions"] += 1
+
+                # Reduced null window search, only moves that beat alpha are searched properly
+                score = -self._negamax(
+                    board, depth - 1 - reduction, -alpha - 1, -alpha, ply + 1, child_pv
+                )
+                full_search = score > alpha
+
+                if full_search:
+                    stats["late_move_researches"] += 1
+
+            # Principal variation search: later moves are expected to be worse than the first,
+            # which a null window search proves more cheaply. Only moves that turn out to lie
+            # inside the window are searched again with the full window.
+            if full_search and i > 0 and self.use_principal_variation_search and \
+                    beta - alpha > 1:
+                score = -self._negamax(board, depth - 1, -alpha - 1, -alpha, ply + 1, child_pv)
+                full_search = alpha < score < beta
+
+                if full_search:
+                    self.pvs_researches += 1
+
+            if full_search:
+                score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1, child_pv)
+
+            board.unmake_move()
+
+            if self._stopped:
+                return 0
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+
+            if score > alpha:
+                alpha = score
+
+                # Update the principal variation with this move followed by the child's PV
+                self._pv_table[ply][ply] = move
+                child_length = self._pv_length[ply + 1]
+                self._pv_table[ply][ply + 1:child_length] = \
+                    self._pv_table[ply + 1][ply + 1:child_length]
+                self._pv_length[ply] = max(child_length, ply + 1)
+
+            if alpha >= beta:
+                self.cutoffs += 1
+
+                if i == 0:
+                    self.first_move_cutoffs += 1
+
+                # Captures and promotions are already ordered first
+                if self.move_orderer is not None and not move >> 12 & (CAPTURE | PROMOTION):
+                    self.move_orderer.update_quiet_cutoff(board, move, ply, depth)
+
+                break
+
+        # No legal moves
+        if best_score == -INFINITY:
+            return -MATE_SCORE + ply if board.in_check() else 0
+
+        if self.transposition_table is not None:
+            if best_score <= original_alpha:
+                bound = UPPER_BOUND
+            elif best_score >= beta:
+                bound = LOWER_BOUND
+            else:
+                bound = EXACT
+
+            self.transposition_table.store(
+                board.zobrist_hash,
+                depth,
+                self._score_to_table(best_score, ply),
+                bound,
+                best_move,
+            )
+
+        return best_score
+
+    def _quiescence(
+        self,
+        board: Board,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        """
+        Searches captures and promotions only until the position is quiet. The player to move
+        may always "stand pat" and keep the static evaluation instead of capturing.
+
+        Args:
+            board (Board): Position to search
+            alpha (int): Lower bound of the search window
+            beta (int): Upper bound of the search window
+            ply (int): Distance from the root
+
+        Returns:
+            score (int): Score from the point of view of the player to move
+        """
+        if self._stopped:
+            return 0
+
+        self.nodes += 1
+        self.quiescence_nodes += 1
+        self._pv_length[ply] = ply
+        self._check_limits()
+
+        stand_pat = self._evaluate(board)
+
+        if stand_pat >= beta or ply >= MAX_PLY - 1:
+            return stand_pat
+
+        alpha = max(alpha, stand_pat)
+
+        piece_values = self.scorer.piece_values
+        captures = []
+
+        moves = self._move_buffers[ply]
+        count = generate_legal_moves(board, moves, captures_only=True)
+
+        for i in range(count):
+            move = moves[i]
+            promotion_piece_type = get_promotion_piece_type(move)
+
+            if move >> 12 == EN_PASSANT:
+                captured_piece = "p"
+            else:
+                captured_piece = board.get_piece(*SQUARE_COORDS[move >> 6 & 0x3F]).lower()
+
+            gain = piece_values[captured_piece] if captured_piece != " " else 0
+
+            if promotion_piece_type is not None:
+                gain += piece_values[promotion_piece_type] - piece_values["p"]
+
+            # Delta pruning: skip captures that cannot raise the score to alpha
+            if stand_pat + gain + self.delta_margin <= alpha:
+                continue
+
+            # Captures that lose material in the exchange cannot raise the score either
+            if self.use_see_pruning and not see_ge(board, move):
+                continue
+
+            captures.append((gain, move))
+
+        # Most valuable gains first
+        captures.sort(key=lambda capture: capture[0], reverse=True)
+
+        best_score = stand_pat
+
+        for _, move in captures:
+            board.make_move(move)
+            score = -self._quiescence(board, -beta, -alpha, ply + 1)
+            board.unmake_move()
+
+            if self._stopped:
+                return 0
+
+            if score > best_score:
+                best_score = score
+
+            if score > alpha:
+                alpha = score
+
+            if alpha >= beta:
+                break
+
+        return best_score
+
+    @staticmethod
+    def _score_to_table(
+        score: int,
+        ply: int,
+    ) -> int:
+        """
+        Converts mate scores from distance to the root to distance to the current position
+        """
+        if score >= MATE_THRESHOLD:
+            return score + ply
+        if score <= -MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    @staticmethod
+    def _score_from_table(
+        score: int,
+        ply: int,
+    ) -> int:
+        """
+        Converts mate scores from distance to the stored position to distance to the root
+        """
+        if score >= MATE_THRESHOLD:
+            return score - ply
+        if score <= -MATE_THRESHOLD:
+            return score + ply
+        return score
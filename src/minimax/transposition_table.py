@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Optional, Tuple
+
+# Bound types, 0 marks an empty slot
+EXACT = 1
+LOWER_BOUND = 2  # Search failed high, score is at least this value
+UPPER_BOUND = 3  # Search failed low, score is at most this value
+
+# Bytes per entry: key (8), depth (1), score (4), bound (1), move (2), age (1)
+ENTRY_SIZE = 17
+
+
+class TranspositionTable:
+    """
+    Fixed size hash table of search results keyed by the board's Zobrist hash.
+
+    Entries live in preallocated flat arrays (one per field) so that memory use is fixed by the
+    megabyte budget. The table is split into buckets of two slots: the first slot keeps the
+    deepest result seen in the current search, the second is always replaced.
+
+    Attributes:
+        num_buckets (int): Number of two slot buckets
+        generation (int): Age of the current search, entries from older searches are replaced
+            first
+        keys, depths, scores, bounds, moves, ages (array): Entry fields, indexed by slot
+    """
+
+    def __init__(
+        self,
+        size_mb: float = 16,
+    ) -> None:
+        """
+        Constructor for the TranspositionTable class
+
+        Args:
+            size_mb (float): Memory budget for the table in megabytes
+        """
+        self.num_buckets = max(1, int(size_mb * 1024 * 1024) // (2 * ENTRY_SIZE))
+        num_slots = 2 * self.num_buckets
+
+        self.keys = array("Q", bytes(8 * num_slots))
+        self.depths = array("b", bytes(num_slots))
+        self.scores = array("i", bytes(4 * num_slots))
+        self.bounds = array("B", bytes(num_slots))
+        self.moves = array("H", bytes(2 * num_slots))
+        self.ages = array("B", bytes(num_slots))
+
+        self.generation = 0
+
+        self.probes = 0
+        self.hits = 0
+        self.collisions = 0
+        self.filled = 0
+
+    def new_search(self) -> None:
+        """
+        Ages the table between searches so that entries from previous searches are preferred
+        for replacement
+        """
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self) -> None:
+        """
+        Empties the table and resets its statistics
+        """
+        num_slots = 2 * self.num_buckets
+
+        self.bounds = array("B", bytes(num_slots))
+        self.generation = 0
+
+        self.probes = 0
+        self.hits = 0
+        self.collisions = 0
+        self.filled = 0
+
+    def probe(
+        self,
+        key: int,
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Looks up a position in the table
+
+        Args:
+            key (int): Zobrist hash of the position
+
+        Returns:
+            entry (Tuple): (depth, score, bound, move) if the position is stored, None otherwise
+        """
+        self.probes += 1
+
+        slot = 2 * (key % self.num_buckets)
+        occupied = False
+
+        for index in (slot, slot + 1):
+            if self.bounds[index]:
+                if self.keys[index] == key:
+                    self.hits += 1
+                    self.ages[index] = self.generation
+
+                    return (
+                        self.depths[index],
+                        self.scores[index],
+                        self.bounds[index],
+                        self.moves[index],
+                    )
+
+                occupied = True
+
+        # Bucket is in use by other positions
+        if occupied:
+            self.collisions += 1
+
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: int,
+        bound: int,
+        move: int = 0,
+    ) -> None:
+        """
+        Stores a search result. The depth-preferred slot is replaced if it holds the same
+        position, a result from an older search, or a shallower result. Otherwise the result
+        goes in the always-replace slot.
+
+        Args:
+            key (int): Zobrist hash of the position
+            depth (int): Remaining search depth of the result
+            score (int): Score of the position
+            bound (int): EXACT, LOWER_BOUND or UPPER_BOUND
+            move (int): Best move as a packed move (see chess_board.moves), 0 if unknown
+        """
+        slot = 2 * (key % self.num_buckets)
+
+        if not self.bounds[slot] or self.keys[slot] == key or \
+                self.ages[slot] != self.generation or depth >= self.depths[slot]:
+            index = slot
+        else:
+            index = slot + 1
+
+        # Keep the previous best move if the new result does not have one
+        if move == 0 and self.bounds[index] and self.keys[index] == key:
+            move = self.moves[index]
+
+        if not self.bounds[index]:
+            self.filled += 1
+
+        self.keys[index] = key
+        self.depths[index] = max(-128, min(127, depth))
+        self.scores[index] = score
+        self.bounds[index] = bound
+        self.moves[index] = move
+        self.ages[index] = self.generation
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns usage statistics of the table
+
+        Returns:
+            stats (Dict): Probe and hit counts, hit rate and collision rate (as a fraction of
+                probes) and fill ratio (as a fraction of all slots)
+        """
+        return {
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.probes if self.probes else 0.0,
+            "collisions": self.collisions,
+            "collision_rate": self.collisions / self.probes if self.probes else 0.0,
+            "fill_ratio": self.filled / (2 * self.num_buckets),
+        }
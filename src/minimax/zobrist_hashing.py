@@ -1,43 +1,79 @@
+"""
+Script to generate the Zobrist hash keys used by the Board class. Run from the repository root
+with `python -m src.minimax.zobrist_hashing`. The keys are written to resources/hash_keys.py as
+module level tuples so that importing them needs no file I/O or parsing.
+"""
+
+import os
 import random
-import json
 
-def generate_hash_keys():
-    position_map = {}
+from typing import Dict, Tuple
+
+SEED = 20231214
+
+NUM_PIECE_TYPES = 12  # White P, N, B, R, Q, K followed by black p, n, b, r, q, k
+NUM_SQUARES = 64
+NUM_CASTLING_RIGHTS = 4  # K, Q, k, q
+NUM_FILES = 8
+
+HASH_KEYS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "resources", "hash_keys.py")
+
 
-    for i in range(8):
-        for j in range(8):
-            coordinate_map = {}
+def generate_hash_keys(seed: int = SEED) -> Dict[str, Tuple[int, ...]]:
+    """
+    Generates a reproducible set of unique, non-zero 64-bit Zobrist keys
 
-            for piece in ["p", "n", "b", "r", "q", "k"]:
-                coordinate_map[piece] = random.randint(1, 2**64)
+    Args:
+        seed (int): Seed for the random number generator
 
-            position_map[f"{i}{j}"] = coordinate_map
+    Returns:
+        hash_keys (Dict): Key tuples for piece-squares, castling rights, en passant files and
+            the side to move
+    """
+    rng = random.Random(seed)
 
-    castling_map = {}
+    num_keys = NUM_PIECE_TYPES * NUM_SQUARES + NUM_CASTLING_RIGHTS + NUM_FILES + 1
+    keys = []
+    used = set()
 
-    for config in [
-        "-", "---q", "--k-", "--kq",
-        "-Q--", "-Q-q", "-Qk-", "-Qkq",
-        "K---", "K--q", "K-k-", "K-kq",
-        "KQ--", "KQ-q", "KQk-", "KQkq",
-    ]:
-        castling_map[config] = random.randint(1, 2**64)
+    while len(keys) < num_keys:
+        key = rng.getrandbits(64)
 
-    en_passant_map = {}
+        if key == 0 or key in used:
+            continue
 
-    for file in range(8):
-        en_passant_map[str(file)] = random.randint(1, 2**64)
+        used.add(key)
+        keys.append(key)
 
-    hash_map = {
-        "position": position_map,
-        "castling": castling_map,
-        "en_passant": en_passant_map,
-        "to_move": random.randint(1, 2**64),
+    piece_square_end = NUM_PIECE_TYPES * NUM_SQUARES
+    castling_end = piece_square_end + NUM_CASTLING_RIGHTS
+
+    return {
+        "PIECE_SQUARE_KEYS": tuple(keys[:piece_square_end]),
+        "CASTLING_KEYS": tuple(keys[piece_square_end:castling_end]),
+        "EN_PASSANT_KEYS": tuple(keys[castling_end:castling_end + NUM_FILES]),
+        "TO_MOVE_KEY": keys[-1],
     }
 
-    with open("/Users/hongzhiee/Desktop/Projects/chess_engine/resources/hash_keys.json", "w") as f:
-        json.dump(hash_map, f)
+
+def write_hash_keys():
+    hash_keys = generate_hash_keys()
+
+    with open(HASH_KEYS_PATH, "w") as f:
+        f.write('"""\nGenerated by src/minimax/zobrist_hashing.py, do not edit by hand\n\n')
+        f.write("PIECE_SQUARE_KEYS is indexed by piece_index * 64 + square, see\n")
+        f.write("resources/pieces.py for piece indices and bitboard.coord_to_square for squares.\n")
+        f.write("CASTLING_KEYS are ordered K, Q, k, q and EN_PASSANT_KEYS by file.\n")
+        f.write('"""\n')
+
+        for name in ["PIECE_SQUARE_KEYS", "CASTLING_KEYS", "EN_PASSANT_KEYS"]:
+            f.write(f"\n{name} = (\n")
+            for key in hash_keys[name]:
+                f.write(f"    {hex(key)},\n")
+            f.write(")\n")
+
+        f.write(f"\nTO_MOVE_KEY = {hex(hash_keys['TO_MOVE_KEY'])}\n")
 
 
 if __name__ == "__main__":
-    generate_hash_keys()
+    write_hash_keys()
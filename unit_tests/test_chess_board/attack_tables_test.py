@@ -0,0 +1,67 @@
+import unittest
+
+from src.chess_board.bitboard import BitBoard
+from src.chess_board.attack_tables import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS
+
+class TestAttackTables(unittest.TestCase):
+    def _get_expected(self, row, col, offsets):
+        """
+        Builds the expected attack bitboard the same way the move generators used to, by
+        range checking every candidate location
+        """
+        bitboard = BitBoard()
+
+        for row_offset, col_offset in offsets:
+            if 0 <= row + row_offset <= 7 and 0 <= col + col_offset <= 7:
+                bitboard.set(row + row_offset, col + col_offset)
+
+        return bitboard.bitboard
+
+    def test_knight_attacks(self):
+        offsets = [(2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (-1, 2), (1, -2), (-1, -2)]
+
+        for row in range(8):
+            for col in range(8):
+                self.assertEqual(
+                    KNIGHT_ATTACKS[63 - (8 * row + col)],
+                    self._get_expected(row, col, offsets),
+                )
+
+    def test_king_attacks(self):
+        offsets = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+        for row in range(8):
+            for col in range(8):
+                self.assertEqual(
+                    KING_ATTACKS[63 - (8 * row + col)],
+                    self._get_expected(row, col, offsets),
+                )
+
+    def test_pawn_attacks(self):
+        for row in range(8):
+            for col in range(8):
+                self.assertEqual(
+                    PAWN_ATTACKS[1][63 - (8 * row + col)],
+                    self._get_expected(row, col, [(-1, 1), (-1, -1)]),
+                )
+                self.assertEqual(
+                    PAWN_ATTACKS[-1][63 - (8 * row + col)],
+                    self._get_expected(row, col, [(1, 1), (1, -1)]),
+                )
+
+        # Corner checks against hand written bitboards
+        expected = int("".join([
+            "00000000",
+            "00000000",
+            "00000000",
+            "00000000",
+            "00000000",
+            "00000000",
+            "01000000",
+            "00000000",
+        ]), 2)
+        self.assertEqual(PAWN_ATTACKS[1][7], expected)  # White pawn on a1
+
+
+if __name__=="__main__":
+    unittest.main()
@@ -1,6 +1,14 @@
 import unittest
 
-from src.chess_board.bitboard import BitBoard
+from src.chess_board.bitboard import (
+    BitBoard,
+    coord_to_square,
+    square_to_coord,
+    pop_count,
+    get_lsb,
+    get_lsb_square,
+    iter_squares,
+)
 
 class TestBitBoard(unittest.TestCase):
     def setUp(self):
@@ -355,6 +363,93 @@ class TestBitBoard(unittest.TestCase):
         self.assertNotEqual(bitboard.bitboard, original_bitboard.bitboard)
         self.assertEqual(minus_bitboard.bitboard, original_minus_bitboard.bitboard)
 
+    def test_square_conversion(self):
+        self.assertEqual(coord_to_square(0, 0), 63)
+        self.assertEqual(coord_to_square(7, 7), 0)
+        self.assertEqual(coord_to_square(7, 0), 7)
+
+        for row in range(8):
+            for col in range(8):
+                square = coord_to_square(row, col)
+                self.assertEqual(square_to_coord(square), (row, col))
+
+                self.bitboard.bitboard = 1 << square
+                self.assertEqual(self.bitboard.is_occupied(row, col), 1)
+
+    def test_from_int(self):
+        bitboard = BitBoard.from_int(1 << coord_to_square(4, 4))
+
+        self.assertEqual(bitboard, BitBoard(coordinates=[(4, 4)]))
+
+        # Slots keep instances small and catch typos in attribute names
+        with self.assertRaises(AttributeError):
+            bitboard.bitbaord = 0
+
+    def test_inplace_operators(self):
+        a = BitBoard(coordinates=[(0, 0), (4, 4)])
+        b = BitBoard(coordinates=[(4, 4), (7, 7)])
+
+        for operation, expected in [
+            ("__ior__", [(0, 0), (4, 4), (7, 7)]),
+            ("__iand__", [(4, 4)]),
+            ("__ixor__", [(0, 0), (7, 7)]),
+            ("__iadd__", [(0, 0), (4, 4), (7, 7)]),
+            ("__isub__", [(0, 0)]),
+        ]:
+            bitboard = BitBoard(bitboard=a)
+            result = getattr(bitboard, operation)(b)
+
+            # In-place operators modify the left hand side instead of allocating a new BitBoard
+            self.assertIs(result, bitboard)
+            self.assertEqual(sorted(result.get_coordinates()), expected)
+
+        # Binary operators leave both operands untouched
+        self.assertEqual((a | b).get_coordinates(), [(0, 0), (4, 4), (7, 7)])
+        self.assertEqual((a - b).get_coordinates(), [(0, 0)])
+        self.assertEqual(a.get_coordinates(), [(0, 0), (4, 4)])
+
+    def test_invert(self):
+        bitboard = BitBoard(coordinates=[(0, 0)])
+        inverted = ~bitboard
+
+        self.assertEqual(bitboard.get_coordinates(), [(0, 0)])
+        self.assertEqual(inverted.count(), 63)
+        self.assertEqual(inverted.bitboard, (1 << 63) - 1)
+
+    def test_mask_methods(self):
+        start_mask = 1 << coord_to_square(6, 4)
+        end_mask = 1 << coord_to_square(4, 4)
+
+        self.bitboard.set_mask(start_mask)
+        self.bitboard.toggle_mask(start_mask | end_mask)
+        self.assertEqual(self.bitboard.get_coordinates(), [(4, 4)])
+
+        self.bitboard.clear_mask(end_mask | start_mask)
+        self.assertEqual(self.bitboard.bitboard, 0)
+
+    def test_bit_scan(self):
+        bitboard = (1 << 63) | (1 << 17) | (1 << 4)
+
+        self.assertEqual(pop_count(bitboard), 3)
+        self.assertEqual(get_lsb(bitboard), 1 << 4)
+        self.assertEqual(get_lsb_square(bitboard), 4)
+        self.assertEqual(list(iter_squares(bitboard)), [4, 17, 63])
+
+        self.assertEqual(pop_count(0), 0)
+        self.assertEqual(get_lsb(0), 0)
+        self.assertEqual(get_lsb_square(0), -1)
+        self.assertEqual(list(iter_squares(0)), [])
+
+        self.bitboard.bitboard = bitboard
+        self.assertEqual(self.bitboard.count(), 3)
+        self.assertEqual(list(self.bitboard.squares()), [4, 17, 63])
+
+        # Coordinates stay in row-major order
+        self.assertEqual(
+            self.bitboard.get_coordinates(),
+            [square_to_coord(63), square_to_coord(17), square_to_coord(4)],
+        )
+
 
 if __name__=="__main__":
     unittest.main()
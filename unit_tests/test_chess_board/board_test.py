@@ -1,17 +1,22 @@
 import unittest
 
 from src.chess_board.board import Board
+from src.chess_board.bitboard import coord_to_square
+from src.chess_board.incremental_updates import compute_hash, update_mailbox
 from resources.FENs import (
     STARTING_FEN,
     FOURKNIGHTS_FEN,
     LONDON_FEN,
     CASTLING_FEN,
+    ENPASSANT_FEN,
     ILLEGAL_CASTLING_THROUGH_CHECK_1_FEN,
     ILLEGAL_CASTLING_THROUGH_CHECK_2_FEN,
     ILLEGAL_CASTLING_BLACK_IN_CHECK,
     ILLEGAL_CASTLING_WHITE_IN_CHECK,
     ILLEGAL_CASTLING_FUNKY,
     PROMOTION_FEN,
+    KIWIPETE_FEN,
+    PERFT_PROMOTION_FEN,
 )
 from resources.starting_position_string import STARTING_POSITION_STRING_OUTPUT
 
@@ -521,6 +526,42 @@ class TestBoard(unittest.TestCase):
             self.assertFalse(board.in_check())
             self.assertEqual(board.board_state["to_move"], 1)
 
+    def test_attacked_squares(self):
+        # Reverse lookups from every square agree with the forward attack map of each side
+        for fen in [STARTING_FEN, FOURKNIGHTS_FEN, LONDON_FEN, CASTLING_FEN, ENPASSANT_FEN,
+                    PROMOTION_FEN]:
+            board = Board(fen)
+
+            for color in [1, -1]:
+                attacks = board.attacked_squares(color)
+
+                with self.subTest(fen=fen, color=color):
+                    for square in range(64):
+                        self.assertEqual(
+                            board.is_square_attacked(square, color),
+                            bool(attacks & (1 << square)),
+                        )
+
+        # Pawns attack diagonally forward only, squares behind a blocker are not attacked
+        board = Board("4k3/8/8/3p4/8/8/8/R3K3 w - - 0 1")
+        self.assertTrue(board.is_square_attacked(coord_to_square(4, 2), -1))
+        self.assertTrue(board.is_square_attacked(coord_to_square(4, 4), -1))
+        self.assertFalse(board.is_square_attacked(coord_to_square(4, 3), -1))
+        self.assertTrue(board.is_square_attacked(coord_to_square(0, 0), 1))
+        self.assertFalse(board.is_square_attacked(coord_to_square(0, 5), 1))
+
+        # Checks given by a pawn and by an adjacent king, which cannot arise in a game but must
+        # still be seen by the lookup
+        self.assertTrue(Board("8/8/8/3k4/4P3/8/8/4K3 b - - 0 1").in_check())
+        self.assertTrue(Board("8/8/8/3k4/4K3/8/8/8 b - - 0 1").in_check())
+
+        # A side without a king is never in check and every pseudo-legal move is legal, even
+        # with a8 (the square a missing king's bit_length() - 1 wraps around to) attacked
+        board = Board("8/8/8/8/8/8/6pp/r6R w - - 0 1")
+        self.assertFalse(board.in_check())
+        self.assertTrue(board.check_move((7, 7), (6, 7)))
+        self.assertTrue(board.is_square_attacked(coord_to_square(7, 6), 1))
+
 # ============================== START TEST move() ==============================
     """
     The following are a set of high level tests for verifying the functionality of
@@ -1575,6 +1616,169 @@ class TestBoard(unittest.TestCase):
 
 # ============================== END TEST move() ==============================
 
+    # Test make_move() and unmake_move()
+    def test_make_unmake_move(self):
+        for fen in [
+            STARTING_FEN,
+            FOURKNIGHTS_FEN,
+            LONDON_FEN,
+            ENPASSANT_FEN,
+            CASTLING_FEN,
+            PROMOTION_FEN,
+        ]:
+            self.board = Board(fen)
+
+            expected_white = {k: v.bitboard for k, v in self.board.white_positions.items()}
+            expected_black = {k: v.bitboard for k, v in self.board.black_positions.items()}
+            expected_state = dict(self.board.board_state)
+
+            for move in self.board.get_legal_moves():
+                self.board.make_move(*move)
+                self.board.unmake_move()
+
+                for k, v in self.board.white_positions.items():
+                    self.assertEqual(v.bitboard, expected_white[k], f"{fen} {move}")
+                for k, v in self.board.black_positions.items():
+                    self.assertEqual(v.bitboard, expected_black[k], f"{fen} {move}")
+                self.assertEqual(self.board.board_state, expected_state, f"{fen} {move}")
+                self.assertEqual(len(self.board.move_stack), 0)
+
+    def test_occupancy_cache(self):
+        def assert_occupancy_matches():
+            white_occupancy = 0
+            black_occupancy = 0
+
+            for _, v in self.board.white_positions.items():
+                white_occupancy |= v.bitboard
+            for _, v in self.board.black_positions.items():
+                black_occupancy |= v.bitboard
+
+            self.assertEqual(self.board.white_occupancy, white_occupancy)
+            self.assertEqual(self.board.black_occupancy, black_occupancy)
+            self.assertEqual(self.board.all_occupancy, white_occupancy | black_occupancy)
+            self.assertEqual(self.board.get_color_bitboard(1).bitboard, white_occupancy)
+            self.assertEqual(self.board.get_color_bitboard(-1).bitboard, black_occupancy)
+
+        for fen in [LONDON_FEN, ENPASSANT_FEN, CASTLING_FEN, PROMOTION_FEN]:
+            self.board = Board(fen)
+            assert_occupancy_matches()
+
+            for move in self.board.get_legal_moves():
+                self.board.make_move(*move)
+                assert_occupancy_matches()
+
+                self.board.unmake_move()
+                assert_occupancy_matches()
+
+    def test_mailbox(self):
+        # Play every legal move two plies deep (captures, castling, en passant, promotions) and
+        # compare the incrementally updated mailbox and evaluation totals with a full rebuild
+        for fen in [KIWIPETE_FEN, PERFT_PROMOTION_FEN, ENPASSANT_FEN, CASTLING_FEN]:
+            board = Board(fen)
+            mailbox = bytearray(board.mailbox)
+            totals = (board.mg_score, board.eg_score, board.phase)
+
+            for move in board.get_legal_moves():
+                board.make_move(*move)
+
+                for reply in board.get_legal_moves():
+                    board.make_move(*reply)
+                    expected = bytearray(board.mailbox)
+                    expected_totals = (board.mg_score, board.eg_score, board.phase)
+                    update_mailbox(board)
+
+                    self.assertEqual(board.mailbox, expected, f"{fen} {move} {reply}")
+                    self.assertEqual(
+                        (board.mg_score, board.eg_score, board.phase),
+                        expected_totals,
+                        f"{fen} {move} {reply}",
+                    )
+
+                    board.unmake_move()
+
+                board.unmake_move()
+
+            self.assertEqual(board.mailbox, mailbox)
+            self.assertEqual((board.mg_score, board.eg_score, board.phase), totals)
+
+        self.assertEqual(self.board.get_piece(0, 4), "k")
+        self.assertEqual(self.board.get_piece(7, 3), "Q")
+        self.assertEqual(self.board.get_piece(4, 4), " ")
+
+    def test_incremental_hash(self):
+        for fen in [STARTING_FEN, LONDON_FEN, ENPASSANT_FEN, CASTLING_FEN, PROMOTION_FEN]:
+            self.board = Board(fen, debug_hash=True)
+            initial_hash = self.board.hash()
+
+            # debug_hash asserts against a full recompute on every make/unmake
+            for move in self.board.get_legal_moves():
+                self.board.make_move(*move)
+
+                for reply in self.board.get_legal_moves():
+                    self.board.make_move(*reply)
+                    self.board.unmake_move()
+
+                self.board.unmake_move()
+                self.assertEqual(self.board.hash(), initial_hash)
+
+    def test_hash_transposition(self):
+        other_board = Board()
+
+        self.board.move(start_coord=(7, 6), end_coord=(5, 5))
+        self.board.move(start_coord=(0, 6), end_coord=(2, 5))
+        self.board.move(start_coord=(7, 1), end_coord=(5, 2))
+
+        other_board.move(start_coord=(7, 1), end_coord=(5, 2))
+        other_board.move(start_coord=(0, 6), end_coord=(2, 5))
+        other_board.move(start_coord=(7, 6), end_coord=(5, 5))
+
+        self.assertEqual(self.board.hash(), other_board.hash())
+        self.assertEqual(self.board.hash(), compute_hash(self.board))
+        self.assertNotEqual(self.board.hash(), Board().hash())
+
+    def test_hash_piece_colors(self):
+        # The same piece type on the same square hashes differently for each color
+        white_pawn = Board("8/8/8/4P3/8/8/8/8 w - - 0 1")
+        black_pawn = Board("8/8/8/4p3/8/8/8/8 w - - 0 1")
+
+        self.assertNotEqual(white_pawn.hash(), black_pawn.hash())
+
+    def test_unmake_move_en_passant(self):
+        self.board = Board(ENPASSANT_FEN)
+
+        self.board.move(start_coord=(3, 4), end_coord=(2, 5))
+        self.assertEqual(self.board.black_positions["p"].is_occupied(3, 5), 0)
+
+        self.board.unmake_move()
+        self.assertEqual(self.board.black_positions["p"].is_occupied(3, 5), 1)
+        self.assertEqual(self.board.white_positions["p"].is_occupied(3, 4), 1)
+        self.assertEqual(self.board.white_positions["p"].is_occupied(2, 5), 0)
+        self.assertTrue(self.board.board_state["en_passant"].is_occupied(2, 5))
+
+    def test_unmake_move_empty_stack(self):
+        with self.assertRaises(ValueError):
+            self.board.unmake_move()
+
+    def test_null_move(self):
+        self.board = Board(ENPASSANT_FEN)
+        fen = self.board.get_fen()
+        initial_hash = self.board.hash()
+
+        # Passing hands the move over and gives up the en passant capture
+        self.board.make_null_move()
+        self.assertEqual(self.board.board_state["to_move"], -1)
+        self.assertEqual(self.board.board_state["en_passant"].bitboard, 0)
+        self.assertEqual(self.board.hash(), compute_hash(self.board))
+
+        self.board.unmake_null_move()
+        self.assertEqual(self.board.get_fen(), fen)
+        self.assertEqual(self.board.hash(), initial_hash)
+
+        # Real moves are not unmade as null moves
+        self.board.move(start_coord=(6, 0), end_coord=(5, 0))
+        with self.assertRaises(ValueError):
+            self.board.unmake_null_move()
+
     # Test get legal moves function
     def test_get_legal_moves(self):
         self.assertEqual(
@@ -1582,6 +1786,36 @@ class TestBoard(unittest.TestCase):
             20,
         )
 
+    def test_get_legal_moves_captures_only(self):
+        # Only captures and promotions should be generated
+        for fen in [LONDON_FEN, FOURKNIGHTS_FEN, ENPASSANT_FEN, PROMOTION_FEN]:
+            self.board = Board(fen)
+
+            expected = [
+                move for move in self.board.get_legal_moves()
+                if self.board.get_piece(*move[1]) != " " or move[2] is not None
+                or (self.board.get_piece(*move[0]).lower() == "p"
+                    and self.board.board_state["en_passant"].is_occupied(*move[1]))
+            ]
+
+            self.assertEqual(
+                sorted(self.board.get_legal_moves(captures_only=True)),
+                sorted(expected),
+            )
+
+    def test_get_fen(self):
+        for fen in [STARTING_FEN, FOURKNIGHTS_FEN, LONDON_FEN, CASTLING_FEN, ENPASSANT_FEN,
+                    PROMOTION_FEN]:
+            with self.subTest(fen=fen):
+                self.assertEqual(Board(fen).get_fen(), fen)
+
+        self.board.make_move((6, 4), (4, 4))
+        self.assertEqual(
+            self.board.get_fen(),
+            "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+        )
+        self.assertEqual(Board(self.board.get_fen()).hash(), self.board.hash())
+
     # Test board visualization
     def test_str_conversion(self):
         print(str(self.board))
@@ -0,0 +1,140 @@
+import unittest
+
+from src.chess_board.board import Board
+from src.chess_board import piece_handler
+from src.chess_board.legal_moves import get_legal_moves
+from src.chess_board.perft import PERFT_SUITE
+
+from resources import FENs
+
+class TestLegalMoves(unittest.TestCase):
+    def _get_filtered_moves(self, board):
+        """
+        Reference generator: every pseudo-legal move that does not leave the king in check
+        """
+        moves = []
+        friendly_pieces = board.white_positions if board.board_state["to_move"] == 1 \
+            else board.black_positions
+
+        for piece, piece_bitboard in friendly_pieces.items():
+            for coord in piece_bitboard.get_coordinates():
+                end_coords = piece_handler.get_moves(board, coord, piece).get_coordinates()
+
+                for end_coord in end_coords:
+                    if piece == "p" and end_coord[0] in (0, 7):
+                        moves += [(coord, end_coord, promotion) for promotion in "bnrq"]
+                    else:
+                        moves.append((coord, end_coord, None))
+
+        return [move for move in moves if board.check_move(*move)]
+
+    def test_matches_filtered_moves(self):
+        for name, fen, _ in PERFT_SUITE:
+            board = Board(fen)
+
+            # Compare in the root position and every position one move deep
+            for move in [None] + board.get_legal_moves():
+                if move is not None:
+                    board.make_move(*move)
+
+                with self.subTest(position=name, move=move):
+                    self.assertEqual(
+                        sorted(get_legal_moves(board)),
+                        sorted(self._get_filtered_moves(board)),
+                    )
+
+                if move is not None:
+                    board.unmake_move()
+
+    def test_pinned_pieces(self):
+        # The e2 knight is pinned by the e8 rook, the d2 bishop by the a5 queen
+        board = Board("4r1k1/8/8/q7/8/8/3BN3/4K3 w - - 0 1")
+        moves = get_legal_moves(board)
+
+        self.assertFalse([move for move in moves if move[0] == (6, 4)])
+        self.assertEqual(
+            sorted(move[1] for move in moves if move[0] == (6, 3)),
+            [(3, 0), (4, 1), (5, 2)],  # Along the pin ray, capturing the pinning queen
+        )
+
+    def test_single_check_evasions(self):
+        # The a4 rook checks along the fourth rank: the king steps aside, the c3 knight
+        # captures the rook and the f2 pawn cannot block
+        board = Board("4k3/8/8/8/r3K3/2N5/5P2/8 w - - 0 1")
+        moves = get_legal_moves(board)
+
+        self.assertIn(((5, 2), (4, 0), None), moves)
+        self.assertNotIn(((5, 2), (3, 1), None), moves)
+        self.assertFalse([move for move in moves if move[0] == (6, 5)])
+
+        # The king may not step back along the checking ray
+        self.assertNotIn(((4, 4), (4, 5), None), moves)
+
+        # Blocking the checking ray
+        board = Board("4k3/8/8/8/r5K1/8/3N4/8 w - - 0 1")
+        self.assertEqual(
+            sorted(move for move in get_legal_moves(board) if move[0] == (6, 3)),
+            [((6, 3), (4, 2), None), ((6, 3), (4, 4), None)],
+        )
+
+    def test_double_check(self):
+        # The e8 rook and the f3 knight both give check, only king moves are legal
+        board = Board("k3r3/8/8/8/8/5n2/2B5/4K3 w - - 0 1")
+        moves = get_legal_moves(board)
+
+        self.assertTrue(moves)
+        self.assertTrue(all(move[0] == (7, 4) for move in moves))
+
+    def test_en_passant_discovered_check(self):
+        # Capturing en passant would remove both pawns from the fifth rank and expose the king
+        board = Board("8/8/8/K2pP2r/8/8/8/7k w - d6 0 1")
+        self.assertNotIn(((3, 4), (2, 3), None), get_legal_moves(board))
+
+        board = Board("8/8/8/K2pP3/8/8/8/7k w - d6 0 1")
+        self.assertIn(((3, 4), (2, 3), None), get_legal_moves(board))
+
+    def test_castling(self):
+        board = Board("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+        moves = get_legal_moves(board)
+
+        self.assertIn(((7, 4), (7, 6), None), moves)
+        self.assertIn(((7, 4), (7, 2), None), moves)
+        self.assertEqual(
+            sorted(get_legal_moves(board, captures_only=True)),
+            [((7, 0), (0, 0), None), ((7, 7), (0, 7), None)],
+        )
+
+        # The f8 rook attacks f1, the queenside path is blocked by the b1 knight
+        board = Board("5rk1/8/8/8/8/8/8/RN2K2R w KQ-- - 0 1")
+        moves = get_legal_moves(board)
+
+        self.assertNotIn(((7, 4), (7, 6), None), moves)
+        self.assertNotIn(((7, 4), (7, 2), None), moves)
+
+    def test_no_king(self):
+        # Test positions without a king have no checks or pins, every piece moves freely
+        board = Board(FENs.SURROUND_QUEEN_OPPONENT)
+        self.assertEqual(
+            sorted(get_legal_moves(board)),
+            sorted(((3, 4), (3 + row, 4 + col), None)
+                   for row in (-1, 0, 1) for col in (-1, 0, 1) if row or col),
+        )
+
+        for fen in [FENs.SURROUND_GAP_ROOK_OPPONENT, FENs.SURROUND_GAP_BISHOP_OPPONENT]:
+            board = Board(fen)
+            moves = [
+                ((3, 4), end_coord, None)
+                for end_coord in piece_handler.get_moves(
+                    board, (3, 4), board.get_piece(3, 4).lower()
+                ).get_coordinates()
+            ]
+
+            with self.subTest(fen=fen):
+                self.assertTrue(moves)
+                self.assertEqual(
+                    sorted(move for move in get_legal_moves(board) if move[0] == (3, 4)),
+                    sorted(moves),
+                )
+
+if __name__ == "__main__":
+    unittest.main()
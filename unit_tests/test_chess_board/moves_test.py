@@ -0,0 +1,83 @@
+import unittest
+
+from resources import FENs
+from src.chess_board.board import Board
+from src.chess_board.bitboard import coord_to_square
+from src.chess_board.legal_moves import generate_legal_moves
+from src.chess_board.moves import (
+    QUIET,
+    DOUBLE_PAWN_PUSH,
+    KING_CASTLE,
+    QUEEN_CASTLE,
+    CAPTURE,
+    EN_PASSANT,
+    PROMOTION_FLAGS,
+    NO_MOVE,
+    MAX_MOVES,
+    pack_move,
+    get_promotion_piece_type,
+    move_to_tuple,
+    tuple_to_move,
+    allocate_move_buffers,
+)
+from src.chess_board.perft import PERFT_SUITE
+
+class TestMoves(unittest.TestCase):
+    def test_pack_move(self):
+        move = pack_move(coord_to_square(1, 0), coord_to_square(0, 1),
+                         PROMOTION_FLAGS["q"] | CAPTURE)
+
+        self.assertLess(move, 1 << 16)
+        self.assertEqual(get_promotion_piece_type(move), "q")
+        self.assertEqual(move_to_tuple(move), ((1, 0), (0, 1), "q"))
+
+        # Only promotion flags unpack to a promotion piece
+        for flags in [QUIET, DOUBLE_PAWN_PUSH, KING_CASTLE, QUEEN_CASTLE, CAPTURE, EN_PASSANT]:
+            self.assertEqual(move_to_tuple(pack_move(0, 9, flags)), ((7, 7), (6, 6), None))
+        for piece, flags in PROMOTION_FLAGS.items():
+            self.assertEqual(move_to_tuple(pack_move(54, 63, flags)), ((1, 1), (0, 0), piece))
+
+        # 0 packs a move from a square to itself, which is never legal
+        self.assertEqual(NO_MOVE, pack_move(0, 0))
+
+    def test_tuple_to_move(self):
+        # Flags worked out from the position agree with the ones the generator writes
+        buffer = allocate_move_buffers(1)[0]
+        self.assertEqual(len(buffer), MAX_MOVES)
+
+        for name, fen, _ in PERFT_SUITE + [("en passant", FENs.ENPASSANT_FEN, None)]:
+            board = Board(fen)
+            count = generate_legal_moves(board, buffer)
+
+            with self.subTest(position=name):
+                for i in range(count):
+                    self.assertEqual(tuple_to_move(board, move_to_tuple(buffer[i])), buffer[i])
+
+        board = Board(FENs.CASTLING_FEN)
+        self.assertEqual(tuple_to_move(board, ((7, 4), (7, 6), None)),
+                         pack_move(coord_to_square(7, 4), coord_to_square(7, 6), KING_CASTLE))
+        self.assertEqual(tuple_to_move(board, ((7, 4), (7, 2), None)),
+                         pack_move(coord_to_square(7, 4), coord_to_square(7, 2), QUEEN_CASTLE))
+
+    def test_board_packed_moves(self):
+        board = Board()
+        tuple_board = Board()
+
+        for move in [((6, 4), (4, 4), None), ((1, 3), (3, 3), None), ((4, 4), (3, 3), None)]:
+            packed_move = tuple_to_move(board, move)
+
+            board.move(packed_move)
+            tuple_board.move(*move)
+
+            self.assertEqual(board.get_fen(), tuple_board.get_fen())
+            self.assertEqual(board.hash(), tuple_board.hash())
+
+        board.unmake_move()
+        board.make_move(tuple_to_move(board, ((4, 4), (3, 3), None)))
+        self.assertEqual(board.get_fen(), tuple_board.get_fen())
+
+        with self.assertRaises(ValueError):
+            board.move(pack_move(coord_to_square(7, 0), coord_to_square(4, 0)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,3 +39,16 @@ class TestParser(unittest.TestCase):
         self.assertEqual(
             parsers.alphanumeric_to_index(position_input), expected_output
         )
+
+    def test_index_to_alphanumeric(self):
+        self.assertEqual(parsers.index_to_alphanumeric((7, 0)), "a1")
+        self.assertEqual(parsers.index_to_alphanumeric((0, 7)), "h8")
+        self.assertEqual(parsers.index_to_alphanumeric((4, 4)), "e4")
+
+        for row in range(8):
+            for col in range(8):
+                position = parsers.index_to_alphanumeric((row, col))
+                self.assertEqual(parsers.alphanumeric_to_index(position), ((row, col), None))
+
+        with self.assertRaises(ValueError):
+            parsers.index_to_alphanumeric((8, 0))
@@ -0,0 +1,126 @@
+import io
+import unittest
+
+from contextlib import redirect_stdout
+
+from resources import FENs
+from src.chess_board.board import Board
+from src.chess_board.perft import (
+    perft,
+    divide,
+    parallel_divide,
+    parallel_perft,
+    run_scaling_benchmark,
+    PerftCache,
+    PERFT_SUITE,
+)
+
+# Keep the suite fast, deeper counts are checked by running the perft module directly
+MAX_TEST_NODES = 10000
+
+class TestPerft(unittest.TestCase):
+    def test_perft_suite(self):
+        for name, fen, expected_counts in PERFT_SUITE:
+            for depth, expected in expected_counts.items():
+                if expected > MAX_TEST_NODES:
+                    continue
+
+                with self.subTest(position=name, depth=depth):
+                    self.assertEqual(perft(Board(fen), depth), expected)
+
+    def test_perft_depth_zero(self):
+        self.assertEqual(perft(Board(FENs.STARTING_FEN), 0), 1)
+
+    def test_divide(self):
+        board = Board(FENs.KIWIPETE_FEN)
+        hash_before = board.hash()
+
+        counts = divide(board, 2)
+
+        self.assertEqual(len(counts), 48)
+        self.assertEqual(sum(counts.values()), 2039)
+        self.assertEqual(counts[((7, 4), (7, 6), None)], 43)  # e1g1 castling
+        self.assertEqual(board.hash(), hash_before)
+
+    def test_perft_cache(self):
+        # Transpositions first appear at depth 4, use a small position to keep it quick
+        board = Board("4k3/8/8/8/8/8/8/R3K3 w -Q-- - 0 1")
+        cache = PerftCache(size_mb=1)
+        expected = perft(board, 4)
+
+        self.assertEqual(perft(board, 4, cache), expected)
+
+        stats = cache.get_stats()
+        self.assertGreater(stats["hits"], 0)
+        self.assertGreater(stats["time_saved"], 0)
+
+        # Counting again is answered by the root entry
+        hits = stats["hits"]
+        self.assertEqual(perft(board, 4, cache), expected)
+        self.assertEqual(cache.get_stats()["hits"], hits + 1)
+
+        board = Board(FENs.KIWIPETE_FEN)
+        self.assertEqual(divide(board, 2, PerftCache(size_mb=1)), divide(board, 2))
+
+    def test_perft_cache_replacement(self):
+        # A table of a single bucket keeps replacing entries and must still count correctly
+        cache = PerftCache(size_mb=0)
+        self.assertEqual(cache.num_buckets, 1)
+        self.assertEqual(perft(Board(FENs.PERFT_ENPASSANT_FEN), 3, cache), 2812)
+        self.assertEqual(cache.get_stats()["fill_ratio"], 1.0)
+
+        cache.store(key=1, depth=3, nodes=100, elapsed=0.0)
+        cache.store(key=2, depth=2, nodes=50, elapsed=0.0)
+        cache.store(key=3, depth=1, nodes=10, elapsed=0.0)
+
+        self.assertEqual(cache.probe(1, 3), 100)  # Deepest entry is kept
+        self.assertIsNone(cache.probe(2, 2))
+        self.assertEqual(cache.probe(3, 1), 10)
+        self.assertIsNone(cache.probe(3, 2))  # Depth is part of the key
+
+    def test_parallel_divide(self):
+        board = Board(FENs.KIWIPETE_FEN)
+        expected = divide(board, 2)
+
+        for split_depth in [1, 2]:
+            with self.subTest(split_depth=split_depth):
+                self.assertEqual(
+                    parallel_divide(board, 2, workers=2, split_depth=split_depth, chunksize=4),
+                    expected,
+                )
+
+        self.assertEqual(parallel_perft(Board(FENs.PERFT_ENPASSANT_FEN), 3, workers=2), 2812)
+
+        with self.assertRaises(ValueError):
+            parallel_divide(board, 2, split_depth=3)
+
+    def test_scaling_benchmark(self):
+        suite = [("en passant", FENs.PERFT_ENPASSANT_FEN, {1: 14, 2: 191})]
+
+        with redirect_stdout(io.StringIO()):
+            timings = run_scaling_benchmark(2, [1, 2], suite)
+
+            self.assertEqual(list(timings), [1, 2])
+
+            # A wrong reference count fails the benchmark instead of timing a broken generator
+            with self.assertRaises(ValueError):
+                run_scaling_benchmark(1, [1], [("en passant", FENs.PERFT_ENPASSANT_FEN, {1: 15})])
+
+    def test_double_push_blocked(self):
+        board = Board(FENs.KIWIPETE_FEN)
+        legal_moves = board.get_legal_moves()
+
+        # c3 knight, f3 queen and h3 pawn block the double pushes behind them
+        for col in [2, 5, 7]:
+            self.assertNotIn(((6, col), (4, col), None), legal_moves)
+
+    def test_castling_through_pawn_attack(self):
+        # The e2 pawn attacks f1, which the king passes through when castling short
+        board = Board("4k3/8/8/8/8/8/4p3/4K2R w K--- - 0 1")
+        self.assertNotIn(((7, 4), (7, 6), None), board.get_legal_moves())
+
+        board = Board("4k3/8/8/8/8/8/8/4K2R w K--- - 0 1")
+        self.assertIn(((7, 4), (7, 6), None), board.get_legal_moves())
+
+if __name__ == "__main__":
+    unittest.main()
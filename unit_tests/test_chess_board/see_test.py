@@ -0,0 +1,69 @@
+import unittest
+
+from src.chess_board.board import Board
+from src.chess_board.legal_moves import generate_legal_moves
+from src.chess_board.moves import allocate_move_buffers, tuple_to_move
+from src.chess_board.perft import PERFT_SUITE
+from src.chess_board.see import see, see_ge
+
+class TestSee(unittest.TestCase):
+    def _see(self, fen, move):
+        board = Board(fen)
+        return see(board, tuple_to_move(board, move))
+
+    def test_exchanges(self):
+        cases = [
+            # Undefended pawn
+            ("4r1k1/8/8/4p3/8/8/4R3/4R1K1 w - - 0 1", ((6, 4), (3, 4), None), 100),
+            # Taking a pawn defended by a rook loses the rook, unless a second rook stands
+            # behind the first (x-ray)
+            ("4r1k1/8/8/4p3/8/8/4R3/6K1 w - - 0 1", ((6, 4), (3, 4), None), -400),
+            # The queen behind the bishop recaptures along the diagonal
+            ("6k1/8/3p4/4n3/8/8/1B6/Q5K1 w - - 0 1", ((6, 1), (3, 4), None), 100),
+            ("6k1/8/3p4/4n3/8/8/1B6/6K1 w - - 0 1", ((6, 1), (3, 4), None), 0),
+            # The king cannot recapture on a square the bishop defends
+            ("8/8/5k2/4p3/8/2B5/8/4R1K1 w - - 0 1", ((7, 4), (3, 4), None), 100),
+            ("8/8/5k2/4p3/8/8/8/4R1K1 w - - 0 1", ((7, 4), (3, 4), None), -400),
+            # En passant, the rook on d8 recaptures
+            ("3rk3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", ((3, 4), (2, 3), None), 0),
+            # A capturing promotion wins the rook and the difference between queen and pawn
+            ("r3k3/1P6/8/8/8/8/8/4K3 w - - 0 1", ((1, 1), (0, 0), "q"), 1300),
+            # Quiet moves are exchanges too: the knight is lost to the pawn
+            ("4k3/8/3p4/8/8/5N2/8/4K3 w - - 0 1", ((5, 5), (3, 4), None), -300),
+        ]
+
+        for fen, move, expected in cases:
+            with self.subTest(fen=fen):
+                self.assertEqual(self._see(fen, move), expected)
+
+    def test_see_ge(self):
+        buffer = allocate_move_buffers(1)[0]
+
+        for name, fen, _ in PERFT_SUITE:
+            board = Board(fen)
+
+            for move in [None] + board.get_legal_moves():
+                if move is not None:
+                    board.make_move(*move)
+
+                position_fen = board.get_fen()
+                mismatches = []
+
+                for i in range(generate_legal_moves(board, buffer)):
+                    score = see(board, buffer[i])
+
+                    for threshold in (-500, -100, -1, 0, 1, 100, 200, 500):
+                        if see_ge(board, buffer[i], threshold) != (score >= threshold):
+                            mismatches.append((buffer[i], threshold))
+
+                with self.subTest(position=name, move=move):
+                    self.assertEqual(mismatches, [])
+
+                    # Neither function touches the board
+                    self.assertEqual(board.get_fen(), position_fen)
+
+                if move is not None:
+                    board.unmake_move()
+
+if __name__ == "__main__":
+    unittest.main()
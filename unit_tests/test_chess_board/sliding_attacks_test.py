@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from src.chess_board.attack_tables import (
+    BISHOP_DIRECTIONS,
+    ROOK_DIRECTIONS,
+    get_ray_attacks,
+    get_relevant_occupancy_mask,
+)
+from src.chess_board.magic_generator import get_occupancy_subsets
+from src.chess_board.sliding_attacks import (
+    get_bishop_attacks,
+    get_rook_attacks,
+    get_queen_attacks,
+)
+
+class TestSlidingAttacks(unittest.TestCase):
+    def test_rook_attacks_exhaustive(self):
+        # Every relevant blocker configuration of every square
+        for square in range(64):
+            mask = get_relevant_occupancy_mask(square, ROOK_DIRECTIONS)
+
+            for occupancy in get_occupancy_subsets(mask):
+                self.assertEqual(
+                    get_rook_attacks(square, occupancy),
+                    get_ray_attacks(square, occupancy, ROOK_DIRECTIONS),
+                )
+
+    def test_bishop_attacks_exhaustive(self):
+        for square in range(64):
+            mask = get_relevant_occupancy_mask(square, BISHOP_DIRECTIONS)
+
+            for occupancy in get_occupancy_subsets(mask):
+                self.assertEqual(
+                    get_bishop_attacks(square, occupancy),
+                    get_ray_attacks(square, occupancy, BISHOP_DIRECTIONS),
+                )
+
+    def test_random_occupancies(self):
+        # Full board occupancies, including edge squares outside of the relevant masks
+        rng = random.Random(0)
+
+        for _ in range(200):
+            occupancy = rng.getrandbits(64) & rng.getrandbits(64)
+
+            for square in range(64):
+                rook_attacks = get_ray_attacks(square, occupancy, ROOK_DIRECTIONS)
+                bishop_attacks = get_ray_attacks(square, occupancy, BISHOP_DIRECTIONS)
+
+                self.assertEqual(get_rook_attacks(square, occupancy), rook_attacks)
+                self.assertEqual(get_bishop_attacks(square, occupancy), bishop_attacks)
+                self.assertEqual(
+                    get_queen_attacks(square, occupancy),
+                    rook_attacks | bishop_attacks,
+                )
+
+
+if __name__=="__main__":
+    unittest.main()
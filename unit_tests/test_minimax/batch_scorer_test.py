@@ -0,0 +1,128 @@
+import unittest
+
+from src.chess_board.board import Board
+from src.chess_board.perft import PERFT_SUITE
+from src.minimax import batch_scorer
+from src.minimax.Scorer import Scorer, TaperedScorer
+
+from resources.piece_square_tables import MG_PIECE_VALUES, MG_TABLES, TOTAL_PHASE
+
+from resources import FENs
+
+PIECE_VALUES = {"p": 100, "n": 300, "b": 300, "r": 500, "q": 900, "k": 0}
+
+# Rewards advancing pawns and centralising knights, deliberately asymmetric between the wings so
+# that a wrong mirroring shows up in the scores
+PIECE_SQUARE_TABLES = {
+    "p": [0] * 8 + [50] * 8 + [30, 20, 20, 30, 30, 20, 20, 10] + [20] * 8 + [10] * 8 +
+         [5, 0, 0, 5, 5, 0, 0, -5] + [0, 0, 0, -20, -20, 0, 0, 0] + [0] * 8,
+    "n": [abs(3.5 - row) * -10 + abs(3.5 - col) * -10 + (col == 1) * 7
+          for row in range(8) for col in range(8)],
+}
+
+class TestScorer(unittest.TestCase):
+    def test_piece_square_tables(self):
+        scorer = Scorer(PIECE_VALUES, PIECE_SQUARE_TABLES)
+
+        # Mirror image positions score zero
+        self.assertEqual(scorer.get_score(Board()), 0)
+
+        # e2e4 moves a pawn from 0 to 30 on the table
+        board = Board()
+        board.move((6, 4), (4, 4))
+        self.assertEqual(scorer.get_score(board), 30)
+
+        # Black's mirrored e7e5 evens it out
+        board.move((1, 4), (3, 4))
+        self.assertEqual(scorer.get_score(board), 0)
+
+        # Without tables only material is counted
+        self.assertEqual(Scorer(PIECE_VALUES).get_score(board), 0)
+
+        with self.assertRaises(ValueError):
+            Scorer(PIECE_VALUES, {"p": [0] * 63})
+
+    def test_tapered_scorer(self):
+        scorer = TaperedScorer()
+
+        board = Board()
+        self.assertEqual(board.phase, TOTAL_PHASE)
+        self.assertEqual(scorer.get_score(board), 0)
+
+        # In the middlegame the score is the middlegame total, e2e4 moves the pawn from -15
+        # to 17 on the middlegame pawn table
+        board.move((6, 4), (4, 4))
+        self.assertEqual(scorer.get_score(board), 32)
+
+        # With every piece on the board the tapered score is the plain score of the middlegame
+        # tables, both are built from the same mirrored tables
+        board = Board(FENs.KIWIPETE_FEN)
+        self.assertEqual(board.phase, TOTAL_PHASE)
+        self.assertEqual(scorer.get_score(board),
+                         Scorer(MG_PIECE_VALUES, MG_TABLES).get_score(board))
+
+        # Kings and pawns only is a pure endgame
+        board = Board("4k3/p7/8/8/8/8/8/4K3 w - - 0 1")
+        self.assertEqual(board.phase, 0)
+        self.assertEqual(scorer.get_score(board), board.eg_score)
+        self.assertLess(scorer.get_score(board), 0)
+
+
+@unittest.skipIf(batch_scorer.np is None, "NumPy is not installed")
+class TestBatchScorer(unittest.TestCase):
+    def setUp(self):
+        self.boards = [Board(fen) for _, fen, _ in PERFT_SUITE] + [
+            Board(FENs.ENPASSANT_FEN),
+            Board("4k3/8/8/8/8/8/8/4K3 w - - 0 1"),
+        ]
+
+        # Positions one move deep give a wider spread of scores
+        board = Board(FENs.KIWIPETE_FEN)
+        for move in board.get_legal_moves():
+            board.make_move(*move)
+            self.boards.append(Board(board.get_fen()))
+            board.unmake_move()
+
+    def test_pack_boards(self):
+        packed = batch_scorer.pack_boards(self.boards[:2])
+
+        self.assertEqual(packed.shape, (2, 12))
+        self.assertEqual(packed.dtype, batch_scorer.np.uint64)
+        self.assertEqual(int(packed[0, 0]), self.boards[0].white_positions["p"].bitboard)
+        self.assertEqual(int(packed[1, 11]), self.boards[1].black_positions["k"].bitboard)
+
+        self.assertEqual(batch_scorer.pack_boards([]).shape, (0, 12))
+
+    def test_matches_get_score(self):
+        for scorer in [
+            Scorer(PIECE_VALUES),
+            Scorer(PIECE_VALUES, PIECE_SQUARE_TABLES),
+            TaperedScorer(),
+        ]:
+            scores = batch_scorer.score_boards(scorer, self.boards)
+
+            self.assertEqual(scores.shape, (len(self.boards),))
+            self.assertEqual(
+                scores.tolist(),
+                [scorer.get_score(board) for board in self.boards],
+            )
+
+    def test_chunks(self):
+        scorer = Scorer(PIECE_VALUES, PIECE_SQUARE_TABLES)
+        packed = batch_scorer.pack_boards(self.boards)
+        expected = batch_scorer.get_batch_scores(scorer, packed)
+
+        chunk_size = batch_scorer.CHUNK_SIZE
+        batch_scorer.CHUNK_SIZE = 7
+
+        try:
+            self.assertEqual(batch_scorer.get_batch_scores(scorer, packed).tolist(),
+                             expected.tolist())
+        finally:
+            batch_scorer.CHUNK_SIZE = chunk_size
+
+        with self.assertRaises(ValueError):
+            batch_scorer.get_batch_scores(scorer, packed[:, :6])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+
+from src.chess_board.board import Board
+from src.chess_board.legal_moves import generate_legal_moves
+from src.chess_board.moves import allocate_move_buffers, move_to_tuple, tuple_to_move
+from src.minimax.move_ordering import MoveOrderer, KILLER_SCORES
+from src.minimax.Scorer import Scorer
+from src.minimax.searcher import Searcher
+
+from resources import FENs
+
+PIECE_VALUES = {"p": 100, "n": 300, "b": 300, "r": 500, "q": 900, "k": 0}
+
+class TestMoveOrdering(unittest.TestCase):
+    def setUp(self):
+        self.orderer = MoveOrderer(8)
+        self.buffer = allocate_move_buffers(1)[0]
+
+    def _get_ordered_moves(self, board):
+        count = generate_legal_moves(board, self.buffer)
+        scores = self.orderer.score_moves(board, self.buffer, count, 0)
+        ordered = sorted(range(count), key=scores.__getitem__, reverse=True)
+
+        return [move_to_tuple(self.buffer[i]) for i in ordered]
+
+    def test_captures(self):
+        # The d4 pawn and the e1 rook can both take the e5 queen, the least valuable attacker
+        # goes first
+        board = Board("4k3/8/8/p3q3/3P4/8/8/4R1K1 w - - 0 1")
+        moves = self._get_ordered_moves(board)
+
+        self.assertEqual(moves[:2], [
+            ((4, 3), (3, 4), None),
+            ((7, 4), (3, 4), None),
+        ])
+
+        # Most valuable victim first: taking the queen beats taking the rook
+        board = Board("4k3/8/8/3r1q2/4P3/8/8/4K3 w - - 0 1")
+        self.assertEqual(self._get_ordered_moves(board)[:2], [
+            ((4, 4), (3, 5), None),
+            ((4, 4), (3, 3), None),
+        ])
+
+    def test_killers_and_history(self):
+        board = Board()
+        e2e4 = tuple_to_move(board, ((6, 4), (4, 4), None))
+        g1f3 = tuple_to_move(board, ((7, 6), (5, 5), None))
+        d2d4 = tuple_to_move(board, ((6, 3), (4, 3), None))
+
+        self.orderer.update_quiet_cutoff(board, g1f3, 0, 2)
+        self.orderer.update_quiet_cutoff(board, e2e4, 0, 2)
+
+        # Most recent killer first, killers before moves with only a history score
+        self.assertEqual(self.orderer.killers[0], [e2e4, g1f3])
+
+        self.orderer.history[d2d4 & 0xFFF] = 100
+        moves = self._get_ordered_moves(board)
+
+        self.assertEqual(moves[:3], [
+            ((6, 4), (4, 4), None),
+            ((7, 6), (5, 5), None),
+            ((6, 3), (4, 3), None),
+        ])
+
+        # History is kept per colour, black's table is untouched
+        self.assertEqual(self.orderer.history[4096 + (d2d4 & 0xFFF)], 0)
+
+        scores = self.orderer.score_moves(board, [e2e4, g1f3], 2, 0)
+        self.assertEqual(scores, list(KILLER_SCORES))
+
+        # A new search forgets the killers and halves the history
+        self.orderer.new_search()
+        self.assertEqual(self.orderer.killers[0], [0, 0])
+        self.assertEqual(self.orderer.history[d2d4 & 0xFFF], 50)
+
+    def test_search_statistics(self):
+        board = Board(FENs.KIWIPETE_FEN)
+        results = []
+
+        for use_move_ordering in [False, True]:
+            # Plain alpha-beta: no pruning, reductions or null window searches, all of which
+            # can change the result depending on the move order
+            searcher = Searcher(
+                Scorer(PIECE_VALUES),
+                use_quiescence=False,
+                use_move_ordering=use_move_ordering,
+                use_null_move=False,
+                use_late_move_reductions=False,
+                use_futility_pruning=False,
+                use_reverse_futility_pruning=False,
+                use_principal_variation_search=False,
+                use_aspiration_windows=False,
+            )
+            result = searcher.search(board, max_depth=3)
+            stats = searcher.get_stats()
+
+            self.assertEqual(len(stats["iteration_nodes"]), 3)
+            self.assertEqual(sum(stats["iteration_nodes"]), result.nodes)
+            self.assertGreater(stats["effective_branching_factor"], 1)
+            self.assertTrue(0 < stats["first_move_cutoff_rate"] <= 1)
+
+            results.append((result.score, result.nodes, stats["first_move_cutoff_rate"]))
+
+        # Ordering does not change the result of a plain alpha-beta search, only its cost
+        (score, nodes, cutoff_rate), (ordered_score, ordered_nodes, ordered_cutoff_rate) = results
+
+        self.assertEqual(ordered_score, score)
+        self.assertLess(ordered_nodes, nodes)
+        self.assertGreater(ordered_cutoff_rate, cutoff_rate)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from src.chess_board.board import Board
+from src.chess_board.legal_moves import generate_legal_moves, is_legal_move
+from src.chess_board.moves import allocate_move_buffers, move_to_tuple, tuple_to_move
+from src.chess_board.perft import PERFT_SUITE
+from src.minimax.move_ordering import MoveOrderer
+from src.minimax.move_picker import pick_moves
+
+from resources import FENs
+
+class TestMovePicker(unittest.TestCase):
+    def setUp(self):
+        self.orderer = MoveOrderer(8)
+        self.capture_buffer, self.quiet_buffer, self.buffer = allocate_move_buffers(3)
+
+    def _pick_moves(self, board, hash_move=0):
+        return pick_moves(board, self.orderer, 0, hash_move, self.capture_buffer,
+                          self.quiet_buffer)
+
+    def test_matches_legal_moves(self):
+        # A move from another position, e.g. a stale killer or hash move
+        foreign_move = tuple_to_move(Board(), ((6, 4), (4, 4), None))
+
+        for name, fen, _ in PERFT_SUITE + [("en passant", FENs.ENPASSANT_FEN, None)]:
+            board = Board(fen)
+            count = generate_legal_moves(board, self.buffer)
+            legal_moves = sorted(self.buffer[:count])
+            quiet_moves = [move for move in legal_moves if not move >> 12 & 0xC]
+
+            # Killers are quiet moves, a capture in the killer slots must not be picked twice
+            for killer in [quiet_moves[-1], legal_moves[-1]]:
+                self.orderer.killers[0] = [killer, foreign_move]
+
+                for hash_move in [0, legal_moves[0], killer, foreign_move]:
+                    with self.subTest(position=name, killer=killer, hash_move=hash_move):
+                        self.assertEqual(sorted(self._pick_moves(board, hash_move)),
+                                         legal_moves)
+
+    def test_stages(self):
+        # Nxb5 wins a knight, Rxe5 gives up the rook for a pawn defended by d6
+        board = Board("4k3/8/3p4/1n2p3/8/2N5/8/4RK2 w - - 0 1")
+        hash_move = tuple_to_move(board, ((7, 5), (6, 5), None))
+        killer = tuple_to_move(board, ((7, 5), (7, 6), None))
+        self.orderer.killers[0] = [killer, 0]
+
+        moves = [move_to_tuple(move) for move in self._pick_moves(board, hash_move)]
+
+        self.assertEqual(moves[:3], [
+            ((7, 5), (6, 5), None),  # Hash move
+            ((5, 2), (3, 1), None),  # Good capture
+            ((7, 5), (7, 6), None),  # Killer
+        ])
+        self.assertEqual(moves[-1], ((7, 4), (3, 4), None))
+        self.assertEqual(len(moves), len(set(moves)))
+
+    def test_lazy_generation(self):
+        board = Board(FENs.KIWIPETE_FEN)
+        hash_move = tuple_to_move(board, ((5, 5), (2, 5), None))
+        self.assertTrue(is_legal_move(board, hash_move))
+
+        for buffer in (self.capture_buffer, self.quiet_buffer):
+            for i in range(len(buffer)):
+                buffer[i] = 0xFFFF
+
+        moves = self._pick_moves(board, hash_move)
+
+        # Nothing is generated before the hash move has been searched
+        self.assertEqual(next(moves), hash_move)
+        self.assertEqual(set(self.capture_buffer), {0xFFFF})
+
+        # Quiet moves are only generated once the captures run out
+        next(moves)
+        self.assertNotEqual(set(self.capture_buffer), {0xFFFF})
+        self.assertEqual(set(self.quiet_buffer), {0xFFFF})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+
+from src.chess_board.board import Board
+from src.minimax.Scorer import Scorer, TaperedScorer
+from src.minimax.searcher import Searcher, ASPIRATION_MIN_DEPTH, MATE_SCORE
+from src.minimax.transposition_table import TranspositionTable
+
+from resources import FENs
+
+PIECE_VALUES = {"p": 100, "n": 300, "b": 300, "r": 500, "q": 900, "k": 0}
+
+class TestSearcher(unittest.TestCase):
+    def setUp(self):
+        self.searcher = Searcher(Scorer(PIECE_VALUES))
+
+    def test_mate_in_one(self):
+        board = Board("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+        result = self.searcher.search(board, max_depth=3)
+
+        self.assertEqual(result.best_move, ((7, 0), (0, 0), None))
+        self.assertEqual(result.score, MATE_SCORE - 1)
+        self.assertEqual(result.pv, [((7, 0), (0, 0), None)])
+
+    def test_win_material(self):
+        # Black queen can be taken for free
+        board = Board("4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1")
+        result = self.searcher.search(board, max_depth=2)
+
+        self.assertEqual(result.best_move, ((7, 3), (3, 3), None))
+        self.assertEqual(result.score, 500)
+        self.assertEqual(result.depth, 2)
+        self.assertEqual(len(result.pv), 2)
+
+    def test_quiescence(self):
+        # Taking the knight on d5 loses the queen to the pawn on e6, which a one ply search
+        # without quiescence cannot see
+        board = Board("4k3/8/4p3/3n4/8/8/8/3QK3 w - - 0 1")
+
+        result = Searcher(Scorer(PIECE_VALUES), use_quiescence=False).search(board, max_depth=1)
+        self.assertEqual(result.best_move, ((7, 3), (3, 3), None))
+
+        result = self.searcher.search(board, max_depth=1)
+        self.assertNotEqual(result.best_move, ((7, 3), (3, 3), None))
+        self.assertGreater(self.searcher.quiescence_nodes, 0)
+
+    def test_stalemate(self):
+        board = Board("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+        result = self.searcher.search(board, max_depth=2)
+
+        self.assertIsNone(result.best_move)
+        self.assertEqual(result.score, 0)
+
+    def test_node_limit(self):
+        board = Board(FENs.LONDON_FEN)
+        result = self.searcher.search(board, max_depth=10, max_nodes=2000)
+
+        self.assertLessEqual(result.nodes, 2000)
+        self.assertIsNotNone(result.best_move)
+        self.assertIn(result.best_move, board.get_legal_moves())
+
+    def test_board_unchanged(self):
+        board = Board(FENs.FOURKNIGHTS_FEN)
+        expected_hash = board.hash()
+        expected_state = dict(board.board_state)
+
+        self.searcher.search(board, max_depth=2)
+
+        self.assertEqual(board.hash(), expected_hash)
+        self.assertEqual(board.board_state, expected_state)
+        self.assertEqual(len(board.move_stack), 0)
+
+    def test_transposition_table(self):
+        board = Board(FENs.FOURKNIGHTS_FEN)
+        table = TranspositionTable(size_mb=1)
+        searcher = Searcher(Scorer(PIECE_VALUES), table)
+
+        result = searcher.search(board, max_depth=2)
+        reference = self.searcher.search(board, max_depth=2)
+
+        self.assertEqual(result.score, reference.score)
+        self.assertGreater(table.get_stats()["hits"], 0)
+
+    def test_selectivity(self):
+        board = Board(FENs.FOURKNIGHTS_FEN)
+        toggles = [
+            ("use_null_move", ["null_move_searches", "null_move_cutoffs"]),
+            ("use_late_move_reductions", ["late_move_reductions", "late_move_researches"]),
+            ("use_futility_pruning", ["futility_prunes"]),
+            ("use_reverse_futility_pruning", ["reverse_futility_prunes"]),
+        ]
+
+        searcher = Searcher(Scorer(PIECE_VALUES), **{toggle: False for toggle, _ in toggles})
+        full_width_nodes = searcher.search(board, max_depth=4).nodes
+
+        searcher = Searcher(Scorer(PIECE_VALUES))
+        selective_nodes = searcher.search(board, max_depth=4).nodes
+        stats = searcher.get_stats()
+
+        self.assertLess(selective_nodes, full_width_nodes)
+
+        for toggle, keys in toggles:
+            self.assertGreater(stats[keys[0]], 0)
+
+            # Each technique can be switched off on its own
+            searcher = Searcher(Scorer(PIECE_VALUES), **{toggle: False})
+            searcher.search(board, max_depth=4)
+            stats_without = searcher.get_stats()
+
+            for key in keys:
+                with self.subTest(toggle=toggle, key=key):
+                    self.assertEqual(stats_without[key], 0)
+
+    def test_null_move_zugzwang(self):
+        # With only kings and pawns left no null move is tried
+        board = Board("8/5k2/8/4p3/4P3/8/5K2/8 w - - 0 1")
+        self.searcher.search(board, max_depth=6)
+
+        self.assertEqual(self.searcher.get_stats()["null_move_searches"], 0)
+
+    def test_aspiration_windows(self):
+        # Without pruning, windows and null window searches only change the cost of a search
+        full_width = {
+            "use_null_move": False,
+            "use_late_move_reductions": False,
+            "use_futility_pruning": False,
+            "use_reverse_futility_pruning": False,
+        }
+        board = Board()
+
+        reference = Searcher(
+            TaperedScorer(),
+            use_principal_variation_search=False,
+            use_aspiration_windows=False,
+            **full_width,
+        ).search(board, max_depth=4)
+
+        searcher = Searcher(TaperedScorer(), aspiration_window=1, **full_width)
+        result = searcher.search(board, max_depth=4)
+
+        self.assertEqual(result.score, reference.score)
+        self.assertEqual(result.best_move, reference.best_move)
+
+        # A one centipawn window around the previous score is missed on both sides
+        researches = searcher.get_stats()["iteration_researches"]
+        self.assertEqual(len(researches), 4)
+        self.assertGreater(sum(iteration["aspiration_fail_lows"] for iteration in researches), 0)
+        self.assertGreater(sum(iteration["aspiration_fail_highs"] for iteration in researches), 0)
+        self.assertEqual(
+            sum(iteration["pvs_researches"] for iteration in researches),
+            searcher.pvs_researches,
+        )
+
+        # The first iterations have no previous score to centre a window on
+        for iteration in researches[:ASPIRATION_MIN_DEPTH - 1]:
+            self.assertEqual(iteration["aspiration_fail_lows"], 0)
+            self.assertEqual(iteration["aspiration_fail_highs"], 0)
+
+if __name__=="__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from src.minimax.transposition_table import (
+    TranspositionTable,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    ENTRY_SIZE,
+)
+from src.chess_board.moves import pack_move, DOUBLE_PAWN_PUSH
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self):
+        self.table = TranspositionTable(size_mb=0.01)
+
+    def test_size(self):
+        self.assertEqual(self.table.num_buckets, int(0.01 * 1024 * 1024) // (2 * ENTRY_SIZE))
+        self.assertEqual(len(self.table.keys), 2 * self.table.num_buckets)
+
+    def test_store_probe(self):
+        move = pack_move(11, 27, DOUBLE_PAWN_PUSH)  # e2e4
+
+        self.assertIsNone(self.table.probe(12345))
+
+        self.table.store(12345, 4, -30, EXACT, move)
+        self.assertEqual(self.table.probe(12345), (4, -30, EXACT, move))
+
+        stats = self.table.get_stats()
+        self.assertEqual(stats["probes"], 2)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["fill_ratio"], 1 / (2 * self.table.num_buckets))
+
+    def test_replacement(self):
+        num_buckets = self.table.num_buckets
+        key_1 = 7
+        key_2 = 7 + num_buckets  # Same bucket as key_1
+        key_3 = 7 + 2 * num_buckets
+
+        # Deeper entry stays in the depth-preferred slot
+        self.table.store(key_1, 6, 10, EXACT)
+        self.table.store(key_2, 2, 20, LOWER_BOUND)
+        self.assertEqual(self.table.probe(key_1), (6, 10, EXACT, 0))
+        self.assertEqual(self.table.probe(key_2), (2, 20, LOWER_BOUND, 0))
+
+        # Shallow entries keep replacing the always-replace slot
+        self.table.store(key_3, 1, 30, UPPER_BOUND)
+        self.assertEqual(self.table.probe(key_1), (6, 10, EXACT, 0))
+        self.assertEqual(self.table.probe(key_3), (1, 30, UPPER_BOUND, 0))
+        self.assertIsNone(self.table.probe(key_2))
+        self.assertEqual(self.table.get_stats()["collisions"], 1)
+
+        # Entries from an older search lose the depth-preferred slot
+        self.table.new_search()
+        self.table.store(key_2, 1, 40, EXACT)
+        self.assertEqual(self.table.probe(key_2), (1, 40, EXACT, 0))
+        self.assertIsNone(self.table.probe(key_1))
+
+    def test_keep_best_move(self):
+        move = pack_move(1, 18)  # g1f3
+
+        self.table.store(99, 3, 0, EXACT, move)
+        self.table.store(99, 4, 5, UPPER_BOUND)
+        self.assertEqual(self.table.probe(99), (4, 5, UPPER_BOUND, move))
+
+    def test_clear(self):
+        self.table.store(99, 3, 0, EXACT)
+        self.table.clear()
+
+        self.assertIsNone(self.table.probe(99))
+        self.assertEqual(self.table.get_stats()["fill_ratio"], 0)
+
+
+if __name__=="__main__":
+    unittest.main()
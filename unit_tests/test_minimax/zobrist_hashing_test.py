@@ -1,24 +1,31 @@
 import unittest
-import json
+
+from resources import hash_keys
+from src.minimax.zobrist_hashing import generate_hash_keys
 
 class TestZobristHashes(unittest.TestCase):
     def setUp(self):
-        with open("/Users/hongzhiee/Desktop/Projects/chess_engine/resources/hash_keys.json") as f:
-            self.hash_key_mapping = json.load(f)
+        self.hash_keys = list(hash_keys.PIECE_SQUARE_KEYS)
+        self.hash_keys += hash_keys.CASTLING_KEYS
+        self.hash_keys += hash_keys.EN_PASSANT_KEYS
+        self.hash_keys.append(hash_keys.TO_MOVE_KEY)
 
     def test_duplicate_keys(self):
-        hash_keys = []
-
-        for _, square_dict in self.hash_key_mapping["position"].items():
-            for _, hash_key in square_dict.items():
-                hash_keys.append(hash_key)
+        self.assertTrue(len(set(self.hash_keys)) == len(self.hash_keys))
 
-        for _, hash_key in self.hash_key_mapping["castling"].items():
-            hash_keys.append(hash_key)
+    def test_key_counts(self):
+        self.assertEqual(len(hash_keys.PIECE_SQUARE_KEYS), 12 * 64)
+        self.assertEqual(len(hash_keys.CASTLING_KEYS), 4)
+        self.assertEqual(len(hash_keys.EN_PASSANT_KEYS), 8)
 
-        for _, hash_key in self.hash_key_mapping["en_passant"].items():
-            hash_keys.append(hash_key)
+    def test_key_range(self):
+        for hash_key in self.hash_keys:
+            self.assertTrue(0 < hash_key < 2**64)
 
-        hash_keys.append(self.hash_key_mapping["to_move"])
+    def test_reproducible(self):
+        generated_keys = generate_hash_keys()
 
-        self.assertTrue(len(set(hash_keys)) == len(hash_keys))
+        self.assertEqual(generated_keys["PIECE_SQUARE_KEYS"], hash_keys.PIECE_SQUARE_KEYS)
+        self.assertEqual(generated_keys["CASTLING_KEYS"], hash_keys.CASTLING_KEYS)
+        self.assertEqual(generated_keys["EN_PASSANT_KEYS"], hash_keys.EN_PASSANT_KEYS)
+        self.assertEqual(generated_keys["TO_MOVE_KEY"], hash_keys.TO_MOVE_KEY)